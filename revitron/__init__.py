@@ -95,6 +95,7 @@ Specific classes are located in the `submodules`_ listed below.
 import Autodesk.Revit.DB
 import pyrevit
 import os
+import numbers
 
 from revitron._utils import *
 from revitron.analyze import *
@@ -104,6 +105,8 @@ from revitron.excel import *
 from revitron.export import *
 from revitron.category import *
 from revitron.create import *
+from revitron.delete import *
+from revitron.dependency import *
 from revitron.document import *
 from revitron.externalreference import *
 from revitron.failure import *
@@ -137,20 +140,85 @@ REVIT_VERSION = pyrevit.HOST_APP.uiapp.Application.VersionNumber
 REVITRON_VERSION = '0.4.3'
 
 
+_wrappers = None
+_wrapperCache = dict()
+_wrapperCacheSize = 10000
+
+
+def _getWrapperClass(element):
+	"""
+	Returns the wrapper class for a Revit element based on the integer value of its category ID.
+
+	Args:
+		element (object): The Revit element
+
+	Returns:
+		class: The wrapper class
+	"""
+	global _wrappers
+	if _wrappers is None:
+		_wrappers = {
+		    int(DB.BuiltInCategory.OST_RvtLinks): LinkRvt,
+		    int(DB.BuiltInCategory.OST_Rooms): Room
+		}
+	if element is None:
+		return Element
+	category = element.Category
+	if category is None:
+		return Element
+	return _wrappers.get(category.Id.IntegerValue, Element)
+
+
+def _getWrapperCache(doc):
+	"""
+	Returns the cache of wrapper instances for a given document.
+
+	Args:
+		doc (object): A Revit document
+
+	Returns:
+		dict: The cache of wrappers by element ID integer value
+	"""
+	if doc not in _wrapperCache:
+		for key in list(_wrapperCache.keys()):
+			if not key.IsValidObject:
+				del _wrapperCache[key]
+		_wrapperCache[doc] = dict()
+	return _wrapperCache[doc]
+
+
 def _(element):
 	"""
 	Shorthand function to init a Revitron element instance based on a Revit element category.
 
+	Wrapper instances are cached per document and element ID. 
+	Calling the function multiple times for the same element therefore returns the same wrapper.
+
 	Args:
-		element (object): The Revit element
+		element (object): The Revit element, an element ID or the integer value of an element ID
 
 	Returns:
 		mixed: A Revitron element instance
 	"""
-	try:
-		category = Element(element).getParameter('Category').getValueString()
-		switcher = {'RVT Links': LinkRvt, 'Rooms': Room}
-		wrapper = switcher.get(category, Element)
-		return wrapper(element)
-	except:
-		return Element(element)
\ No newline at end of file
+	doc = DOC
+	if isinstance(element, DB.Element):
+		doc = element.Document
+		elementId = element.Id.IntegerValue
+	elif isinstance(element, DB.ElementId):
+		elementId = element.IntegerValue
+	elif isinstance(element, numbers.Integral) and not isinstance(element, bool):
+		elementId = element
+	else:
+		return Element(element)
+	cache = _getWrapperCache(doc)
+	wrapper = cache.get(elementId)
+	if wrapper is not None and wrapper._element.IsValidObject:
+		return wrapper
+	if not isinstance(element, DB.Element):
+		element = doc.GetElement(DB.ElementId(elementId))
+	wrapper = _getWrapperClass(element)(element)
+	if element is not None:
+		if len(cache) >= _wrapperCacheSize:
+			cache.clear()
+		cache[elementId] = wrapper
+	return wrapper
@@ -69,6 +69,9 @@ class Log:
 	def warning(self, message):
 		self.logger.warning(message)
 
+	def info(self, message):
+		self.logger.info(message)
+
 
 class String:
 
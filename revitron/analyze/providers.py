@@ -22,21 +22,31 @@ class AbstractDataProvider(object):
 		"""
 		self.config = config
 
-	def _filterElements(self):
+	def _filter(self):
 		"""
-		Filter elements in the target model by applying all filters that
+		Create a deferred filter for the target model by applying all filters that
 		are defined in the configuration.
 
 		Returns:
-			list: The list of filtered elements
+			object: The Revitron filter instance
 		"""
 		import revitron
 		filters = self.config.get('filters')
-		fltr = revitron.Filter()
+		fltr = revitron.Filter(deferred=True)
 		for f in filters:
 			evaluator = getattr(revitron.Filter, f.get('rule'))
 			fltr = evaluator(fltr, *f.get('args'))
-		return fltr.noTypes().getElements()
+		return fltr.noTypes()
+
+	def _filterElements(self):
+		"""
+		Filter elements in the target model by applying all filters that
+		are defined in the configuration.
+
+		Returns:
+			generator: The generator yielding the filtered elements
+		"""
+		return self._filter().iterElements()
 
 	@abstractmethod
 	def run(self):
@@ -81,7 +91,7 @@ class ElementCountProvider(AbstractDataProvider):
 		Returns:
 			integer: The number of filtered elements
 		"""
-		return len(self._filterElements())
+		return self._filter().count()
 
 	@property
 	def valueType(self):
@@ -227,6 +237,9 @@ class WarningCountProvider(AbstractDataProvider):
 			integer: The number of warnings
 		"""
 		import revitron
+		index = revitron.WarningsIndex.getShared()
+		if index is not None:
+			return index.count()
 		return len(revitron.DOC.GetWarnings())
 
 	@property
@@ -0,0 +1,151 @@
+""" 
+The ``delete`` submodule contains a helper for deleting large numbers of elements at once::
+
+	result = revitron.Delete(ids, chunkSize=5000)
+	print(result.deleted.Count, result.failed.Count, result.missing.Count, result.time)
+"""
+import time
+from System.Collections.Generic import List
+
+
+class Delete:
+	"""
+	Deletes a collection of elements in bulk. 
+	
+	Elements are deleted with a single call to ``Document.Delete()`` per chunk. 
+	In case deleting a chunk fails and failures are isolated, the chunk is split in halves recursively
+	until the elements that can't be deleted are found. All other elements of the chunk are deleted anyway.
+	Every chunk is committed in its own transaction. In case a chunk is rolled back on commit because 
+	of an error, the chunk is split and committed again in halves in case failures are isolated. 
+	Otherwise all elements of the rolled back chunk are marked as failed.
+
+	The IDs of all deleted elements, including dependent elements, are listed in ``deleted``.
+	Elements that can't be deleted are listed in ``failed`` and IDs of elements
+	that don't exist at all are listed in ``missing``.
+	"""
+
+	def __init__(self, ids, chunkSize=None, isolateFailures=True, doc=None):
+		"""
+		Inits a new Delete instance and deletes all given elements.
+
+		Args:
+			ids (mixed): A list of elements or element IDs or a collection of element IDs
+			chunkSize (integer, optional): The number of elements deleted per transaction. Defaults to all elements in one transaction.
+			isolateFailures (bool, optional): Isolate elements that can't be deleted by bisection. Defaults to True.
+			doc (object, optional): A Revit document. Defaults to the active document.
+		"""
+		import revitron
+		if doc is None:
+			doc = revitron.DOC
+		self.doc = doc
+		self.isolateFailures = isolateFailures
+		self.deleted = List[revitron.DB.ElementId]()
+		self.failed = List[revitron.DB.ElementId]()
+		self.missing = List[revitron.DB.ElementId]()
+		self.chunks = []
+		self._deleted = set()
+		started = time.time()
+		elementIds = []
+		for elementId in self._toElementIds(ids):
+			if self.doc.GetElement(elementId) is None:
+				self.missing.Add(elementId)
+			else:
+				elementIds.append(elementId)
+		if not chunkSize:
+			chunkSize = max(len(elementIds), 1)
+		for start in range(0, len(elementIds), chunkSize):
+			chunk = elementIds[start:start + chunkSize]
+			chunkStarted = time.time()
+			deletedCount = self.deleted.Count
+			failedCount = self.failed.Count
+			self._commit(chunk)
+			self.chunks.append(
+			    revitron.AttrDict(
+			        size=len(chunk),
+			        deleted=self.deleted.Count - deletedCount,
+			        failed=self.failed.Count - failedCount,
+			        time=time.time() - chunkStarted
+			    )
+			)
+		self.time = time.time() - started
+
+	def _toElementIds(self, ids):
+		"""
+		Converts a list of elements or element IDs into a list of unique element IDs.
+
+		Args:
+			ids (mixed): A list of elements or element IDs or a collection of element IDs
+
+		Returns:
+			list: The list of element IDs
+		"""
+		import revitron
+		elementIds = []
+		seen = set()
+		for item in ids:
+			if not isinstance(item, revitron.DB.ElementId):
+				item = item.Id
+			if item.IntegerValue not in seen:
+				seen.add(item.IntegerValue)
+				elementIds.append(item)
+		return elementIds
+
+	def _commit(self, chunk):
+		"""
+		Deletes a chunk of elements in its own transaction. In case the transaction is rolled back 
+		on commit, the chunk is either split and committed again in halves or marked as failed.
+
+		Args:
+			chunk (list): A list of element IDs
+		"""
+		import revitron
+		deletedCount = self.deleted.Count
+		failedCount = self.failed.Count
+		transaction = revitron.Transaction(self.doc, rollbackOnError=True)
+		self._delete(chunk)
+		if transaction.commit():
+			return
+		for elementId in list(self.deleted)[deletedCount:]:
+			self._deleted.discard(elementId.IntegerValue)
+		self.deleted.RemoveRange(deletedCount, self.deleted.Count - deletedCount)
+		self.failed.RemoveRange(failedCount, self.failed.Count - failedCount)
+		if self.isolateFailures and len(chunk) > 1:
+			middle = len(chunk) // 2
+			self._commit(chunk[:middle])
+			self._commit(chunk[middle:])
+			return
+		self.failed.AddRange(List[revitron.DB.ElementId](chunk))
+
+	def _delete(self, chunk):
+		"""
+		Deletes a chunk of elements in a subtransaction and bisects the chunk on failure.
+
+		Args:
+			chunk (list): A list of element IDs
+		"""
+		import revitron
+		chunk = [
+		    elementId for elementId in chunk
+		    if elementId.IntegerValue not in self._deleted
+		    and self.doc.GetElement(elementId) is not None
+		]
+		if not chunk:
+			return
+		sub = revitron.DB.SubTransaction(self.doc)
+		sub.Start()
+		try:
+			deleted = self.doc.Delete(List[revitron.DB.ElementId](chunk))
+			sub.Commit()
+		except:
+			sub.RollBack()
+			if not self.isolateFailures or len(chunk) == 1:
+				self.failed.AddRange(List[revitron.DB.ElementId](chunk))
+				return
+			middle = len(chunk) // 2
+			self._delete(chunk[:middle])
+			self._delete(chunk[middle:])
+			return
+		for elementId in deleted:
+			if elementId.IntegerValue not in self._deleted:
+				self._deleted.add(elementId.IntegerValue)
+				self.deleted.Add(elementId)
@@ -0,0 +1,582 @@
+""" 
+The ``dependency`` submodule contains helpers for resolving elements that depend on other elements,
+such as tags, dimensions or hosted elements.
+
+Dependent elements of many elements can be resolved at once as follows::
+
+	dependencies = revitron.Dependencies(rooms, revitron.DB.SpatialElementTag)
+	for room in rooms:
+	    tags = dependencies.get(room)
+
+For repeated queries on a whole model, the :class:`DependencyGraph` indexes the relationships
+of all elements of a document once::
+
+	graph = revitron.DependencyGraph.forDocument()
+	unusedTypeIds = graph.getUnusedTypes()
+"""
+from array import array
+from System.Collections.Generic import List
+
+
+class Dependencies:
+	"""
+	A map of parent elements to their dependent elements. 
+	
+	The ``GetDependentElements()`` method is used in case it is available in the running Revit API version.
+	Otherwise all parent elements are deleted one by one in subtransactions of a single transaction 
+	that is rolled back afterwards. The optional class filter is then applied to all deleted elements at once.
+	"""
+
+	def __init__(self, elements, filterClass=None):
+		"""
+		Inits a new Dependencies instance and resolves the dependent elements of all given elements.
+
+		Args:
+			elements (list): A list of Revit elements or element IDs
+			filterClass (class, optional): An optional class to filter the list of dependent elements by. Defaults to None.
+		"""
+		import revitron
+		self.doc = revitron.DOC
+		self.filterClass = filterClass
+		self.map = dict()
+		parents = []
+		for element in elements:
+			if isinstance(element, revitron.DB.ElementId):
+				element = self.doc.GetElement(element)
+			if element is not None:
+				parents.append(element)
+		if not parents:
+			return
+		if hasattr(parents[0], 'GetDependentElements'):
+			self._resolve(parents)
+		else:
+			self._resolveByDeletion(parents)
+
+	def _resolve(self, parents):
+		"""
+		Resolves the dependent elements using the ``GetDependentElements()`` method.
+
+		Args:
+			parents (list): The list of parent elements
+		"""
+		import revitron
+		fltr = None
+		if self.filterClass:
+			fltr = revitron.DB.ElementClassFilter(self.filterClass)
+		for parent in parents:
+			self.map[parent.Id.IntegerValue] = list(parent.GetDependentElements(fltr))
+
+	def _resolveByDeletion(self, parents):
+		"""
+		Resolves the dependent elements by deleting all parents in subtransactions of a 
+		single transaction that is rolled back afterwards.
+
+		Args:
+			parents (list): The list of parent elements
+		"""
+		import revitron
+		deleted = dict()
+		transaction = revitron.Transaction(self.doc)
+		try:
+			for parent in parents:
+				sub = revitron.DB.SubTransaction(self.doc)
+				sub.Start()
+				try:
+					deleted[parent.Id.IntegerValue] = list(self.doc.Delete(parent.Id))
+				except:
+					deleted[parent.Id.IntegerValue] = []
+				sub.RollBack()
+		finally:
+			transaction.rollback()
+		allIds = []
+		for ids in deleted.values():
+			allIds += ids
+		if not allIds:
+			self.map = deleted
+			return
+		with revitron.Document(self.doc):
+			fltr = revitron.Filter(List[revitron.DB.ElementId](allIds))
+			if self.filterClass:
+				fltr = fltr.byClass(self.filterClass)
+			allowed = set(
+			    [elementId.IntegerValue for elementId in fltr.noTypes().getElementIds()]
+			)
+		for parentId, ids in deleted.items():
+			self.map[parentId] = [
+			    elementId for elementId in ids if elementId.IntegerValue in allowed
+			]
+
+	def getIds(self, element):
+		"""
+		Returns the IDs of the dependent elements of a given parent element.
+
+		Args:
+			element (object): A Revit element or element ID
+
+		Returns:
+			list: The list of dependent element IDs
+		"""
+		import revitron
+		if not isinstance(element, revitron.DB.ElementId):
+			element = element.Id
+		return self.map.get(element.IntegerValue, [])
+
+	def get(self, element):
+		"""
+		Returns the dependent elements of a given parent element.
+
+		Args:
+			element (object): A Revit element or element ID
+
+		Returns:
+			list: The list of dependent Revit elements
+		"""
+		return [self.doc.GetElement(elementId) for elementId in self.getIds(element)]
+
+
+class DependencyGraph:
+	"""
+	A graph of the relationships between all elements of a document. 
+	
+	The graph is built once per document and stores for every element the elements that it references
+	as well as the elements that reference it. Relationships are stored per kind as compact integer arrays:
+
+	- ``TYPE`` connects an element with its type
+	- ``HOST`` connects a hosted element with its host
+	- ``VIEW`` connects a sheet with all views placed on it
+	- ``DEPENDENT`` connects an element with the element it depends on, for example a tag with the tagged element, 
+	  a view specific element with its view or any element returned by ``GetDependentElements()`` with its parent
+
+	Example::
+
+		graph = revitron.DependencyGraph.forDocument()
+		sheetIds = graph.getReferencing(view.Id, [revitron.DependencyGraph.VIEW])
+		hostIds = graph.getReferences(door.Id, [revitron.DependencyGraph.HOST])
+		unusedTypeIds = graph.getUnusedTypes()
+
+	By default, the graph is rebuilt on the next query whenever the :class:`revitron.document.DocumentRevision` 
+	of the document has changed. 
+	Alternatively, the graph can be subscribed to the ``DocumentChanged`` event in order to 
+	update only added, modified and deleted elements::
+
+		graph.subscribe()
+	"""
+
+	TYPE = 0
+	HOST = 1
+	VIEW = 2
+	DEPENDENT = 3
+	KINDS = (TYPE, HOST, VIEW, DEPENDENT)
+
+	_graphs = dict()
+
+	def __init__(self, doc=None, includeDependents=True):
+		"""
+		Inits a new DependencyGraph instance. The graph is built lazily on the first query.
+
+		Args:
+			doc (object, optional): A Revit document. Defaults to the active document.
+			includeDependents (bool, optional): Include the results of ``GetDependentElements()``. Defaults to True.
+		"""
+		import revitron
+		if doc is None:
+			doc = revitron.DOC
+		self.doc = doc
+		self.includeDependents = includeDependents
+		self.revision = None
+		self._handler = None
+		self._reset()
+
+	@staticmethod
+	def forDocument(doc=None):
+		"""
+		Returns the shared graph instance for a given document.
+
+		Args:
+			doc (object, optional): A Revit document. Defaults to the active document.
+
+		Returns:
+			object: The DependencyGraph instance
+		"""
+		import revitron
+		if doc is None:
+			doc = revitron.DOC
+		graphs = DependencyGraph._graphs
+		for key in list(graphs.keys()):
+			if not key.IsValidObject:
+				graphs[key].unsubscribe()
+				del graphs[key]
+		if doc not in graphs:
+			graphs[doc] = DependencyGraph(doc)
+		return graphs[doc]
+
+	def _reset(self):
+		"""
+		Removes all nodes and edges from the graph.
+		"""
+		self.forward = [dict() for kind in DependencyGraph.KINDS]
+		self.reverse = [dict() for kind in DependencyGraph.KINDS]
+		self.nodes = set()
+		self.types = set()
+		self._edges = dict()
+
+	def build(self):
+		"""
+		Builds the graph for all elements of the document.
+		"""
+		import revitron
+		self._reset()
+		with revitron.Document(self.doc):
+			elements = revitron.Filter().getElements()
+		for element in elements:
+			self._add(element)
+		self.revision = revitron.DocumentRevision.get(self.doc)
+
+	def update(self, addedIds=None, modifiedIds=None, deletedIds=None):
+		"""
+		Updates the graph for added, modified and deleted elements.
+
+		Args:
+			addedIds (list, optional): The IDs of added elements. Defaults to None.
+			modifiedIds (list, optional): The IDs of modified elements. Defaults to None.
+			deletedIds (list, optional): The IDs of deleted elements. Defaults to None.
+		"""
+		addedIds = addedIds or []
+		modifiedIds = modifiedIds or []
+		deletedIds = deletedIds or []
+		for elementId in deletedIds:
+			self._remove(elementId.IntegerValue)
+		for elementId in list(addedIds) + list(modifiedIds):
+			self._remove(elementId.IntegerValue)
+			element = self.doc.GetElement(elementId)
+			if element is not None:
+				self._add(element)
+
+	def isSubscribed(self):
+		"""
+		Checks whether the graph is subscribed to the ``DocumentChanged`` event.
+
+		Returns:
+			boolean: True if subscribed
+		"""
+		return self._handler is not None
+
+	def subscribe(self):
+		"""
+		Subscribes the graph to the ``DocumentChanged`` event in order to be updated incrementally.
+
+		Returns:
+			boolean: True on success or in case the graph is already subscribed
+		"""
+		import revitron
+		if self.isSubscribed():
+			return True
+		try:
+			from System import EventHandler
+			from Autodesk.Revit.DB.Events import DocumentChangedEventArgs
+			handler = EventHandler[DocumentChangedEventArgs](self._onDocumentChanged)
+			revitron.APP.DocumentChanged += handler
+			self._handler = handler
+			self.revision = None
+			return True
+		except:
+			return False
+
+	def unsubscribe(self):
+		"""
+		Removes the ``DocumentChanged`` event handler of the graph.
+		"""
+		import revitron
+		if not self.isSubscribed():
+			return
+		try:
+			revitron.APP.DocumentChanged -= self._handler
+		except:
+			pass
+		self._handler = None
+
+	def _onDocumentChanged(self, sender, args):
+		"""
+		The ``DocumentChanged`` event handler.
+
+		Args:
+			sender (object): The application
+			args (object): The ``DocumentChangedEventArgs`` object
+		"""
+		if self.revision is None or not args.GetDocument().Equals(self.doc):
+			return
+		self.update(
+		    args.GetAddedElementIds(),
+		    args.GetModifiedElementIds(),
+		    args.GetDeletedElementIds()
+		)
+
+	def _ensure(self):
+		"""
+		Builds the graph in case it is not built yet or outdated.
+		"""
+		import revitron
+		if self.revision is None:
+			self.build()
+		elif not self.isSubscribed(
+		) and self.revision != revitron.DocumentRevision.get(self.doc):
+			self.build()
+
+	def _add(self, element):
+		"""
+		Adds an element and all the edges it contributes to the graph.
+
+		Args:
+			element (object): A Revit element
+		"""
+		import revitron
+		elementId = element.Id.IntegerValue
+		self.nodes.add(elementId)
+		if isinstance(element, revitron.DB.ElementType):
+			self.types.add(elementId)
+		edges = []
+		for kind, target in self._getReferences(element):
+			if target != elementId:
+				edges.append((kind, elementId, target))
+		if self.includeDependents:
+			for source in self._getDependents(element):
+				if source != elementId:
+					edges.append((DependencyGraph.DEPENDENT, source, elementId))
+		for kind, source, target in edges:
+			self.forward[kind].setdefault(source, array('l')).append(target)
+			self.reverse[kind].setdefault(target, array('l')).append(source)
+		self._edges[elementId] = edges
+
+	def _remove(self, elementId):
+		"""
+		Removes an element and all the edges it has contributed from the graph.
+
+		Args:
+			elementId (integer): The integer value of the element ID
+		"""
+		for kind, source, target in self._edges.pop(elementId, []):
+			DependencyGraph._discard(self.forward[kind], source, target)
+			DependencyGraph._discard(self.reverse[kind], target, source)
+		self.nodes.discard(elementId)
+		self.types.discard(elementId)
+
+	@staticmethod
+	def _discard(adjacency, key, value):
+		"""
+		Removes a single occurrence of a value from the array of a key in an adjacency dictionary.
+
+		Args:
+			adjacency (dict): The adjacency dictionary
+			key (integer): The key
+			value (integer): The value
+		"""
+		items = adjacency.get(key)
+		if items is None:
+			return
+		try:
+			items.remove(value)
+		except ValueError:
+			pass
+		if not len(items):
+			del adjacency[key]
+
+	def _getReferences(self, element):
+		"""
+		Returns the kinds and IDs of all elements that are referenced by an element.
+
+		Args:
+			element (object): A Revit element
+
+		Returns:
+			list: A list of tuples with the kind and the integer value of the referenced element ID
+		"""
+		import revitron
+		db = revitron.DB
+		invalid = db.ElementId.InvalidElementId
+		references = []
+
+		def add(kind, elementId):
+			if elementId is not None and elementId != invalid:
+				references.append((kind, elementId.IntegerValue))
+
+		add(DependencyGraph.TYPE, element.GetTypeId())
+		add(DependencyGraph.DEPENDENT, element.OwnerViewId)
+		try:
+			host = element.Host
+			if host is not None:
+				add(DependencyGraph.HOST, host.Id)
+		except:
+			pass
+		if isinstance(element, db.IndependentTag):
+			try:
+				for taggedId in element.GetTaggedLocalElementIds():
+					add(DependencyGraph.DEPENDENT, taggedId)
+			except:
+				add(DependencyGraph.DEPENDENT, element.TaggedLocalElementId)
+		if isinstance(element, db.SpatialElementTag):
+			try:
+				add(DependencyGraph.DEPENDENT, element.TaggedLocalRoomId)
+			except:
+				pass
+		if isinstance(element, db.ViewSheet):
+			for viewId in element.GetAllPlacedViews():
+				add(DependencyGraph.VIEW, viewId)
+		return references
+
+	def _getDependents(self, element):
+		"""
+		Returns the IDs of all elements that are returned by ``GetDependentElements()`` for an element.
+
+		Args:
+			element (object): A Revit element
+
+		Returns:
+			list: A list of integer values of element IDs
+		"""
+		try:
+			return [
+			    elementId.IntegerValue
+			    for elementId in element.GetDependentElements(None)
+			]
+		except:
+			return []
+
+	def _toInt(self, element):
+		"""
+		Returns the integer value of the ID of an element or element ID.
+
+		Args:
+			element (mixed): A Revit element, an element ID or an integer
+
+		Returns:
+			integer: The integer value
+		"""
+		import revitron
+		if isinstance(element, revitron.DB.ElementId):
+			return element.IntegerValue
+		if isinstance(element, revitron.DB.Element):
+			return element.Id.IntegerValue
+		return element
+
+	def _toIds(self, values):
+		"""
+		Converts integer values of existing elements into a sorted ``List[ElementId]`` collection.
+
+		Args:
+			values (iterable): The integer values
+
+		Returns:
+			object: A ``List[ElementId]`` collection
+		"""
+		import revitron
+		return List[revitron.DB.ElementId](
+		    [
+		        revitron.DB.ElementId(value)
+		        for value in sorted(set(values)) if value in self.nodes
+		    ]
+		)
+
+	def _lookup(self, adjacencies, element, kinds):
+		"""
+		Looks up the neighbours of an element in a list of adjacency dictionaries.
+
+		Args:
+			adjacencies (list): The adjacency dictionaries per kind
+			element (mixed): A Revit element, an element ID or an integer
+			kinds (list): The list of kinds or None for all kinds
+
+		Returns:
+			object: A ``List[ElementId]`` collection
+		"""
+		self._ensure()
+		key = self._toInt(element)
+		values = []
+		for kind in kinds or DependencyGraph.KINDS:
+			values += list(adjacencies[kind].get(key, []))
+		return self._toIds([value for value in values if value != key])
+
+	def getReferences(self, element, kinds=None):
+		"""
+		Returns the IDs of all elements that are referenced by an element, such as its type, its host 
+		or the views placed on a sheet.
+
+		Args:
+			element (mixed): A Revit element, an element ID or an integer
+			kinds (list, optional): A list of kinds to be included. Defaults to all kinds.
+
+		Returns:
+			object: A ``List[ElementId]`` collection
+		"""
+		return self._lookup(self.forward, element, kinds)
+
+	def getReferencing(self, element, kinds=None):
+		"""
+		Returns the IDs of all elements that reference or depend on an element, 
+		such as its instances, hosted elements, tags or the sheets a view is placed on.
+
+		Args:
+			element (mixed): A Revit element, an element ID or an integer
+			kinds (list, optional): A list of kinds to be included. Defaults to all kinds.
+
+		Returns:
+			object: A ``List[ElementId]`` collection
+		"""
+		return self._lookup(self.reverse, element, kinds)
+
+	def getUnusedTypes(self):
+		"""
+		Returns the IDs of all element types that are not used by any element.
+
+		Returns:
+			object: A ``List[ElementId]`` collection
+		"""
+		self._ensure()
+		users = self.reverse[DependencyGraph.TYPE]
+		unused = []
+		for typeId in self.types:
+			if not [user for user in users.get(typeId, []) if user in self.nodes]:
+				unused.append(typeId)
+		return self._toIds(unused)
+
+	def _isConnected(self, elementId, kinds):
+		"""
+		Checks whether an element has an edge of one of the given kinds to any other existing element.
+
+		Args:
+			elementId (integer): The integer value of the element ID
+			kinds (list): The list of kinds
+
+		Returns:
+			boolean: True if connected
+		"""
+		for kind in kinds:
+			for adjacency in [self.forward[kind], self.reverse[kind]]:
+				for value in adjacency.get(elementId, []):
+					if value != elementId and value in self.nodes:
+						return True
+		return False
+
+	def getOrphans(self, filterClass=None):
+		"""
+		Returns the IDs of all elements that are not types and that have neither a host, sheet nor 
+		dependency relationship to any other element.
+
+		Args:
+			filterClass (class, optional): An optional class to filter the orphans by. Defaults to None.
+
+		Returns:
+			object: A ``List[ElementId]`` collection
+		"""
+		import revitron
+		self._ensure()
+		kinds = [DependencyGraph.HOST, DependencyGraph.VIEW, DependencyGraph.DEPENDENT]
+		orphans = []
+		for elementId in self.nodes - self.types:
+			if self._isConnected(elementId, kinds):
+				continue
+			if filterClass is not None:
+				element = self.doc.GetElement(revitron.DB.ElementId(elementId))
+				if not isinstance(element, filterClass):
+					continue
+			orphans.append(elementId)
+		return self._toIds(orphans)
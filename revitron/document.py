@@ -3,6 +3,8 @@ The ``document`` submodule contains classes to interact with the currently
 active **Revit** document or store individual project configurations within a model. 
 """
 import json
+import copy
+from contextlib import contextmanager
 
 
 class Document:
@@ -86,17 +88,20 @@ class Document:
 			index = 0
 		of = revitron.DB.BuiltInFailures.OverlapFailures
 		duplicates = []
-		for warning in self.doc.GetWarnings():
-			if warning.GetFailureDefinitionId().Guid == of.DuplicateInstances.Guid:
-				ids = warning.GetFailingElements()
-				duplicates.append(ids[index])
-				duplicates = list(set(duplicates))
+		seen = set()
+		warnings = WarningsIndex.forDocument(self.doc)
+		for warning in warnings.getByGuid(of.DuplicateInstances.Guid):
+			elementId = warning.GetFailingElements()[index]
+			if elementId.IntegerValue not in seen:
+				seen.add(elementId.IntegerValue)
+				duplicates.append(elementId)
 		return duplicates
 
 	def getLinkedDocuments(self, scope=None):
 		"""
 		Returns a dictionary of all linked documents.
 		The key is the ID of the link and the value is the actual document object.
+		Links are resolved using the :class:`revitron.link.LinkRegistry`.
 
 		Args:
 			scope (mixed, optional): List or view ID. Defaults to None.
@@ -105,18 +110,7 @@ class Document:
 			dict: A dictionary of all linked documents.
 		"""
 		import revitron
-		linkedDocuments = dict()
-		extension = '.rvt'
-		for link in revitron.Filter(scope).byCategory('RVT Links'
-		                                              ).noTypes().getElements():
-			linkType = revitron.Parameter(link, 'Type').getValueString()
-			if linkType.endswith(extension):
-				linkType = linkType[:-len(extension)]
-			for openDoc in revitron.APP.Documents:
-				if openDoc.IsLinked:
-					if openDoc.Title == linkType:
-						linkedDocuments[link.Id] = openDoc
-		return linkedDocuments
+		return revitron.LinkRegistry.forDocument(self.doc).getDocuments(scope)
 
 	def getPath(self):
 		"""
@@ -187,6 +181,299 @@ class Document:
 			return False
 
 
+class DocumentRevision:
+	"""
+	The ``DocumentRevision`` class keeps track of a revision number for every open document.
+	The revision is increased whenever a document is modified and can therefore be used to invalidate
+	cached data that depends on the state of a document::
+
+		revision = revitron.DocumentRevision.get()
+
+	By default, only transactions that are committed or rolled back using the
+	:doc:`revitron.transaction` wrappers increase the revision. Optionally the revision tracking can subscribe to the ``DocumentChanged``
+	event of the application in order to also track changes made by any other add-in or by the user::
+
+		revitron.DocumentRevision.subscribe()
+	"""
+
+	_revisions = dict()
+	_handler = None
+	_subscriptions = 0
+
+	@staticmethod
+	def get(doc=None):
+		"""
+		Returns the current revision of a document.
+
+		Args:
+			doc (object, optional): A Revit document. Defaults to the active document.
+
+		Returns:
+			integer: The revision number
+		"""
+		import revitron
+		if doc is None:
+			doc = revitron.DOC
+		return DocumentRevision._revisions.get(doc, 0)
+
+	@staticmethod
+	def increment(doc=None):
+		"""
+		Increases the revision of a document.
+
+		Args:
+			doc (object, optional): A Revit document. Defaults to the active document.
+
+		Returns:
+			integer: The new revision number
+		"""
+		import revitron
+		if doc is None:
+			doc = revitron.DOC
+		revisions = DocumentRevision._revisions
+		for key in list(revisions.keys()):
+			if not key.IsValidObject:
+				del revisions[key]
+		revisions[doc] = revisions.get(doc, 0) + 1
+		return revisions[doc]
+
+	@staticmethod
+	def isSubscribed():
+		"""
+		Checks whether the revision tracking is subscribed to the ``DocumentChanged`` event.
+
+		Returns:
+			boolean: True if subscribed
+		"""
+		return DocumentRevision._handler is not None
+
+	@staticmethod
+	def subscribe():
+		"""
+		Subscribes the revision tracking to the ``DocumentChanged`` event of the application.
+		Subscriptions are counted and the event handler is only removed after
+		every subscription has been released by calling ``unsubscribe()``.
+
+		Note:
+
+			Event handlers stay registered as long as the Revit session is running. 
+			Make sure to call ``unsubscribe()`` when the tracking isn't needed anymore.
+
+		Returns:
+			boolean: True on success or in case the tracking is already subscribed
+		"""
+		import revitron
+		if not DocumentRevision.isSubscribed():
+			try:
+				from System import EventHandler
+				from Autodesk.Revit.DB.Events import DocumentChangedEventArgs
+				handler = EventHandler[DocumentChangedEventArgs](
+				    DocumentRevision._onDocumentChanged
+				)
+				revitron.APP.DocumentChanged += handler
+				DocumentRevision._handler = handler
+			except:
+				return False
+		DocumentRevision._subscriptions += 1
+		return True
+
+	@staticmethod
+	def unsubscribe():
+		"""
+		Releases a subscription and removes the ``DocumentChanged`` event handler
+		as soon as there are no subscriptions left.
+		"""
+		import revitron
+		if not DocumentRevision.isSubscribed():
+			return
+		DocumentRevision._subscriptions = max(DocumentRevision._subscriptions - 1, 0)
+		if DocumentRevision._subscriptions:
+			return
+		try:
+			revitron.APP.DocumentChanged -= DocumentRevision._handler
+		except:
+			pass
+		DocumentRevision._handler = None
+
+	@staticmethod
+	def _onDocumentChanged(sender, args):
+		"""
+		The ``DocumentChanged`` event handler.
+
+		Args:
+			sender (object): The application
+			args (object): The ``DocumentChangedEventArgs`` object
+		"""
+		DocumentRevision.increment(args.GetDocument())
+
+
+class WarningsIndex:
+	"""
+	An index of all warnings of a document. 
+	
+	The warnings are read only once and grouped by the GUID of their failure definition, 
+	their severity and their description. Additionally every failing element is mapped to its warnings::
+
+		index = revitron.WarningsIndex.forDocument()
+		print(index.count())
+		for warning in index.getByElement(wall):
+		    print(warning.GetDescriptionText())
+
+	Indexes returned by ``forDocument()`` are shared as long as the :class:`DocumentRevision` 
+	of the document doesn't change and the revision tracking is subscribed to the ``DocumentChanged`` event.
+	Otherwise a new index is built for every call, since changes made by the user can't be tracked.
+	Indexes are also never shared while a transaction is open.
+	"""
+
+	_indexes = dict()
+
+	def __init__(self, doc=None):
+		"""
+		Inits a new WarningsIndex instance and reads all warnings of a document.
+
+		Args:
+			doc (object, optional): A Revit document. Defaults to the active document.
+		"""
+		import revitron
+		if doc is None:
+			doc = revitron.DOC
+		self.doc = doc
+		self.revision = DocumentRevision.get(doc)
+		self.warnings = list(doc.GetWarnings())
+		self.byGuid = dict()
+		self.bySeverity = dict()
+		self.byDescription = dict()
+		self.byElement = dict()
+		for warning in self.warnings:
+			guid = str(warning.GetFailureDefinitionId().Guid)
+			self.byGuid.setdefault(guid, []).append(warning)
+			self.bySeverity.setdefault(str(warning.GetSeverity()), []).append(warning)
+			self.byDescription.setdefault(warning.GetDescriptionText(), []).append(warning)
+			for elementId in warning.GetFailingElements():
+				self.byElement.setdefault(elementId.IntegerValue, []).append(warning)
+
+	@staticmethod
+	def forDocument(doc=None):
+		"""
+		Returns the shared index for a given document.
+
+		Args:
+			doc (object, optional): A Revit document. Defaults to the active document.
+
+		Returns:
+			object: The WarningsIndex instance
+		"""
+		import revitron
+		if doc is None:
+			doc = revitron.DOC
+		index = WarningsIndex.getShared(doc)
+		if index is None:
+			index = WarningsIndex(doc)
+			WarningsIndex._indexes[doc] = index
+		return index
+
+	@staticmethod
+	def getShared(doc=None):
+		"""
+		Returns the shared index for a given document only in case it exists and is still valid.
+		In contrast to ``forDocument()``, no new index is built.
+
+		Args:
+			doc (object, optional): A Revit document. Defaults to the active document.
+
+		Returns:
+			object: The WarningsIndex instance or None
+		"""
+		import revitron
+		if doc is None:
+			doc = revitron.DOC
+		indexes = WarningsIndex._indexes
+		for key in list(indexes.keys()):
+			if not key.IsValidObject:
+				del indexes[key]
+		index = indexes.get(doc)
+		if index is None or doc.IsModifiable or not DocumentRevision.isSubscribed(
+		) or index.revision != DocumentRevision.get(doc):
+			return None
+		return index
+
+	def count(self):
+		"""
+		Returns the number of warnings.
+
+		Returns:
+			integer: The number of warnings
+		"""
+		return len(self.warnings)
+
+	def getByGuid(self, guid):
+		"""
+		Returns all warnings of a given failure definition.
+
+		Example::
+
+			guid = revitron.DB.BuiltInFailures.OverlapFailures.DuplicateInstances.Guid
+			warnings = revitron.WarningsIndex.forDocument().getByGuid(guid)
+
+		Args:
+			guid (mixed): A ``Guid``, a ``FailureDefinitionId`` or a GUID string
+
+		Returns:
+			list: The list of warnings
+		"""
+		guid = getattr(guid, 'Guid', guid)
+		return self.byGuid.get(str(guid), [])
+
+	def getBySeverity(self, severity):
+		"""
+		Returns all warnings of a given severity.
+
+		Args:
+			severity (mixed): A ``FailureSeverity`` or its name such as ``Warning`` or ``Error``
+
+		Returns:
+			list: The list of warnings
+		"""
+		return self.bySeverity.get(str(severity), [])
+
+	def getByDescription(self, description):
+		"""
+		Returns all warnings with a given description text.
+
+		Args:
+			description (string): The description text
+
+		Returns:
+			list: The list of warnings
+		"""
+		return self.byDescription.get(description, [])
+
+	def getByElement(self, element):
+		"""
+		Returns all warnings where a given element is one of the failing elements.
+
+		Args:
+			element (mixed): A Revit element or element ID
+
+		Returns:
+			list: The list of warnings
+		"""
+		import revitron
+		if not isinstance(element, revitron.DB.ElementId):
+			element = element.Id
+		return self.byElement.get(element.IntegerValue, [])
+
+	def getFailingElementIds(self):
+		"""
+		Returns the IDs of all elements that are failing in any warning.
+
+		Returns:
+			list: The list of element IDs
+		"""
+		import revitron
+		return [revitron.DB.ElementId(value) for value in sorted(self.byElement.keys())]
+
+
 class DocumentConfigStorage:
 	"""
 	The ``DocumentConfigStorage`` allows for easily storing project configuration items.
@@ -204,22 +491,63 @@ class DocumentConfigStorage:
 	Setting configuration items works as follows::
 	
 		revitron.DocumentConfigStorage().set('namespace.item', value)
-	
+
+	The parsed storage is cached per document and only parsed again after the stored data
+	has changed. Multiple items can be set at once in a session. The storage is then only
+	serialized and written once when leaving the session and only in case the data has
+	actually changed::
+
+		config = revitron.DocumentConfigStorage()
+		with config.session():
+		    config.set('namespace.item1', value1)
+		    config.set('namespace.item2', value2)
+
+	In case a session is left with an exception, all changes of the session are discarded.
 	"""
 
-	def __init__(self):
+	_cache = dict()
+
+	def __init__(self, doc=None):
 		"""
 		Inits a new ``DocumentConfigStorage`` object.
+
+		Args:
+			doc (object, optional): A Revit document. Defaults to the active document.
 		"""
 		import revitron
 
+		if doc is None:
+			doc = revitron.DOC
+		self.doc = doc
 		self.storageName = 'REVITRON_CONFIG'
-		self.info = revitron.DOC.ProjectInformation
-		raw = revitron._(self.info).get(self.storageName)
-		self.storage = dict()
+		self.info = doc.ProjectInformation
+		self.raw = revitron._(self.info).get(self.storageName)
+		self.storage = self._parse(self.raw)
+		self.dirty = False
+		self._sessions = 0
+		self._copied = False
+
+	def _parse(self, raw):
+		"""
+		Parses the raw storage string. Parsed data is cached per document and shared 
+		by all instances until an instance modifies it.
 
-		if raw:
-			self.storage = json.loads(raw)
+		Args:
+			raw (string): The raw JSON string
+
+		Returns:
+			dict: The shared parsed storage
+		"""
+		cache = DocumentConfigStorage._cache
+		for key in list(cache.keys()):
+			if not key.IsValidObject:
+				del cache[key]
+		if self.doc not in cache or cache[self.doc][0] != raw:
+			storage = dict()
+			if raw:
+				storage = json.loads(raw)
+			cache[self.doc] = (raw, storage)
+		return cache[self.doc][1]
 
 	def get(self, key, default=None):
 		"""
@@ -235,13 +563,19 @@ class DocumentConfigStorage:
 			default (mixed, optional): An optional default value. Defaults to None.
 
 		Returns:
-			mixed: The stored value 
+			mixed: The stored value or a copy in case the value is a list or a dictionary
 		"""
-		return self.storage.get(key, default)
+		if key not in self.storage:
+			return default
+		value = self.storage[key]
+		if isinstance(value, (dict, list)):
+			return copy.deepcopy(value)
+		return value
 
 	def set(self, key, data):
 		"""
 		Updates or creates a config storage entry.
+		Outside of a session, the storage is saved immediately.
 
 		Example::
 		
@@ -252,12 +586,73 @@ class DocumentConfigStorage:
 			key (string): The storage entry key
 			data (mixed): The value of the entry
 		"""
+		if not self._copied:
+			self.storage = dict(self.storage)
+			self._copied = True
+		self.storage[key] = copy.deepcopy(data)
+		self.dirty = True
+		if not self._sessions:
+			self.save()
+
+	@contextmanager
+	def session(self):
+		"""
+		Returns a context that batches all ``set()`` calls into a single write
+		when leaving the context.
+
+		Returns:
+			object: The session context
+		"""
+		self._sessions += 1
+		try:
+			yield self
+		except:
+			self._sessions -= 1
+			self.reset()
+			raise
+		self._sessions -= 1
+		if not self._sessions:
+			self.save()
+
+	def reset(self):
+		"""
+		Discards all unsaved changes and reloads the stored data.
+		"""
 		import revitron
 
-		self.storage[key] = data
+		self.raw = revitron._(self.info).get(self.storageName)
+		self.storage = self._parse(self.raw)
+		self._copied = False
+		self.dirty = False
+
+	def save(self):
+		"""
+		Serializes and writes the storage in case it has been modified.
+		Writing is skipped in case the serialized data equals the currently stored data.
+		The storage stays modified in case the data can't be written.
+
+		Returns:
+			boolean: True in case the storage is saved
+		"""
+		import revitron
+
+		if not self.dirty:
+			return True
 		# Remove empty items.
-		self.storage = dict((k, v) for k, v in self.storage.iteritems() if v)
-		raw = json.dumps(self.storage, sort_keys=True, ensure_ascii=False)
-		t = revitron.Transaction()
-		revitron._(self.info).set(self.storageName, raw)
-		t.commit()
+		storage = dict((k, v) for k, v in self.storage.iteritems() if v)
+		raw = json.dumps(storage, sort_keys=True, ensure_ascii=False)
+		if raw != revitron._(self.info).get(self.storageName):
+			t = revitron.Transaction(self.doc)
+			try:
+				revitron._(self.info).set(self.storageName, raw)
+			except:
+				t.rollback()
+				raise
+			if not t.commit():
+				return False
+		self.raw = raw
+		self.storage = storage
+		self._copied = False
+		self.dirty = False
+		DocumentConfigStorage._cache[self.doc] = (raw, storage)
+		return True
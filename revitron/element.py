@@ -22,7 +22,7 @@ Or setting parameter values::
 import numbers
 
 
-class Element:
+class Element(object):
 	"""
 	A wrapper class for Revit elements. 
 	
@@ -34,8 +34,13 @@ class Element:
 	
 		from revitron import _
 		value = _(element).get('parameter')
+
+	Wrappers are lightweight objects that only hold a reference to the actual Revit element.
+	Derived classes should therefore also define empty ``__slots__``.
 	"""
 
+	__slots__ = ('_element', )
+
 	def __init__(self, element):
 		"""
 		Inits a new element instance.
@@ -177,30 +182,10 @@ class Element:
 			list: The list with the dependent Revit elements.
 		"""
 		import revitron
-		from revitron import _
 		# The GetDependentElements() method doesn't exist in older Revit API versions.
-		# Therefore it is required to fallback to a more compatible way of getting those dependent elements
-		# in case an execption is raised.
-		# The fallback solution basically tries to get the list of affected IDs when trying to delete
-		# the actual parent element within a transaction that will be cancelled.
-		try:
-			fltr = None
-			if filterClass:
-				fltr = revitron.DB.ElementClassFilter(filterClass)
-			dependentIds = self._element.GetDependentElements(fltr)
-		except:
-			sub = revitron.Transaction()
-			ids = revitron.DOC.Delete(self._element.Id)
-			sub.rollback()
-			if filterClass:
-				dependentIds = revitron.Filter(ids).byClass(filterClass
-				                                            ).noTypes().getElementIds()
-			else:
-				dependentIds = revitron.Filter(ids).noTypes().getElementIds()
-		dependent = []
-		for eId in dependentIds:
-			dependent.append(_(eId).element)
-		return dependent
+		# In that case the Dependencies class falls back to getting the list of affected IDs
+		# when trying to delete the actual parent element within a transaction that will be cancelled.
+		return revitron.Dependencies([self._element], filterClass).get(self._element)
 
 	def getFromType(self, paramName):
 		"""
@@ -216,12 +201,53 @@ class Element:
 		Returns:
 			mixed: The parameter value
 		"""
-		from revitron import _
 		try:
-			return _(self._element.GetTypeId()).get(paramName)
+			return TypeValueCache.get(
+			    self._element.GetTypeId(), paramName, self._element.Document
+			)
 		except:
 			return ''
 
+	@staticmethod
+	def getFromTypeMany(elements, paramNames):
+		"""
+		Returns parameter values of the element types of multiple elements at once.
+		Elements are grouped by their document and type ID and every type is resolved only once.
+		Elements of different documents, such as linked and host elements, can be mixed.
+		The result has the same structure as the result of :meth:`revitron.filter.Filter.getValues`::
+
+			values = revitron.Element.getFromTypeMany(doors, ['Type Mark', 'Width'])
+			for i, elementId in enumerate(values.ids):
+			    print(elementId, values.columns['Type Mark'][i])
+
+		Args:
+			elements (list): A list of Revit elements
+			paramNames (list): The list of parameter names
+
+		Returns:
+			object: An ``AttrDict`` with the list of ``ids`` and a dict of ``columns`` with one list of values per parameter
+		"""
+		import revitron
+		ids = []
+		columns = dict((name, []) for name in paramNames)
+		types = dict()
+		for element in elements:
+			ids.append(element.Id)
+			typeId = element.GetTypeId()
+			key = (element.Document, typeId.IntegerValue)
+			if key not in types:
+				types[key] = dict()
+				for name in paramNames:
+					try:
+						types[key][name] = TypeValueCache.get(
+						    typeId, name, element.Document
+						)
+					except:
+						types[key][name] = ''
+			for name in paramNames:
+				columns[name].append(types[key][name])
+		return revitron.AttrDict(ids=ids, columns=columns)
+
 	def getGeometry(self):
 		"""
 		Return the Revitron Geometry instance for this element.
@@ -319,4 +345,119 @@ class Element:
 		"""
 		import revitron
 		revitron.Parameter(self._element, paramName).set(value, paramType)
-		return self
\ No newline at end of file
+		return self
+
+
+class TypeValueCache:
+	"""
+	An opt-in cache for parameter values of element types. Values are cached per document, 
+	type ID and parameter name and are invalidated as soon as the :class:`revitron.document.DocumentRevision` 
+	of the document changes. The cache is bypassed while a transaction is open, since
+	uncommitted changes don't change the revision. 
+
+	Since many instances usually share only a few types, enabling the cache speeds up 
+	``_(element).getFromType()`` significantly when reading type values of many instances.
+	Enabling the cache also subscribes the revision tracking to the ``DocumentChanged`` event::
+
+		revitron.TypeValueCache.enable()
+		marks = [_(door).getFromType('Type Mark') for door in doors]
+		revitron.TypeValueCache.disable()
+	"""
+
+	enabled = False
+	_caches = dict()
+	_subscribed = False
+
+	@staticmethod
+	def enable():
+		"""
+		Enables the cache.
+		"""
+		import revitron
+		TypeValueCache.enabled = True
+		if not TypeValueCache._subscribed:
+			TypeValueCache._subscribed = revitron.DocumentRevision.subscribe()
+
+	@staticmethod
+	def disable():
+		"""
+		Disables and clears the cache and releases its subscription of the revision tracking.
+		"""
+		import revitron
+		TypeValueCache.enabled = False
+		TypeValueCache.clear()
+		if TypeValueCache._subscribed:
+			revitron.DocumentRevision.unsubscribe()
+			TypeValueCache._subscribed = False
+
+	@staticmethod
+	def clear():
+		"""
+		Clears the cache for all documents.
+		"""
+		TypeValueCache._caches = dict()
+
+	@staticmethod
+	def get(typeId, paramName, doc=None):
+		"""
+		Returns a parameter value of an element type. The cache is only used in case it is enabled.
+
+		Args:
+			typeId (object): The element ID of the type
+			paramName (string): The parameter name
+			doc (object, optional): A Revit document. Defaults to the active document.
+
+		Returns:
+			mixed: The parameter value or an empty string in case the type doesn't exist
+		"""
+		import revitron
+		if doc is None:
+			doc = revitron.DOC
+		if not TypeValueCache.enabled or doc.IsModifiable:
+			return TypeValueCache._read(doc, typeId, paramName)
+		values = TypeValueCache._getValues(doc)
+		key = (typeId.IntegerValue, paramName)
+		if key not in values:
+			values[key] = TypeValueCache._read(doc, typeId, paramName)
+		return values[key]
+
+	@staticmethod
+	def _read(doc, typeId, paramName):
+		"""
+		Reads a parameter value of an element type.
+
+		Args:
+			doc (object): A Revit document
+			typeId (object): The element ID of the type
+			paramName (string): The parameter name
+
+		Returns:
+			mixed: The parameter value or an empty string in case the type doesn't exist
+		"""
+		import revitron
+		elementType = doc.GetElement(typeId)
+		if elementType is None:
+			return ''
+		return revitron.Parameter(elementType, paramName).get()
+
+	@staticmethod
+	def _getValues(doc):
+		"""
+		Returns the dictionary of cached values of a document 
+		and resets it in case the document has changed.
+
+		Args:
+			doc (object): A Revit document
+
+		Returns:
+			dict: The dictionary of cached values
+		"""
+		import revitron
+		caches = TypeValueCache._caches
+		for key in list(caches.keys()):
+			if not key.IsValidObject:
+				del caches[key]
+		revision = revitron.DocumentRevision.get(doc)
+		if doc not in caches or caches[doc][0] != revision:
+			caches[doc] = (revision, dict())
+		return caches[doc][1]
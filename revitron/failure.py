@@ -106,4 +106,55 @@ class WarningAndErrorCatcher(IFailuresPreprocessor):
 		"""
 		return FailureHandler.preprocess(
 		    failuresAccessor, suppressWarnings=True, rollbackOnError=True
-		)
\ No newline at end of file
+		)
+
+
+class FailureCollector(IFailuresPreprocessor):
+	"""
+	This class implements the ``IFailurePreprocessor`` interface and can be used as a preprocessor 
+	for collecting all failure messages while optionally suppressing warnings and rolling back 
+	on errors. The collected messages are available in the ``messages`` list after committing.
+
+	Args:
+		IFailuresPreprocessor (interface): The Revit API IFailuresPreprocessor interface.
+	"""
+
+	def __init__(self, suppressWarnings=False, rollbackOnError=False):
+		"""
+		Inits a new failure collector.
+
+		Args:
+			suppressWarnings (bool, optional): Optionally suppress all warnings. Defaults to False.
+			rollbackOnError (bool, optional): Optionally roll back on errors. Defaults to False.
+		"""
+		self.suppressWarnings = suppressWarnings
+		self.rollbackOnError = rollbackOnError
+		self.messages = []
+
+	def PreprocessFailures(self, failuresAccessor):
+		"""
+		Collects all failure messages and preprocesses them using the ``FailureHandler``.
+
+		Args:
+			failuresAccessor (object): The Revit API ``FailuresAccessor`` object.
+
+		Returns:
+			object: A Revit ``FailureProcessingResult``
+		"""
+		import revitron
+		for failure in failuresAccessor.GetFailureMessages():
+			self.messages.append(
+			    revitron.AttrDict(
+			        severity=str(failure.GetSeverity()),
+			        description=failure.GetDescriptionText(),
+			        elementIds=[
+			            elementId.IntegerValue
+			            for elementId in failure.GetFailingElementIds()
+			        ]
+			    )
+			)
+		return FailureHandler.preprocess(
+		    failuresAccessor,
+		    suppressWarnings=self.suppressWarnings,
+		    rollbackOnError=self.rollbackOnError
+		)
@@ -28,41 +28,770 @@ The document context can be changed as follows::
 	with revitron.Document(anyOtherDoc):
 	    fltr = revitron.Filter().noTypes()
 	    elements = fltr.getElements()
+
+Deferred Filters
+----------------
+
+By default, every filter method is applied to the underlying collector immediately. 
+For longer chains on large models it can be more efficient to create a **deferred** filter instead.
+A deferred filter only records a plan of all applied filter stages and executes that plan at once 
+as soon as the elements or element IDs are requested::
+
+	fltr = revitron.Filter(deferred=True)
+	fltr = fltr.byStringEquals('param', 'value').byCategory('Walls').noTypes()
+	ids = fltr.getElementIds()
+
+When executing the plan, fast quick filters such as category, class and type filters are moved in front
+of the slower parameter filters. All non-inverted parameter rules are fused into a single 
+``ElementParameterFilter`` and the database is therefore only passed once.
+
+Caching Results
+---------------
+
+Scripts often run identical filters multiple times. The resulting element IDs can be cached by enabling
+the :class:`FilterCache`. Cached results are stored per document, scope and filter plan and are invalidated
+automatically whenever the document is modified::
+
+	revitron.FilterCache.enable()
+	ids = revitron.Filter().byCategory('Rooms').noTypes().getElementIds()
+
+The cache can be bypassed for single calls as follows::
+
+	ids = revitron.Filter().byCategory('Rooms').noTypes().getElementIds(useCache=False)
+
+Explaining Filters
+------------------
+
+In order to find slow stages in longer filter chains, a filter can explain its plan.
+All executed stages are replayed one by one on the result of the previous stage 
+and the element counts as well as the time spent in every stage are reported::
+
+	fltr = revitron.Filter().byCategory('Rooms').byStringEquals('Department', 'Office').noTypes()
+	print(revitron.FilterProfiler.format(fltr.explain()))
+
+The :class:`FilterProfiler` can also be enabled globally in order to log the plan of every filter 
+as soon as its elements or element IDs are requested::
+
+	revitron.FilterProfiler.enable()
 """
 import re
+import time
+from collections import OrderedDict
 from System.Collections.Generic import List
 
 
+class FilterStage:
+	"""
+	A single stage of a filter plan. A stage either wraps a Revit ``ElementFilter`` or a callback
+	that processes the filter instance in Python. The ``kind`` of a stage defines the order of execution
+	in deferred filters.
+	"""
+
+	QUICK = 0
+	PARAMETER = 1
+	SLOW = 2
+	SCRIPT = 3
+
+	def __init__(self, name, args, kind, elementFilter=None, callback=None):
+		"""
+		Inits a new FilterStage instance.
+
+		Args:
+			name (string): The name of the filter method that created the stage
+			args (tuple): The arguments that have been passed to the filter method
+			kind (integer): The kind of stage, one of ``QUICK``, ``PARAMETER``, ``SLOW`` or ``SCRIPT``
+			elementFilter (object, optional): A Revit element filter. Defaults to None.
+			callback (function, optional): A callback that takes the filter instance as argument. Defaults to None.
+		"""
+		self.name = name
+		self.args = args
+		self.kind = kind
+		self._elementFilter = elementFilter
+		self.callback = callback
+		self.providers = 0
+		self.setupTime = 0.0
+
+	@property
+	def elementFilter(self):
+		"""
+		The Revit element filter of the stage.
+
+		Returns:
+			object: The Revit element filter or None
+		"""
+		return self._elementFilter
+
+	@staticmethod
+	def combine(filters, conjunction=False):
+		"""
+		Combines a list of Revit element filters into a single logical filter.
+
+		Args:
+			filters (list): A list of Revit element filters
+			conjunction (bool, optional): Combine filters with a ``LogicalAndFilter`` instead of a ``LogicalOrFilter``. Defaults to False.
+
+		Returns:
+			object: The combined filter or None in case the list is empty
+		"""
+		import revitron
+		db = revitron.DB
+		if not filters:
+			return None
+		if len(filters) == 1:
+			return filters[0]
+		if conjunction:
+			return db.LogicalAndFilter(List[db.ElementFilter](filters))
+		return db.LogicalOrFilter(List[db.ElementFilter](filters))
+
+	def apply(self, fltr):
+		"""
+		Applies the stage to a given filter instance.
+
+		Args:
+			fltr (object): The Filter instance
+		"""
+		if self.elementFilter is not None:
+			fltr.collector = fltr.collector.WherePasses(self.elementFilter)
+		elif self.callback is not None:
+			self.callback(fltr)
+
+
+class ParameterFilterStage(FilterStage):
+	"""
+	A filter stage that filters by parameter values. Since a visible parameter name can match
+	multiple built-in parameters, such a stage can contain a list of rules, one for each value provider.
+	"""
+
+	def __init__(self, name, args, rules, invert=False):
+		"""
+		Inits a new ParameterFilterStage instance.
+
+		Args:
+			name (string): The name of the filter method that created the stage
+			args (tuple): The arguments that have been passed to the filter method
+			rules (list): The list of filter rules
+			invert (bool, optional): Inverts the filter. Defaults to False.
+		"""
+		FilterStage.__init__(self, name, args, FilterStage.PARAMETER)
+		self.rules = rules
+		self.invert = invert
+
+	@property
+	def elementFilter(self):
+		"""
+		The combined Revit element filter of all rules. 
+		Multiple rules are combined with a ``LogicalOrFilter`` or with a ``LogicalAndFilter`` 
+		when the stage is inverted.
+
+		Returns:
+			object: The Revit element filter or None in case there are no rules
+		"""
+		return FilterStage.combine(self.getElementFilters(), self.invert)
+
+	def getElementFilters(self):
+		"""
+		Returns a list with one ``ElementParameterFilter`` for each rule.
+
+		Returns:
+			list: The list of Revit element filters
+		"""
+		import revitron
+		return [
+		    revitron.DB.ElementParameterFilter(rule, self.invert) for rule in self.rules
+		]
+
+	def isFusable(self):
+		"""
+		Checks whether the rule of this stage can be fused with the rules of other stages
+		into a single ``ElementParameterFilter``.
+
+		Returns:
+			boolean: True if the stage has exactly one rule and is not inverted
+		"""
+		return len(self.rules) == 1 and not self.invert
+
+
+class RegexPlanner:
+	"""
+	A helper class for rewriting simple regular expressions into native string filter rules.
+	Anchored prefixes and suffixes, literal strings and alternations of literals are supported. 
+	Any other pattern can't be rewritten and has to be evaluated in Python::
+
+		RegexPlanner.plan('^A-|^B-')  # [('FilterStringBeginsWith', 'A-'), ('FilterStringBeginsWith', 'B-')]
+		RegexPlanner.plan('\\d+')     # None
+	"""
+
+	metaCharacters = '.^$*+?{}[]()|\\'
+
+	@staticmethod
+	def plan(regex):
+		"""
+		Plans the native evaluation of a regex.
+
+		Args:
+			regex (string): The regex
+
+		Returns:
+			list: A list of tuples with an evaluator class name and a literal value or None
+		"""
+		branches = RegexPlanner._split(regex)
+		prefix = ''
+		suffix = ''
+		body = regex
+		if body.startswith('^'):
+			prefix = '^'
+			body = body[1:]
+		if body.endswith('$') and not RegexPlanner._isEscaped(body, len(body) - 1):
+			suffix = '$'
+			body = body[:-1]
+		for opening in ['(?:', '(']:
+			if body.startswith(opening) and body.endswith(')'):
+				inner = body[len(opening):-1]
+				if '(' not in inner and ')' not in inner:
+					branches = [
+					    prefix + branch + suffix for branch in RegexPlanner._split(inner)
+					]
+					break
+		if not branches:
+			return None
+		plan = []
+		for branch in branches:
+			step = RegexPlanner._planBranch(branch)
+			if not step:
+				return None
+			plan.append(step)
+		return plan
+
+	@staticmethod
+	def _isEscaped(string, index):
+		"""
+		Checks whether a character at a given index is escaped by a backslash.
+
+		Args:
+			string (string): The string
+			index (integer): The index of the character
+
+		Returns:
+			boolean: True if the character is escaped
+		"""
+		count = 0
+		while index > 0 and string[index - 1] == '\\':
+			count += 1
+			index -= 1
+		return count % 2 == 1
+
+	@staticmethod
+	def _split(regex):
+		"""
+		Splits a regex at all unescaped ``|`` characters.
+
+		Args:
+			regex (string): The regex
+
+		Returns:
+			list: The list of branches
+		"""
+		branches = []
+		branch = ''
+		i = 0
+		while i < len(regex):
+			char = regex[i]
+			if char == '\\' and i + 1 < len(regex):
+				branch += regex[i:i + 2]
+				i += 2
+				continue
+			if char == '|':
+				branches.append(branch)
+				branch = ''
+			else:
+				branch += char
+			i += 1
+		branches.append(branch)
+		return branches
+
+	@staticmethod
+	def _planBranch(branch):
+		"""
+		Plans a single branch of an alternation.
+
+		Args:
+			branch (string): The branch
+
+		Returns:
+			tuple: A tuple with the evaluator class name and the literal value or None
+		"""
+		anchoredStart = branch.startswith('^')
+		if anchoredStart:
+			branch = branch[1:]
+		anchoredEnd = branch.endswith('$') and not RegexPlanner._isEscaped(
+		    branch,
+		    len(branch) - 1
+		)
+		if anchoredEnd:
+			branch = branch[:-1]
+		literal = RegexPlanner._literal(branch)
+		if not literal:
+			return None
+		if anchoredStart and anchoredEnd:
+			return ('FilterStringEquals', literal)
+		if anchoredStart:
+			return ('FilterStringBeginsWith', literal)
+		if anchoredEnd:
+			return ('FilterStringEndsWith', literal)
+		return ('FilterStringContains', literal)
+
+	@staticmethod
+	def _literal(pattern):
+		"""
+		Unescapes a pattern in case it only consists of literal characters.
+
+		Args:
+			pattern (string): The pattern
+
+		Returns:
+			string: The literal string or None
+		"""
+		literal = ''
+		i = 0
+		while i < len(pattern):
+			char = pattern[i]
+			if char == '\\':
+				if i + 1 >= len(pattern) or pattern[i + 1].isalnum():
+					return None
+				literal += pattern[i + 1]
+				i += 2
+				continue
+			if char in RegexPlanner.metaCharacters:
+				return None
+			literal += char
+			i += 1
+		return literal
+
+
+class FilterCache:
+	"""
+	An opt-in LRU cache for element IDs of filter results. Entries are keyed by document, scope and 
+	the normalized filter plan and are invalidated as soon as the :class:`revitron.document.DocumentRevision` 
+	of the document changes. The cache is bypassed while a transaction is open, since
+	uncommitted changes don't change the revision. 
+	
+	Enabling the cache also subscribes the revision tracking to the ``DocumentChanged`` event. 
+	In case the event is not available, only changes that are committed by Revitron transactions 
+	invalidate cached results::
+
+		revitron.FilterCache.enable(maxSize=256)
+		...
+		print(revitron.FilterCache.stats())
+		revitron.FilterCache.disable()
+	"""
+
+	enabled = False
+	maxSize = 128
+	hits = 0
+	misses = 0
+	_entries = OrderedDict()
+	_subscribed = False
+
+	@staticmethod
+	def enable(maxSize=128):
+		"""
+		Enables the cache.
+
+		Args:
+			maxSize (integer, optional): The maximum number of cached results. Defaults to 128.
+		"""
+		import revitron
+		FilterCache.enabled = True
+		FilterCache.maxSize = maxSize
+		if not FilterCache._subscribed:
+			FilterCache._subscribed = revitron.DocumentRevision.subscribe()
+
+	@staticmethod
+	def disable():
+		"""
+		Disables and clears the cache and releases its subscription of the revision tracking.
+		"""
+		import revitron
+		FilterCache.enabled = False
+		FilterCache.clear()
+		if FilterCache._subscribed:
+			revitron.DocumentRevision.unsubscribe()
+			FilterCache._subscribed = False
+
+	@staticmethod
+	def isActive(doc):
+		"""
+		Checks whether the cache is enabled and can be used for a given document.
+		The cache is not used while the document is modifiable.
+
+		Args:
+			doc (object): A Revit document
+
+		Returns:
+			boolean: True if the cache can be used
+		"""
+		return FilterCache.enabled and not doc.IsModifiable
+
+	@staticmethod
+	def clear():
+		"""
+		Removes all entries and resets the statistics.
+		"""
+		FilterCache._entries = OrderedDict()
+		FilterCache.hits = 0
+		FilterCache.misses = 0
+
+	@staticmethod
+	def stats():
+		"""
+		Returns the cache statistics.
+
+		Returns:
+			object: An ``AttrDict`` with the ``hits``, ``misses``, ``size`` and ``maxSize`` properties
+		"""
+		import revitron
+		return revitron.AttrDict(
+		    hits=FilterCache.hits,
+		    misses=FilterCache.misses,
+		    size=len(FilterCache._entries),
+		    maxSize=FilterCache.maxSize
+		)
+
+	@staticmethod
+	def getKey(fltr):
+		"""
+		Builds the cache key for a given filter. Since all filter stages are conjunctive, 
+		the plan is normalized by sorting the stages.
+
+		Args:
+			fltr (object): The Filter instance
+
+		Returns:
+			tuple: The cache key or None in case the filter can't be cached
+		"""
+		if fltr.scope is None:
+			scope = None
+		elif hasattr(fltr.scope, 'IntegerValue'):
+			scope = fltr.scope.IntegerValue
+		else:
+			scope = tuple(sorted([elementId.IntegerValue for elementId in fltr.scope]))
+		plan = []
+		for stage in fltr.stages:
+			if stage.args is None:
+				return None
+			plan.append(repr((stage.name, stage.args)))
+		return (fltr.doc, scope, tuple(sorted(plan)))
+
+	@staticmethod
+	def get(key):
+		"""
+		Returns the cached element IDs for a given key.
+
+		Args:
+			key (tuple): The cache key
+
+		Returns:
+			object: A list of element IDs or None
+		"""
+		import revitron
+		entry = FilterCache._entries.pop(key, None)
+		if entry is not None:
+			revision, ids = entry
+			if revision == revitron.DocumentRevision.get(key[0]):
+				FilterCache._entries[key] = entry
+				FilterCache.hits += 1
+				return ids
+		FilterCache.misses += 1
+		return None
+
+	@staticmethod
+	def set(key, ids):
+		"""
+		Stores a list of element IDs and removes the least recently used entries 
+		in case the cache exceeds the maximum size.
+
+		Args:
+			key (tuple): The cache key
+			ids (object): A collection of element IDs
+		"""
+		import revitron
+		FilterCache._entries.pop(key, None)
+		FilterCache._entries[key] = (
+		    revitron.DocumentRevision.get(key[0]), List[revitron.DB.ElementId](ids)
+		)
+		while len(FilterCache._entries) > FilterCache.maxSize:
+			FilterCache._entries.popitem(last=False)
+
+
+class FilterProfiler:
+	"""
+	A global switch for logging the explained plan of every filter 
+	as soon as its elements or element IDs are requested. 
+	Note that explaining a filter replays all of its stages and 
+	therefore adds a significant overhead to every filter while enabled::
+
+		revitron.FilterProfiler.enable()
+		...
+		revitron.FilterProfiler.disable()
+	"""
+
+	enabled = False
+	_active = False
+
+	@staticmethod
+	def enable():
+		"""
+		Enables logging the plans of all filters.
+		"""
+		FilterProfiler.enabled = True
+
+	@staticmethod
+	def disable():
+		"""
+		Disables logging the plans of all filters.
+		"""
+		FilterProfiler.enabled = False
+
+	@staticmethod
+	def format(plan):
+		"""
+		Formats an explained filter plan as a readable table.
+
+		Args:
+			plan (object): A plan as returned by :meth:`Filter.explain`
+
+		Returns:
+			string: The formatted plan
+		"""
+		lines = [
+		    '{:<24} {:>10} {:>10} {:>10} {:>10}'.format(
+		        'Stage', 'In', 'Out', 'Time (ms)', 'Setup (ms)'
+		    )
+		]
+		for stage in plan.stages:
+			lines.append(
+			    '{:<24} {:>10} {:>10} {:>10.1f} {:>10.1f}'.format(
+			        stage.name[:24],
+			        stage.countIn,
+			        stage.countOut,
+			        stage.time * 1000,
+			        stage.setupTime * 1000
+			    )
+			)
+		lines.append(
+		    'Elements: {}, Time: {:.1f} ms, Collectors: {}, Value providers: {}'.format(
+		        plan.count, plan.time * 1000, plan.collectors, plan.providers
+		    )
+		)
+		return '\n'.join(lines)
+
+	@staticmethod
+	def log(fltr):
+		"""
+		Logs the explained plan of a filter in case the profiler is enabled.
+		Filters that are used internally while explaining another filter are not logged.
+
+		Args:
+			fltr (object): A Filter instance
+		"""
+		import revitron
+		if not FilterProfiler.enabled or FilterProfiler._active:
+			return
+		FilterProfiler._active = True
+		try:
+			revitron.Log().info(FilterProfiler.format(fltr.explain()))
+		finally:
+			FilterProfiler._active = False
+
+
 class Filter:
 	""" 
 	A filter class based on the ``FilteredElementCollector`` class.
 	"""
 
-	def __init__(self, scope=None):
+	def __init__(self, scope=None, deferred=False):
 		"""
 		Inits a new Filter instance.
 
+		The scope can also be a collection of element IDs such as a ``List[ElementId]`` or ``HashSet[ElementId]`` 
+		or another filter. Collections of element IDs are passed to the collector without being copied.
+		An empty collection of element IDs or an empty filter results in an empty collection, 
+		while an empty list is ignored and includes all elements.
+
 		Args:
-			scope (Element ID or list of elements, optional): The optional scope. It can be either a view Id or a list of elements. Defaults to None.
+			scope (Element ID or list of elements, optional): The optional scope. It can be either a view Id, a list of elements or a collection of element IDs. Defaults to None.
+			deferred (bool, optional): Only record filter stages and execute them at once when requesting the result. Defaults to False.
 		"""
 		import revitron
+		self.doc = revitron.DOC
+		self.collectors = 0
 		if scope is not None:
-			if scope:
-				if type(scope) == list:
-					elementIds = []
-					for element in scope:
-						elementIds.append(element.Id)
-					scope = List[revitron.DB.ElementId](elementIds)
-				self.collector = revitron.DB.FilteredElementCollector(revitron.DOC, scope)
-			else:
+			if type(scope) == list and not scope:
 				logger = revitron.Log()
 				logger.warning(
 				    'Provided scope for filter is empty! Therefore the filter will be initialized with all elements included.'
 				)
-				self.collector = revitron.DB.FilteredElementCollector(revitron.DOC)
+				self.collector = self._createCollector()
+			else:
+				scope = self._toElementIds(scope)
+				if hasattr(scope, 'Count') and not scope.Count:
+					self.collector = self._createCollector()
+					self._none()
+				else:
+					self.collector = self._createCollector(scope)
 		else:
-			self.collector = revitron.DB.FilteredElementCollector(revitron.DOC)
+			self.collector = self._createCollector()
 		self.scope = scope
+		self.deferred = deferred
+		self.stages = []
+		self.executed = []
+		self._pending = []
+
+	def _createCollector(self, scope=None):
+		"""
+		Creates a new collector for the document of the filter and keeps track of the number of created collectors.
+
+		Args:
+			scope (object, optional): A view ID or a collection of element IDs. Defaults to None.
+
+		Returns:
+			object: A ``FilteredElementCollector``
+		"""
+		import revitron
+		self.collectors += 1
+		if scope is None:
+			return revitron.DB.FilteredElementCollector(self.doc)
+		return revitron.DB.FilteredElementCollector(self.doc, scope)
+
+	def _toElementIds(self, items):
+		"""
+		Converts a list of elements or element IDs or a filter into a collection of element IDs. 
+		A single element ID as well as collections of element IDs are returned unchanged.
+
+		Args:
+			items (mixed): A list of elements or element IDs, a filter or a collection of element IDs
+
+		Returns:
+			object: A collection of element IDs
+		"""
+		import revitron
+		if isinstance(items, Filter):
+			return items.getElementIds()
+		if type(items) == list:
+			elementIds = []
+			for item in items:
+				if isinstance(item, revitron.DB.ElementId):
+					elementIds.append(item)
+				else:
+					elementIds.append(item.Id)
+			return List[revitron.DB.ElementId](elementIds)
+		return items
+
+	def _toCollector(self, items):
+		"""
+		Returns an iterable collector for a filter or a collection of elements or element IDs.
+
+		Args:
+			items (mixed): A list of elements or element IDs, a filter or a collection of element IDs
+
+		Returns:
+			object: A ``FilteredElementCollector`` or None in case the collection is empty
+		"""
+		if isinstance(items, Filter):
+			items._prepare()
+			return items.collector
+		ids = self._toElementIds(items)
+		if not ids.Count:
+			return None
+		other = Filter(ids)
+		other._prepare()
+		self.collectors += other.collectors
+		return other.collector
+
+	def _applyNow(self, stage):
+		"""
+		Executes all pending stages and applies a stage immediately, also in deferred filters. 
+		This is required for all stages that can't be reordered such as set operations.
+
+		Args:
+			stage (object): A FilterStage instance
+
+		Returns:
+			object: The Filter instance
+		"""
+		self._prepare()
+		self.stages.append(stage)
+		self._run(stage)
+		return self
+
+	def _addStage(self, stage):
+		"""
+		Adds a stage to the filter plan. The stage is applied immediately unless the filter is deferred.
+
+		Args:
+			stage (object): A FilterStage instance
+
+		Returns:
+			object: The Filter instance
+		"""
+		self.stages.append(stage)
+		if self.deferred:
+			self._pending.append(stage)
+		else:
+			self._run(stage)
+		return self
+
+	def _run(self, stage):
+		"""
+		Applies a stage and adds it to the list of executed stages.
+
+		Args:
+			stage (object): A FilterStage instance
+		"""
+		stage.apply(self)
+		self.executed.append(stage)
+
+	def _execute(self):
+		"""
+		Executes all pending stages of a deferred filter.
+		"""
+		if not self._pending:
+			return
+		stages = self._optimize(self._pending)
+		self._pending = []
+		for stage in stages:
+			self._run(stage)
+
+	def _optimize(self, stages):
+		"""
+		Sorts a list of stages by their kind and fuses all fusable parameter rules 
+		into a single ``ElementParameterFilter``.
+
+		Args:
+			stages (list): The list of FilterStage instances
+
+		Returns:
+			list: The optimized list of stages
+		"""
+		import revitron
+		db = revitron.DB
+		stages = sorted(stages, key=lambda stage: stage.kind)
+		fusable = [
+		    stage for stage in stages
+		    if isinstance(stage, ParameterFilterStage) and stage.isFusable()
+		]
+		if len(fusable) < 2:
+			return stages
+		rules = [stage.rules[0] for stage in fusable]
+		fused = FilterStage(
+		    'fused',
+		    tuple([(stage.name, stage.args) for stage in fusable]),
+		    FilterStage.PARAMETER,
+		    elementFilter=db.ElementParameterFilter(List[db.FilterRule](rules))
+		)
+		optimized = [stage for stage in stages if stage not in fusable]
+		optimized.append(fused)
+		return sorted(optimized, key=lambda stage: stage.kind)
 
 	def _all(self):
 		"""
@@ -91,54 +820,73 @@ class Filter:
 			value (number): the value
 			evaluator (object): The evaluator object
 			invert (boolean): Inverts the filter
+
+		Returns:
+			object: The Filter instance
 		"""
-		import revitron
-		filters = []
+		return self._addStage(
+		    self._parameterStage(filterRule, paramName, value, evaluator, invert)
+		)
 
-		# Since a visible parameter name could match multiple built-in parameters,
-		# we get a list of value providers.
-		# While iterating that list, the parameter filter is applied each time
-		# to a fresh element collector that will be later merged or intersected with the others.
-		for valueProvider in revitron.ParameterValueProviders(paramName).get():
-			# Build filter rule based on filter type.
-			if 'Double' in str(filterRule):
-				rule = filterRule(valueProvider, evaluator, value, 0.001)
-			elif 'Integer' in str(filterRule):
-				rule = filterRule(valueProvider, evaluator, value)
-			else:
-				try:
-					rule = filterRule(valueProvider, evaluator, value, True)
-				except:
-					rule = filterRule(valueProvider, evaluator, value)
-			_ids = self.getElementIds()
-			if _ids:
-				_filter = Filter()
-				_filter.collector = revitron.DB.FilteredElementCollector(
-				    revitron.DOC, _ids
-				)
-				_filter._parameterFilter(rule, invert)
-				filters.append(_filter)
+	def _createRule(self, filterRule, valueProvider, evaluator, value, caseSensitive=True):
+		"""
+		Creates a filter rule for a given value provider.
 
-		if len(filters):
-			self.collector = filters[0].collector
-			if len(filters) > 1:
-				for i in range(1, len(filters)):
-					if not invert:
-						self.collector.UnionWith(filters[i].collector)
-					else:
-						self.collector.IntersectWith(filters[i].collector)
+		Args:
+			filterRule (class): A Revit filter rule class
+			valueProvider (object): A parameter value provider
+			evaluator (object): The evaluator object
+			value (mixed): The value
+			caseSensitive (bool, optional): Compare strings case sensitive. Defaults to True.
+
+		Returns:
+			object: The filter rule
+		"""
+		if 'Double' in str(filterRule):
+			return filterRule(valueProvider, evaluator, value, 0.001)
+		if 'Integer' in str(filterRule):
+			return filterRule(valueProvider, evaluator, value)
+		try:
+			return filterRule(valueProvider, evaluator, value, caseSensitive)
+		except:
+			return filterRule(valueProvider, evaluator, value)
 
-	def _parameterFilter(self, rule, invert=False):
+	def _parameterStage(
+	    self, filterRule, paramName, value, evaluator, invert=False, caseSensitive=True
+	):
 		"""
-		Applies a parameter filter.
+		Creates a parameter filter stage.
+
+		Since a visible parameter name could match multiple built-in parameters,
+		a rule is created for each value provider.
 
 		Args:
-			rule (object): The filter rule object
+			filterRule (class): A Revit filter rule class
+			paramName (string): The parameter name
+			value (number): the value
+			evaluator (object): The evaluator object
 			invert (boolean): Inverts the filter
+			caseSensitive (bool, optional): Compare strings case sensitive. Defaults to True.
+
+		Returns:
+			object: The ParameterFilterStage instance
 		"""
 		import revitron
-		parameterFilter = revitron.DB.ElementParameterFilter(rule, invert)
-		self.collector = self.collector.WherePasses(parameterFilter)
+		started = time.time()
+		rules = []
+		providers = revitron.ParameterValueProviders(paramName).get()
+		for valueProvider in providers:
+			rules.append(
+			    self._createRule(
+			        filterRule, valueProvider, evaluator, value, caseSensitive
+			    )
+			)
+		stage = ParameterFilterStage(
+		    type(evaluator).__name__, (paramName, value, invert), rules, invert
+		)
+		stage.providers = len(providers)
+		stage.setupTime = time.time() - started
+		return stage
 
 	def _getNumericFilterValue(self, value, paramName):
 		"""
@@ -149,137 +897,543 @@ class Filter:
 			paramName (string): The parameter name
 
 		Returns:
-			object: A filter value of the correct type
+			object: A filter value of the correct type
+		"""
+		from revitron import ParameterUtils
+		if ParameterUtils.getStorageType(paramName) == 'Integer':
+			return int(value)
+		return float(value)
+
+	def _getNumericFilterRule(self, paramName):
+		"""
+		Get the correct numeric filter rule based on the storage type of a given parameter.
+
+		Args:
+			paramName (string): The parameter name
+
+		Returns:
+			object: A filter rule object for double or integer
+		"""
+		from revitron import DB, ParameterUtils
+		if ParameterUtils.getStorageType(paramName) == 'Integer':
+			return DB.FilterIntegerRule
+		return DB.FilterDoubleRule
+
+	def byIntersection(self, element):
+		"""
+		Reduces the set of elements to the ones that are intersecting a given element.
+
+		Args:
+			element (objetc): A Revit element
+
+		Returns:
+			object: The Filter instance
+		"""
+		import revitron
+		return self._addStage(
+		    FilterStage(
+		        'byIntersection', (element.Id.IntegerValue, ),
+		        FilterStage.SLOW,
+		        elementFilter=revitron.DB.ElementIntersectsElementFilter(element)
+		    )
+		)
+
+	def _none(self):
+		"""
+		This is just a helper filter that removes all elements from the collection.
+
+		Returns:
+			object: The Filter instance
+		"""
+		import revitron
+		db = revitron.DB
+		f = db.LogicalAndFilter(
+		    db.ElementIsElementTypeFilter(False), db.ElementIsElementTypeFilter(True)
+		)
+
+		self.collector = self.collector.WherePasses(f)
+		return self
+
+	def _setElementIds(self, ids):
+		"""
+		Replaces the collection with a new collector that is scoped to a given collection of element IDs.
+
+		Args:
+			ids (object): A collection of element IDs
+		"""
+		import revitron
+		if ids.Count:
+			self.collector = self._createCollector(ids)
+		else:
+			self._none()
+
+	def byRegex(self, paramName, regex, invert=False):
+		"""
+		Filters a collection by a given regex. 
+
+		Simple patterns such as anchored prefixes and suffixes, literal strings or alternations of literals 
+		are rewritten into native case insensitive string filter rules for string parameters. 
+		All other patterns are compiled once and matched in Python against the parameter values of all elements.
+
+		Args:
+			paramName (string): The name of the parameter to be matched. 
+			regex (string): The regex. 
+			invert (bool, optional): Inverts the filter. Defaults to False.
+
+		Returns:
+			object: The Filter instance
+		"""
+		import revitron
+		from revitron import ParameterUtils
+		plan = None
+		if not invert:
+			plan = RegexPlanner.plan(regex)
+		# Only resolve the storage type in case the pattern can actually be pushed down.
+		if plan and ParameterUtils.getStorageType(paramName) == 'String':
+			filters = []
+			for evaluatorName, value in plan:
+				stage = self._parameterStage(
+				    revitron.DB.FilterStringRule,
+				    paramName,
+				    value,
+				    getattr(revitron.DB, evaluatorName)(),
+				    caseSensitive=False
+				)
+				filters.extend(stage.getElementFilters())
+			if filters:
+				return self._addStage(
+				    FilterStage(
+				        'byRegex', (paramName, regex, invert),
+				        FilterStage.PARAMETER,
+				        elementFilter=FilterStage.combine(filters)
+				    )
+				)
+		return self._addStage(
+		    FilterStage(
+		        'byRegex', (paramName, regex, invert),
+		        FilterStage.SCRIPT,
+		        callback=lambda fltr: fltr._regex(paramName, regex, invert)
+		    )
+		)
+
+	def _regex(self, paramName, regex, invert=False):
+		"""
+		Applies a regex filter to the current collection. 
+
+		Args:
+			paramName (string): The name of the parameter to be matched. 
+			regex (string): The regex. 
+			invert (bool, optional): Inverts the filter. Defaults to False.
+		"""
+		import revitron
+		db = revitron.DB
+
+		pattern = re.compile(regex, re.IGNORECASE)
+		try:
+			bip = getattr(db.BuiltInParameter, paramName)
+		except:
+			bip = None
+		ids = List[db.ElementId]()
+
+		for element in self.iterElements():
+			parameter = element.LookupParameter(paramName)
+			if parameter is None and bip is not None:
+				parameter = element.get_Parameter(bip)
+			if parameter is None or not parameter.HasValue:
+				continue
+			value = parameter.AsString()
+			if not value:
+				value = parameter.AsValueString()
+			if value:
+				if bool(pattern.search(value)) != invert:
+					ids.Add(element.Id)
+
+		self._setElementIds(ids)
+
+	def byCategory(self, name):
+		"""
+		Filters the collection by a category name or a built-in category name.
+		
+		Note that there are basically three valid types that can be used as the filter argument. 
+		The first two use the name of a built-in category (with or without the ``OST_`` prefix)::
+
+			fltr = revitron.Filter().byCategory('Walls')
+			fltr = revitron.Filter().byCategory('OST_Walls')
+
+		The third type uses a `natural <https://docs.google.com/spreadsheets/d/1uNa77XYLjeN-1c63gsX6C5D5Pvn_3ZB4B0QMgPeloTw/edit#gid=1549586957>`_ 
+		category name to find a corresponding built-in category to filter, here ``OST_BeamAnalyticalTags``::
+
+			fltr = revitron.Filter().byCategory('Analytical Beam Tags')
+
+		Args:
+			name (string): A category or built-in category name
+
+		Returns:
+			object: The Filter instance
+		"""
+		import revitron
+		try:
+			elementFilter = revitron.DB.ElementCategoryFilter(
+			    revitron.BuiltInCategory(name).get()
+			)
+		except:
+			return self
+		return self._addStage(
+		    FilterStage(
+		        'byCategory', (name, ), FilterStage.QUICK, elementFilter=elementFilter
+		    )
+		)
+
+	def byClass(self, cls):
+		"""
+		Filters the collection by class.
+
+		Example::
+
+			fltr = revitron.Filter()
+			cls = Autodesk.Revit.DB.CurveElement
+			ids = fltr.byClass(cls).noTypes().getElementIds()
+
+		Alternatively it is also possible to use a class name as string instead::
+
+			fltr = revitron.Filter()
+			ids = fltr.byClass('CurveElement').noTypes().getElementIds()
+
+		Args:
+			cls (class): A class or class name to filter the elements
+
+		Returns:
+			object: The Filter instance
+		"""
+		import revitron
+		if isinstance(cls, basestring):
+			import Autodesk.Revit.DB
+			cls = getattr(Autodesk.Revit.DB, cls)
+		return self._addStage(
+		    FilterStage(
+		        'byClass', (cls.__name__, ),
+		        FilterStage.QUICK,
+		        elementFilter=revitron.DB.ElementClassFilter(cls)
+		    )
+		)
+
+	def _toOutline(self, bbox):
+		"""
+		Converts a bounding box into an ``Outline`` object. Transformed bounding boxes are converted
+		into an outline enclosing all transformed corners.
+
+		Args:
+			bbox (object): A Revitron bounding box, a Revit ``BoundingBoxXYZ`` or a Revit ``Outline``
+
+		Returns:
+			object: The outline
+		"""
+		import revitron
+		db = revitron.DB
+		if isinstance(bbox, db.Outline):
+			return bbox
+		if isinstance(bbox, revitron.BoundingBox):
+			bbox = bbox.bbox
+		transform = bbox.Transform
+		if transform is None or transform.IsIdentity:
+			return db.Outline(bbox.Min, bbox.Max)
+		corners = []
+		for x in [bbox.Min.X, bbox.Max.X]:
+			for y in [bbox.Min.Y, bbox.Max.Y]:
+				for z in [bbox.Min.Z, bbox.Max.Z]:
+					corners.append(transform.OfPoint(db.XYZ(x, y, z)))
+		return db.Outline(
+		    db.XYZ(
+		        min([c.X for c in corners]),
+		        min([c.Y for c in corners]),
+		        min([c.Z for c in corners])
+		    ),
+		    db.XYZ(
+		        max([c.X for c in corners]),
+		        max([c.Y for c in corners]),
+		        max([c.Z for c in corners])
+		    )
+		)
+
+	def _outlineArgs(self, outline):
+		"""
+		Returns the coordinates of an outline as tuple to be used as stage arguments.
+
+		Args:
+			outline (object): A Revit outline
+
+		Returns:
+			tuple: The coordinates of the minimum and maximum points
+		"""
+		return (
+		    outline.MinimumPoint.X,
+		    outline.MinimumPoint.Y,
+		    outline.MinimumPoint.Z,
+		    outline.MaximumPoint.X,
+		    outline.MaximumPoint.Y,
+		    outline.MaximumPoint.Z
+		)
+
+	def _getElementIdByName(self, item, cls):
+		"""
+		Returns the element ID of an element that can be passed as element, element ID or name.
+
+		Args:
+			item (mixed): An element, an element ID or an element name
+			cls (class): The class of the element in case a name is passed
+
+		Returns:
+			object: The element ID or None
+		"""
+		import revitron
+		if isinstance(item, revitron.DB.ElementId):
+			return item
+		if not isinstance(item, basestring):
+			return item.Id
+		with revitron.Document(self.doc):
+			for element in Filter().byClass(cls).getElements():
+				if element.Name == item:
+					return element.Id
+		return None
+
+	def byBoundingBoxIntersects(self, bbox, tolerance=0.0, invert=False):
+		"""
+		Filters the collection by elements with a bounding box that intersects a given bounding box.
+		This is a fast quick filter that is applied before elements are expanded in memory.
+
+		Example::
+
+			bbox = _(scopeBox).getBbox()
+			ids = revitron.Filter().byBoundingBoxIntersects(bbox).noTypes().getElementIds()
+
+		Args:
+			bbox (object): A Revitron bounding box, a Revit ``BoundingBoxXYZ`` or a Revit ``Outline``
+			tolerance (float, optional): The tolerance. Defaults to 0.0.
+			invert (bool, optional): Inverts the filter. Defaults to False.
+
+		Returns:
+			object: The Filter instance
+		"""
+		import revitron
+		outline = self._toOutline(bbox)
+		return self._addStage(
+		    FilterStage(
+		        'byBoundingBoxIntersects',
+		        (self._outlineArgs(outline), tolerance, invert),
+		        FilterStage.QUICK,
+		        elementFilter=revitron.DB.BoundingBoxIntersectsFilter(
+		            outline, tolerance, invert
+		        )
+		    )
+		)
+
+	def byBoundingBoxInside(self, bbox, tolerance=0.0, invert=False):
+		"""
+		Filters the collection by elements with a bounding box that is entirely inside a given bounding box.
+		This is a fast quick filter that is applied before elements are expanded in memory.
+
+		Args:
+			bbox (object): A Revitron bounding box, a Revit ``BoundingBoxXYZ`` or a Revit ``Outline``
+			tolerance (float, optional): The tolerance. Defaults to 0.0.
+			invert (bool, optional): Inverts the filter. Defaults to False.
+
+		Returns:
+			object: The Filter instance
 		"""
-		from revitron import ParameterUtils
-		if ParameterUtils.getStorageType(paramName) == 'Integer':
-			return int(value)
-		return float(value)
+		import revitron
+		outline = self._toOutline(bbox)
+		return self._addStage(
+		    FilterStage(
+		        'byBoundingBoxInside', (self._outlineArgs(outline), tolerance, invert),
+		        FilterStage.QUICK,
+		        elementFilter=revitron.DB.BoundingBoxIsInsideFilter(
+		            outline, tolerance, invert
+		        )
+		    )
+		)
 
-	def _getNumericFilterRule(self, paramName):
+	def byOutline(self, minPoint, maxPoint, inside=False, invert=False):
 		"""
-		Get the correct numeric filter rule based on the storage type of a given parameter.
+		Filters the collection by elements with a bounding box that intersects or is inside of an outline 
+		that is defined by two points.
+
+		Example::
+
+			p1 = revitron.DB.XYZ(0, 0, 0)
+			p2 = revitron.DB.XYZ(100, 100, 10)
+			ids = revitron.Filter().byOutline(p1, p2, inside=True).noTypes().getElementIds()
 
 		Args:
-			paramName (string): The parameter name
+			minPoint (object): The minimum point
+			maxPoint (object): The maximum point
+			inside (bool, optional): Only keep elements that are entirely inside the outline. Defaults to False.
+			invert (bool, optional): Inverts the filter. Defaults to False.
 
 		Returns:
-			object: A filter rule object for double or integer
+			object: The Filter instance
 		"""
-		from revitron import DB, ParameterUtils
-		if ParameterUtils.getStorageType(paramName) == 'Integer':
-			return DB.FilterIntegerRule
-		return DB.FilterDoubleRule
+		import revitron
+		outline = revitron.DB.Outline(minPoint, maxPoint)
+		if inside:
+			return self.byBoundingBoxInside(outline, invert=invert)
+		return self.byBoundingBoxIntersects(outline, invert=invert)
 
-	def byIntersection(self, element):
+	def byCategories(self, names, invert=False):
 		"""
-		Reduces the set of elements to the ones that are intersecting a given element.
+		Filters the collection by multiple category names or built-in category names.
+		The same names as for the ``byCategory()`` method can be used::
+
+			fltr = revitron.Filter().byCategories(['Walls', 'OST_Doors', 'Windows'])
 
 		Args:
-			element (objetc): A Revit element
+			names (list): A list of category or built-in category names
+			invert (bool, optional): Inverts the filter. Defaults to False.
 
 		Returns:
 			object: The Filter instance
 		"""
 		import revitron
-		self.collector = self.collector.WherePasses(
-		    revitron.DB.ElementIntersectsElementFilter(element)
+		db = revitron.DB
+		categories = []
+		for name in names:
+			bic = revitron.BuiltInCategory(name).get()
+			if bic is not None:
+				categories.append(bic)
+		if not categories:
+			return self
+		return self._addStage(
+		    FilterStage(
+		        'byCategories', (tuple(sorted(names)), invert),
+		        FilterStage.QUICK,
+		        elementFilter=db.ElementMulticategoryFilter(
+		            List[db.BuiltInCategory](categories), invert
+		        )
+		    )
 		)
-		return self
 
-	def byRegex(self, paramName, regex, invert=False):
+	def byDesignOption(self, designOption, invert=False):
 		"""
-		Filters a collection by a given regex. 
+		Filters the collection by a design option.
 
 		Args:
-			paramName (string): The name of the parameter to be matched. 
-			regex (string): The regex. 
+			designOption (mixed): A design option element, its ID or its name
 			invert (bool, optional): Inverts the filter. Defaults to False.
 
 		Returns:
 			object: The Filter instance
 		"""
 		import revitron
+		db = revitron.DB
+		designOptionId = self._getElementIdByName(designOption, db.DesignOption)
+		if designOptionId is None:
+			return self
+		return self._addStage(
+		    FilterStage(
+		        'byDesignOption', (designOptionId.IntegerValue, invert),
+		        FilterStage.QUICK,
+		        elementFilter=db.ElementDesignOptionFilter(designOptionId, invert)
+		    )
+		)
 
-		passed = []
-		failed = []
-
-		for element in self.getElements():
-			value = revitron.Parameter(element, paramName).getString()
-			if not value:
-				value = revitron.Parameter(element, paramName).getValueString()
-			if value:
-				if re.search(regex, value, re.IGNORECASE):
-					passed.append(element)
-				else:
-					failed.append(element)
-
-		if not invert:
-			elements = passed
-		else:
-			elements = failed
-
-		if elements:
-			self.collector = Filter(elements).collector
-
-		return self
-
-	def byCategory(self, name):
+	def byLevel(self, level, invert=False):
 		"""
-		Filters the collection by a category name or a built-in category name.
+		Filters the collection by a level. 
 		
-		Note that there are basically three valid types that can be used as the filter argument. 
-		The first two use the name of a built-in category (with or without the ``OST_`` prefix)::
-
-			fltr = revitron.Filter().byCategory('Walls')
-			fltr = revitron.Filter().byCategory('OST_Walls')
+		Note that the underlying ``ElementLevelFilter`` is a slow filter, 
+		that is executed together with parameter filters in deferred filters.
 
-		The third type uses a `natural <https://docs.google.com/spreadsheets/d/1uNa77XYLjeN-1c63gsX6C5D5Pvn_3ZB4B0QMgPeloTw/edit#gid=1549586957>`_ 
-		category name to find a corresponding built-in category to filter, here ``OST_BeamAnalyticalTags``::
+		Example::
 
-			fltr = revitron.Filter().byCategory('Analytical Beam Tags')
+			ids = revitron.Filter().byCategory('Rooms').byLevel('Level 1').noTypes().getElementIds()
 
 		Args:
-			name (string): A category or built-in category name
+			level (mixed): A level element, its ID or its name
+			invert (bool, optional): Inverts the filter. Defaults to False.
 
 		Returns:
 			object: The Filter instance
 		"""
 		import revitron
-		try:
-			self.collector = self.collector.OfCategory(
-			    revitron.BuiltInCategory(name).get()
-			)
-		except:
-			pass
-		return self
+		db = revitron.DB
+		levelId = self._getElementIdByName(level, db.Level)
+		if levelId is None:
+			return self
+		return self._addStage(
+		    FilterStage(
+		        'byLevel', (levelId.IntegerValue, invert),
+		        FilterStage.PARAMETER,
+		        elementFilter=db.ElementLevelFilter(levelId, invert)
+		    )
+		)
 
-	def byClass(self, cls):
+	def byPhase(self, phase, statuses=None, invert=False):
 		"""
-		Filters the collection by class.
+		Filters the collection by the status of elements on a given phase. By default all elements
+		that are either new or existing on the given phase are kept. 
 
 		Example::
 
-			fltr = revitron.Filter()
-			cls = Autodesk.Revit.DB.CurveElement
-			ids = fltr.byClass(cls).noTypes().getElementIds()
+			fltr = revitron.Filter().byPhase('New Construction', ['New', 'Demolished'])
 
-		Alternatively it is also possible to use a class name as string instead::
+		Args:
+			phase (mixed): A phase element, its ID or its name
+			statuses (list, optional): A list of `ElementOnPhaseStatus <https://www.revitapidocs.com/2020/f78b2ff9-a2ca-4e0e-b5c4-6e94b9ba3bc6.htm>`_ names. Defaults to ``['New', 'Existing']``.
+			invert (bool, optional): Inverts the filter. Defaults to False.
 
-			fltr = revitron.Filter()
-			ids = fltr.byClass('CurveElement').noTypes().getElementIds()
+		Returns:
+			object: The Filter instance
+		"""
+		import revitron
+		db = revitron.DB
+		if not statuses:
+			statuses = ['New', 'Existing']
+		phaseId = self._getElementIdByName(phase, db.Phase)
+		if phaseId is None:
+			return self
+		onPhaseStatuses = List[db.ElementOnPhaseStatus](
+		    [getattr(db.ElementOnPhaseStatus, status) for status in statuses]
+		)
+		return self._addStage(
+		    FilterStage(
+		        'byPhase', (phaseId.IntegerValue, tuple(sorted(statuses)), invert),
+		        FilterStage.PARAMETER,
+		        elementFilter=db.ElementPhaseStatusFilter(phaseId, onPhaseStatuses, invert)
+		    )
+		)
+
+	def byWorkset(self, workset, invert=False):
+		"""
+		Filters the collection by a user workset.
 
 		Args:
-			cls (class): A class or class name to filter the elements
+			workset (mixed): A workset, a workset ID or a workset name
+			invert (bool, optional): Inverts the filter. Defaults to False.
 
 		Returns:
 			object: The Filter instance
 		"""
-		if isinstance(cls, basestring):
-			import Autodesk.Revit.DB
-			cls = getattr(Autodesk.Revit.DB, cls)
-		self.collector = self.collector.OfClass(cls)
-		return self
+		import revitron
+		db = revitron.DB
+		worksetId = None
+		if isinstance(workset, db.WorksetId):
+			worksetId = workset
+		elif isinstance(workset, basestring):
+			collector = db.FilteredWorksetCollector(self.doc).OfKind(db.WorksetKind.UserWorkset)
+			for item in collector:
+				if item.Name == workset:
+					worksetId = item.Id
+					break
+		else:
+			worksetId = workset.Id
+		if worksetId is None:
+			return self
+		return self._addStage(
+		    FilterStage(
+		        'byWorkset', (worksetId.IntegerValue, invert),
+		        FilterStage.QUICK,
+		        elementFilter=db.ElementWorksetFilter(worksetId, invert)
+		    )
+		)
 
 	def byNumberIsGreater(self, paramName, value, invert=False):
 		"""
@@ -299,14 +1453,13 @@ class Filter:
 			object: The collector
 		"""
 		import revitron
-		self._applyFilter(
+		return self._applyFilter(
 		    self._getNumericFilterRule(paramName),
 		    paramName,
 		    self._getNumericFilterValue(value, paramName),
 		    revitron.DB.FilterNumericGreater(),
 		    invert
 		)
-		return self
 
 	def byNumberIsGreaterOrEqual(self, paramName, value, invert=False):
 		"""
@@ -327,14 +1480,13 @@ class Filter:
 			object: The collector
 		"""
 		import revitron
-		self._applyFilter(
+		return self._applyFilter(
 		    self._getNumericFilterRule(paramName),
 		    paramName,
 		    self._getNumericFilterValue(value, paramName),
 		    revitron.DB.FilterNumericGreaterOrEqual(),
 		    invert
 		)
-		return self
 
 	def byNumberIsEqual(self, paramName, value, invert=False):
 		"""
@@ -354,14 +1506,13 @@ class Filter:
 			object: The collector
 		"""
 		import revitron
-		self._applyFilter(
+		return self._applyFilter(
 		    self._getNumericFilterRule(paramName),
 		    paramName,
 		    self._getNumericFilterValue(value, paramName),
 		    revitron.DB.FilterNumericEquals(),
 		    invert
 		)
-		return self
 
 	def byNumberIsLess(self, paramName, value, invert=False):
 		"""
@@ -381,14 +1532,13 @@ class Filter:
 			object: The collector
 		"""
 		import revitron
-		self._applyFilter(
+		return self._applyFilter(
 		    self._getNumericFilterRule(paramName),
 		    paramName,
 		    self._getNumericFilterValue(value, paramName),
 		    revitron.DB.FilterNumericLess(),
 		    invert
 		)
-		return self
 
 	def byNumberIsLessOrEqual(self, paramName, value, invert=False):
 		"""
@@ -408,14 +1558,13 @@ class Filter:
 			object: The collector
 		"""
 		import revitron
-		self._applyFilter(
+		return self._applyFilter(
 		    self._getNumericFilterRule(paramName),
 		    paramName,
 		    self._getNumericFilterValue(value, paramName),
 		    revitron.DB.FilterNumericLessOrEqual(),
 		    invert
 		)
-		return self
 
 	def byOneInCsv(self, evaluatorName, paramName, csv, invert=False):
 		"""
@@ -427,6 +1576,9 @@ class Filter:
 		.. note:: that by setting ``invert`` to ``True``, all elements that match one of the items will be 
 			removed from the collection.
 
+		The rules of all items are combined into a single ``LogicalOrFilter``, or a ``LogicalAndFilter`` when inverted,
+		and therefore the collection is only filtered once.
+
 		Args:
 			evaluatorName (method): The filter method to be used to filter
 			paramName (string): The name of the parameter 
@@ -436,20 +1588,62 @@ class Filter:
 		Returns:
 			object: The Filter instance
 		"""
+		evaluator = getattr(Filter, evaluatorName)
+		args = (evaluatorName, paramName, csv, invert)
+		filters = []
+		for item in csv.split(','):
+			probe = evaluator(Filter(deferred=True), paramName, item.strip(), invert)
+			for stage in probe.stages:
+				if isinstance(stage, ParameterFilterStage):
+					filters.extend(stage.getElementFilters())
+				elif stage.elementFilter is not None:
+					filters.append(stage.elementFilter)
+				else:
+					filters = None
+					break
+			if filters is None:
+				break
+		if filters is not None:
+			return self._addStage(
+			    FilterStage(
+			        'byOneInCsv',
+			        args,
+			        FilterStage.PARAMETER,
+			        elementFilter=FilterStage.combine(filters, invert)
+			    )
+			)
+		# Fall back to filtering item by item in case the evaluator doesn't provide
+		# element filters that can be combined.
+		return self._addStage(
+		    FilterStage(
+		        'byOneInCsv', args,
+		        FilterStage.SCRIPT,
+		        callback=lambda fltr: fltr._oneInCsv(evaluatorName, paramName, csv, invert)
+		    )
+		)
+
+	def _oneInCsv(self, evaluatorName, paramName, csv, invert=False):
+		"""
+		Applies a CSV filter to the current collection. 
+
+		Args:
+			evaluatorName (method): The filter method to be used to filter
+			paramName (string): The name of the parameter 
+			csv (string): A comma separated list of items 
+			invert (bool, optional): Inverts the filter. Defaults to False.
+		"""
 		import revitron
 
 		evaluator = getattr(Filter, evaluatorName)
 
 		filters = []
+		# Read the IDs directly since this stage is still executing and must neither
+		# be cached nor profiled.
+		ids = self.collector.ToElementIds()
 		for item in csv.split(','):
-			_filter = Filter()
-			try:
-				_filter.collector = revitron.DB.FilteredElementCollector(
-				    revitron.DOC, self.getElementIds()
-				)
-			except:
-				_filter.collector = revitron.DB.FilteredElementCollector(revitron.DOC)
+			_filter = Filter(ids)
 			_filter = evaluator(_filter, paramName, item.strip(), invert)
+			self.collectors += _filter.collectors
 			filters.append(_filter)
 
 		if len(filters):
@@ -460,7 +1654,6 @@ class Filter:
 						self.collector.UnionWith(filters[i].collector)
 					else:
 						self.collector.IntersectWith(filters[i].collector)
-		return self
 
 	def byStringContains(self, paramName, value, invert=False):
 		"""
@@ -481,14 +1674,13 @@ class Filter:
 			object: The collector
 		"""
 		import revitron
-		self._applyFilter(
+		return self._applyFilter(
 		    revitron.DB.FilterStringRule,
 		    paramName,
 		    value,
 		    revitron.DB.FilterStringContains(),
 		    invert
 		)
-		return self
 
 	def byStringContainsOneInCsv(self, paramName, csv, invert=False):
 		"""
@@ -532,14 +1724,13 @@ class Filter:
 			object: The collector
 		"""
 		import revitron
-		self._applyFilter(
+		return self._applyFilter(
 		    revitron.DB.FilterStringRule,
 		    paramName,
 		    value,
 		    revitron.DB.FilterStringEquals(),
 		    invert
 		)
-		return self
 
 	def byStringEqualsOneInCsv(self, paramName, csv, invert=False):
 		"""
@@ -584,14 +1775,13 @@ class Filter:
 			object: The collector
 		"""
 		import revitron
-		self._applyFilter(
+		return self._applyFilter(
 		    revitron.DB.FilterStringRule,
 		    paramName,
 		    value,
 		    revitron.DB.FilterStringBeginsWith(),
 		    invert
 		)
-		return self
 
 	def byStringEndsWith(self, paramName, value, invert=False):
 		"""
@@ -606,40 +1796,413 @@ class Filter:
 			object: The collector
 		"""
 		import revitron
-		self._applyFilter(
+		return self._applyFilter(
 		    revitron.DB.FilterStringRule,
 		    paramName,
 		    value,
 		    revitron.DB.FilterStringEndsWith(),
 		    invert
 		)
-		return self
 
-	def getElements(self):
+	def _prepare(self):
+		"""
+		Executes all pending stages and makes sure that the collector can be iterated 
+		by applying the ``_all()`` filter in case no filter has been applied yet.
+		"""
+		self._execute()
+		try:
+			self.collector.FirstElementId()
+		except:
+			self._all()
+
+	def union(self, other):
+		"""
+		Extends the collection by the elements of another filter or collection of elements or element IDs.
+
+		Example::
+
+			walls = revitron.Filter().byCategory('Walls').noTypes()
+			doors = revitron.Filter().byCategory('Doors').noTypes()
+			ids = walls.union(doors).getElementIds()
+
+		Args:
+			other (mixed): A filter, a list of elements or element IDs or a collection of element IDs
+
+		Returns:
+			object: The Filter instance
+		"""
+
+		def callback(fltr):
+			collector = fltr._toCollector(other)
+			if collector is not None:
+				fltr.collector.UnionWith(collector)
+
+		return self._applyNow(FilterStage('union', None, FilterStage.SCRIPT, callback=callback))
+
+	def intersect(self, other):
+		"""
+		Reduces the collection to the elements that are also part of another filter or collection 
+		of elements or element IDs.
+
+		Args:
+			other (mixed): A filter, a list of elements or element IDs or a collection of element IDs
+
+		Returns:
+			object: The Filter instance
+		"""
+
+		def callback(fltr):
+			collector = fltr._toCollector(other)
+			if collector is None:
+				fltr._none()
+			else:
+				fltr.collector.IntersectWith(collector)
+
+		return self._applyNow(
+		    FilterStage('intersect', None, FilterStage.SCRIPT, callback=callback)
+		)
+
+	def subtract(self, other):
+		"""
+		Removes the elements of another filter or collection of elements or element IDs from the collection.
+
+		Args:
+			other (mixed): A filter, a list of elements or element IDs or a collection of element IDs
+
+		Returns:
+			object: The Filter instance
+		"""
+		import revitron
+
+		def callback(fltr):
+			ids = fltr._toElementIds(other)
+			if ids.Count:
+				fltr.collector = fltr.collector.WherePasses(
+				    revitron.DB.ExclusionFilter(ids)
+				)
+
+		return self._applyNow(
+		    FilterStage('subtract', None, FilterStage.SCRIPT, callback=callback)
+		)
+
+	def xor(self, other):
+		"""
+		Reduces the collection to the elements that are either part of the collection or part of another filter 
+		or collection of elements or element IDs, but not part of both.
+
+		Args:
+			other (mixed): A filter, a list of elements or element IDs or a collection of element IDs
+
+		Returns:
+			object: The Filter instance
+		"""
+		import revitron
+		from System.Collections.Generic import HashSet
+
+		def callback(fltr):
+			ids = HashSet[revitron.DB.ElementId](fltr.collector.ToElementIds())
+			ids.SymmetricExceptWith(fltr._toElementIds(other))
+			fltr._setElementIds(ids)
+
+		return self._applyNow(FilterStage('xor', None, FilterStage.SCRIPT, callback=callback))
+
+	def count(self):
+		"""
+		Get the number of elements in the collection without materializing any element or element ID.
+
+		Example::
+
+			count = revitron.Filter().byCategory('Rooms').noTypes().count()
+
+		Returns:
+			integer: The number of elements
+		"""
+		self._prepare()
+		return self.collector.GetElementCount()
+
+	def iterElementIds(self):
+		"""
+		Iterate the element IDs of the collection lazily. 
+
+		Example::
+
+			for elementId in revitron.Filter().byCategory('Walls').noTypes().iterElementIds():
+			    print(elementId)
+
+		Returns:
+			generator: A generator yielding element IDs
+		"""
+		self._prepare()
+		iterator = self.collector.GetElementIdIterator()
+		iterator.Reset()
+		while iterator.MoveNext():
+			yield iterator.Current
+
+	def iterElements(self, chunkSize=None):
+		"""
+		Iterate the elements of the collection lazily without holding the full list of elements in memory.
+
+		By default the collector is walked element by element. 
+		Optionally a ``chunkSize`` can be passed to read the element IDs in chunks instead. 
+		The elements of every chunk are then resolved using ``GetElement``::
+
+			for element in revitron.Filter().noTypes().iterElements(chunkSize=1000):
+			    print(element.Id)
+
+		Args:
+			chunkSize (integer, optional): The number of element IDs to be read at once. Defaults to None.
+
+		Returns:
+			generator: A generator yielding elements
+		"""
+		if not chunkSize:
+			self._prepare()
+			iterator = self.collector.GetElementIterator()
+			iterator.Reset()
+			while iterator.MoveNext():
+				yield iterator.Current
+			return
+		chunk = []
+		for elementId in self.iterElementIds():
+			chunk.append(elementId)
+			if len(chunk) >= chunkSize:
+				for element in self._resolveChunk(chunk):
+					yield element
+				chunk = []
+		for element in self._resolveChunk(chunk):
+			yield element
+
+	def _resolveChunk(self, chunk):
+		"""
+		Resolves a chunk of element IDs.
+
+		Args:
+			chunk (list): A list of element IDs
+
+		Returns:
+			list: The list of elements
+		"""
+		return [self.doc.GetElement(elementId) for elementId in chunk]
+
+	def _loadFromCache(self, useCache=True):
+		"""
+		Looks up the filter in the :class:`FilterCache` and replaces the collection
+		with the cached element IDs on a hit.
+
+		Args:
+			useCache (bool, optional): Use the cache if enabled. Defaults to True.
+
+		Returns:
+			tuple: The cache key, or None in case the cache is not used, and a boolean that is True on a hit
+		"""
+		if not useCache or not FilterCache.isActive(self.doc):
+			return None, False
+		key = FilterCache.getKey(self)
+		if key is None:
+			return None, False
+		ids = FilterCache.get(key)
+		if ids is None:
+			return key, False
+		self._pending = []
+		self._setElementIds(ids)
+		self.executed = [
+		    FilterStage(
+		        'cache', (ids.Count, ),
+		        FilterStage.SCRIPT,
+		        callback=lambda fltr: fltr._setElementIds(ids)
+		    )
+		]
+		return key, True
+
+	def getValues(self, paramNames, asType=None):
+		"""
+		Extracts the values of multiple parameters for all elements in the collection at once
+		and returns them column by column.
+
+		Parameters are only looked up by name once per element class, category and type. 
+		All other elements of the same class, category and type get their parameters by reference.
+		In case the name of a referenced parameter doesn't match, the parameter is looked up by name.
+		The way a value is read is also decided only once per column and storage type::
+
+			values = revitron.Filter().byCategory('Rooms').noTypes().getValues(['Number', 'Area', 'Level'])
+			for i, elementId in enumerate(values.ids):
+			    print(elementId, values.columns['Number'][i], values.columns['Area'][i])
+
+		The ``asType`` argument can be set to ``'string'`` in order to get all values as displayed in the UI, 
+		for example the name of the level instead of the level ID.
+
+		Args:
+			paramNames (list): The list of parameter names
+			asType (string, optional): Set to ``'string'`` to get value strings. Defaults to None.
+
+		Returns:
+			object: An ``AttrDict`` with the list of ``ids`` and a dict of ``columns`` with one list of values per parameter
+		"""
+		import revitron
+		from revitron import ParameterUtils
+
+		valueString = (asType == 'string')
+		ids = []
+		columns = dict((name, []) for name in paramNames)
+		resolutions = dict()
+		accessors = dict()
+		bips = dict()
+		for name in paramNames:
+			try:
+				bips[name] = getattr(revitron.DB.BuiltInParameter, name)
+			except:
+				bips[name] = None
+
+		def lookup(element, name):
+			byName = True
+			parameter = element.LookupParameter(name)
+			if parameter is None and bips[name] is not None:
+				byName = False
+				parameter = element.get_Parameter(bips[name])
+			return parameter, byName
+
+		def getAccessor(name, parameter):
+			storageType = str(parameter.StorageType)
+			if (name, storageType) not in accessors:
+				accessors[(name, storageType)] = ParameterUtils.getValueAccessor(
+				    storageType, valueString
+				)
+			return accessors[(name, storageType)]
+
+		for element in self.iterElements():
+			ids.append(element.Id)
+			category = None
+			if element.Category is not None:
+				category = element.Category.Id.IntegerValue
+			key = (element.__class__.__name__, category, element.GetTypeId().IntegerValue)
+			if key not in resolutions:
+				resolution = dict()
+				for name in paramNames:
+					resolution[name] = None
+					parameter, byName = lookup(element, name)
+					if parameter is None:
+						continue
+					resolution[name] = (
+					    ParameterUtils.getReference(parameter),
+					    getAccessor(name, parameter),
+					    byName
+					)
+				resolutions[key] = resolution
+			for name in paramNames:
+				value = ''
+				if resolutions[key][name] is not None:
+					reference, accessor, byName = resolutions[key][name]
+					parameter = element.get_Parameter(reference)
+					if parameter is not None and byName:
+						if parameter.Definition.Name != name:
+							parameter, byName = lookup(element, name)
+							if parameter is not None:
+								accessor = getAccessor(name, parameter)
+					if parameter is not None:
+						value = accessor(parameter)
+				columns[name].append(value)
+
+		return revitron.AttrDict(ids=ids, columns=columns)
+
+	def getElements(self, useCache=True):
 		"""
 		Get the collection as elements.
 
+		Args:
+			useCache (bool, optional): Use the :class:`FilterCache` if enabled. Defaults to True.
+
 		Returns:
 			list: The list of excluded elements
 		"""
+		if useCache and FilterCache.isActive(self.doc):
+			self._setElementIds(self.getElementIds())
+		else:
+			FilterProfiler.log(self)
+		self._execute()
 		try:
 			return self.collector.ToElements()
 		except:
 			self._all()
 			return self.collector.ToElements()
 
-	def getElementIds(self):
+	def getElementIds(self, useCache=True):
 		"""
 		Get the collection as element IDs.
 
+		Args:
+			useCache (bool, optional): Use the :class:`FilterCache` if enabled. Defaults to True.
+
 		Returns:
 			list: The list of excluded element IDs
 		"""
+		key, hit = self._loadFromCache(useCache)
+		self._execute()
 		try:
-			return self.collector.ToElementIds()
+			ids = self.collector.ToElementIds()
 		except:
 			self._all()
-			return self.collector.ToElementIds()
+			ids = self.collector.ToElementIds()
+		if key is not None and not hit:
+			FilterCache.set(key, ids)
+		FilterProfiler.log(self)
+		return ids
+
+	def explain(self):
+		"""
+		Explains the plan of the filter including all executed and pending stages.
+
+		Every stage is replayed in isolation on the element IDs that are returned by the previous stage. 
+		The collection of the filter itself is not modified::
+
+			plan = revitron.Filter().byCategory('Rooms').noTypes().explain()
+			for stage in plan.stages:
+			    print(stage.name, stage.countIn, stage.countOut, stage.time)
+
+		The ``setupTime`` of a stage is the time spent when adding the stage to the filter, 
+		for example for resolving the value providers of a parameter.
+
+		Returns:
+			object: An ``AttrDict`` with the list of ``stages`` and the ``count``, ``time``, ``collectors`` and ``providers`` totals
+		"""
+		import revitron
+		stages = self.executed + self._optimize(self._pending)
+		rows = []
+		with revitron.Document(self.doc):
+			scope = self.scope
+			if type(scope) == list and not scope:
+				scope = None
+			replay = Filter(scope)
+			count = replay.count()
+			for stage in stages:
+				started = time.time()
+				stage.apply(replay)
+				try:
+					ids = replay.collector.ToElementIds()
+				except:
+					replay._all()
+					ids = replay.collector.ToElementIds()
+				rows.append(
+				    revitron.AttrDict(
+				        name=stage.name,
+				        args=stage.args,
+				        kind=stage.kind,
+				        countIn=count,
+				        countOut=ids.Count,
+				        time=time.time() - started,
+				        setupTime=stage.setupTime,
+				        providers=stage.providers
+				    )
+				)
+				count = ids.Count
+				replay = Filter()
+				replay._setElementIds(ids)
+		return revitron.AttrDict(
+		    stages=rows,
+		    count=count,
+		    time=sum([row.time for row in rows]),
+		    collectors=self.collectors,
+		    providers=sum([row.providers for row in rows])
+		)
 
 	def noTypes(self):
 		"""
@@ -648,8 +2211,14 @@ class Filter:
 		Returns:
 			object: The Filter instance
 		"""
-		self.collector = self.collector.WhereElementIsNotElementType()
-		return self
+		import revitron
+		return self._addStage(
+		    FilterStage(
+		        'noTypes', (),
+		        FilterStage.QUICK,
+		        elementFilter=revitron.DB.ElementIsElementTypeFilter(True)
+		    )
+		)
 
 	def onlyTypes(self):
 		"""
@@ -658,5 +2227,11 @@ class Filter:
 		Returns:
 			object: The Filter instance
 		"""
-		self.collector = self.collector.WhereElementIsElementType()
-		return self
+		import revitron
+		return self._addStage(
+		    FilterStage(
+		        'onlyTypes', (),
+		        FilterStage.QUICK,
+		        elementFilter=revitron.DB.ElementIsElementTypeFilter(False)
+		    )
+		)
@@ -9,6 +9,8 @@ class LinkRvt(Element):
 	A wrapper class for Revit links.
 	"""
 
+	__slots__ = ()
+
 	def getPath(self):
 		"""
 		Gets the path of the linked document.
@@ -36,3 +38,187 @@ class LinkRvt(Element):
 			return revitron.DOC.GetElement(self.get('Type'))
 		except:
 			pass
+
+
+class LinkRegistry:
+	"""
+	A per-document registry of all Revit link instances. 
+	
+	In a single pass, the registry maps every link instance to its link type, name, title, path, 
+	linked document and total transform::
+
+		registry = revitron.LinkRegistry.forDocument()
+		for entry in registry.getEntries():
+		    print(entry.title, entry.path, entry.transform.Origin)
+
+	Registries returned by ``forDocument()`` are shared as long as the :class:`revitron.document.DocumentRevision` 
+	of the document doesn't change and the revision tracking is subscribed to the ``DocumentChanged`` event.
+	A registry is also rebuilt as soon as one of the linked documents has been unloaded or closed
+	and is never shared while a transaction is open.
+	"""
+
+	_registries = dict()
+
+	def __init__(self, doc=None):
+		"""
+		Inits a new LinkRegistry instance and collects all link instances of a document.
+
+		Args:
+			doc (object, optional): A Revit document. Defaults to the active document.
+		"""
+		import revitron
+		if doc is None:
+			doc = revitron.DOC
+		self.doc = doc
+		self.revision = revitron.DocumentRevision.get(doc)
+		self.entries = dict()
+		titles = dict()
+		extension = '.rvt'
+		for openDoc in revitron.APP.Documents:
+			if openDoc.IsLinked:
+				titles[openDoc.Title] = openDoc
+		with revitron.Document(doc):
+			links = revitron.Filter().byClass(revitron.DB.RevitLinkInstance
+			                                  ).noTypes().getElements()
+		for link in links:
+			linkType = doc.GetElement(link.GetTypeId())
+			name = revitron.DB.Element.Name.GetValue(linkType)
+			title = name
+			if title.endswith(extension):
+				title = title[:-len(extension)]
+			linkDoc = link.GetLinkDocument()
+			if linkDoc is None:
+				linkDoc = titles.get(title)
+			path = None
+			if linkDoc is not None:
+				path = linkDoc.PathName
+			self.entries[link.Id.IntegerValue] = revitron.AttrDict(
+			    id=link.Id,
+			    typeId=linkType.Id,
+			    name=name,
+			    title=title,
+			    path=path,
+			    doc=linkDoc,
+			    transform=link.GetTotalTransform()
+			)
+
+	@staticmethod
+	def forDocument(doc=None):
+		"""
+		Returns the shared registry for a given document.
+
+		Args:
+			doc (object, optional): A Revit document. Defaults to the active document.
+
+		Returns:
+			object: The LinkRegistry instance
+		"""
+		import revitron
+		if doc is None:
+			doc = revitron.DOC
+		registries = LinkRegistry._registries
+		for key in list(registries.keys()):
+			if not key.IsValidObject:
+				del registries[key]
+		registry = registries.get(doc)
+		if registry is None or not registry.isValid():
+			registry = LinkRegistry(doc)
+			registries[doc] = registry
+		return registry
+
+	@staticmethod
+	def invalidate(doc=None):
+		"""
+		Invalidates the shared registry of a given document.
+
+		Args:
+			doc (object, optional): A Revit document. Defaults to the active document.
+		"""
+		import revitron
+		if doc is None:
+			doc = revitron.DOC
+		LinkRegistry._registries.pop(doc, None)
+
+	def isValid(self):
+		"""
+		Checks whether the registry is still up to date.
+
+		Returns:
+			boolean: True in case the registry can be used
+		"""
+		import revitron
+		if not revitron.DocumentRevision.isSubscribed() or self.doc.IsModifiable:
+			return False
+		if self.revision != revitron.DocumentRevision.get(self.doc):
+			return False
+		for entry in self.entries.values():
+			if entry.doc is not None and not entry.doc.IsValidObject:
+				return False
+		return True
+
+	def getEntries(self, scope=None):
+		"""
+		Returns the entries of all link instances, optionally limited to a scope.
+
+		Args:
+			scope (mixed, optional): List or view ID. Defaults to None.
+
+		Returns:
+			list: A list of ``AttrDict`` entries with the ``id``, ``typeId``, ``name``, ``title``, ``path``, ``doc`` and ``transform`` properties
+		"""
+		import revitron
+		if scope is None:
+			return list(self.entries.values())
+		with revitron.Document(self.doc):
+			ids = revitron.Filter(scope).byClass(revitron.DB.RevitLinkInstance
+			                                     ).noTypes().getElementIds()
+		return [
+		    self.entries[elementId.IntegerValue]
+		    for elementId in ids if elementId.IntegerValue in self.entries
+		]
+
+	def getEntry(self, link):
+		"""
+		Returns the entry of a link instance.
+
+		Args:
+			link (mixed): A link instance or its element ID
+
+		Returns:
+			object: The ``AttrDict`` entry or None
+		"""
+		import revitron
+		if not isinstance(link, revitron.DB.ElementId):
+			link = link.Id
+		return self.entries.get(link.IntegerValue)
+
+	def getDocuments(self, scope=None):
+		"""
+		Returns a dictionary of all loaded linked documents. 
+		The key is the ID of the link instance and the value is the linked document.
+
+		Args:
+			scope (mixed, optional): List or view ID. Defaults to None.
+
+		Returns:
+			dict: The dictionary of linked documents
+		"""
+		documents = dict()
+		for entry in self.getEntries(scope):
+			if entry.doc is not None:
+				documents[entry.id] = entry.doc
+		return documents
+
+	def getTransform(self, link):
+		"""
+		Returns the cached total transform of a link instance.
+
+		Args:
+			link (mixed): A link instance or its element ID
+
+		Returns:
+			object: The ``Transform`` or None
+		"""
+		entry = self.getEntry(link)
+		if entry is not None:
+			return entry.transform
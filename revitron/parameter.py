@@ -5,7 +5,12 @@ this submodule is one of the most elementary submodules of the **Revitron** pack
 It contains all classes related to parameters, built-in parameters and value providers.
 """
 import re
+import os
+import json
 import numbers
+import bisect
+import time
+from collections import OrderedDict
 
 
 class Parameter:
@@ -37,22 +42,15 @@ class Parameter:
 
 			scale = _(view).get('VIEW_SCALE')
 
+		Parameters are resolved using the :class:`ParameterResolutionCache`.
+
 		Args:
 			element (object): Revit element
 			name (string): The parameter name or the name of a built-Iin parameter
 		"""
 		self.element = element
 		self.name = name
-		self.parameter = element.LookupParameter(name)
-
-		if not self.exists():
-			try:
-				import revitron
-				self.parameter = element.get_Parameter(
-				    getattr(revitron.DB.BuiltInParameter, name)
-				)
-			except:
-				pass
+		self.parameter, self._resolution = ParameterResolutionCache.resolve(element, name)
 
 	def exists(self):
 		"""
@@ -86,21 +84,11 @@ class Parameter:
 		Returns:
 			mixed: The value
 		"""
-		if self.exists():
-			storageType = str(self.parameter.StorageType)
-		else:
-			storageType = 'String'
-
-		switcher = {
-		    'String': self.getString,
-		    'ValueString': self.getValueString,
-		    'Integer': self.getInteger,
-		    'Double': self.getDouble,
-		    'ElementId': self.getElementId
-		}
-
-		value = switcher.get(storageType)
-		return value()
+		if not self.exists():
+			return ''
+		if self._resolution is None:
+			self._resolution = ParameterResolutionCache._createEntry(self.parameter)
+		return self._resolution.accessor(self.parameter)
 
 	def getString(self):
 		"""
@@ -194,20 +182,17 @@ class Parameter:
 		if not self.name:
 			return False
 		if not paramType:
-			paramType = 'Text'
-			if isinstance(value, numbers.Integral):
-				paramType = 'Integer'
-			if isinstance(value, float):
-				paramType = 'Number'
+			paramType = ParameterUtils.getParameterTypeFromValue(value)
 		if self.parameter == None:
 			from revitron import _
 			if ParameterUtils.bind(
-			    self.element.Category.Name,
+			    self.element.Category,
 			    self.name,
 			    paramType,
 			    _(self.element).isType()
 			):
 				self.parameter = self.element.LookupParameter(self.name)
+				self._resolution = None
 			else:
 				print('Error setting value of parameter "{}"'.format(self.name))
 				return False
@@ -245,13 +230,15 @@ class ParameterUtils:
 	A collection of static parameter utilities.
 	"""
 
+	_specTypeIds = dict()
+
 	@staticmethod
 	def bind(category, paramName, paramType='Text', typeBinding=False):
 		"""
 		Bind a new parameter to a category.
 
 		Args:
-			category (string): The built-in category 
+			category (mixed): The category name, the built-in category or the category object
 			paramName (string): The parameter name
 			paramType (string): The parameter type (see `here <https://www.revitapidocs.com/2019/f38d847e-207f-b59a-3bd6-ebea80d5be63.htm>`_)
 								Defaults to "Text".
@@ -260,67 +247,147 @@ class ParameterUtils:
 		Returns:
 			boolean: Returns True on success and False on error.
 		"""
-		import revitron
+		return ParameterUtils.bindMany([(category, paramName, paramType, typeBinding)
+		                                ]).get(paramName, False)
+
+	@staticmethod
+	def bindMany(items):
+		"""
+		Bind multiple parameters to categories at once. 
+		
+		All categories of the same parameter are merged into a single category set 
+		and every parameter binding is inserted only once::
 
-		paramFile = revitron.APP.OpenSharedParameterFile()
+			revitron.ParameterUtils.bindMany([
+			    ('Walls', 'Fire Rating', 'Text', False),
+			    ('Doors', 'Fire Rating', 'Text', False),
+			    ('Rooms', 'Occupancy', 'Integer', False)
+			])
 
-		if paramFile is None:
-			print('Please define a shared parameters file.')
-			return False
+		Categories can be passed as category objects, built-in categories or names. 
+		Names are resolved as built-in category names with or without the ``OST_`` prefix first 
+		and as names of top-level categories otherwise. Unknown categories raise a ``ValueError``.
 
-		definition = None
+		Definitions are taken from the :class:`SharedParameterCatalogue`. 
+		Missing definitions are created in the **REVITRON** group of the shared parameter file.
+		Parameters that are requested as type and as instance parameters at the same time 
+		or that are already bound with the other binding type are not bound and a warning is logged.
 
-		# Try to get an existing parameter definition with the given name.
-		for group in paramFile.Groups:
-			definition = group.Definitions.get_Item(paramName)
-			if definition:
-				break
+		Args:
+			items (list): A list of tuples with a category, a parameter name, a parameter type and a boolean for type bindings
 
-		group = None
+		Returns:
+			dict: A dictionary with a boolean for every parameter name that is True in case new categories have been bound
+		"""
+		import revitron
 
-		# If the definition hasn't been created yet, create it in the REVITRON group.
-		if not definition:
-			group = paramFile.Groups.get_Item('REVITRON')
-			if not group:
-				group = paramFile.Groups.Create('REVITRON')
-			options = ParameterUtils.externalDefinitionCreationOptions(
-			    paramName, paramType
-			)
-			definition = group.Definitions.Create(options)
-
-		# Try to get the parameter binding for the definition.
-		binding = revitron.DOC.ParameterBindings[definition]
-
-		# Add the given category to the categories list as the initial item
-		# and try to access currently bound categories to add them as well.
-		# In case the given category is already among the bound categories,
-		# stop the further execution and return False.
-		# In case the category is not bound yet, remove the binding from the parameter
-		# binding map.
-		categories = [revitron.Category(category).get()]
-		try:
-			for _cat in binding.Categories:
-				categories.append(_cat)
-				if _cat.Name == category:
-					return False
-			revitron.DOC.ParameterBindings.Remove(definition)
-		except:
-			pass
+		if SharedParameterCatalogue.load() is None:
+			print('Please define a shared parameters file.')
+			return dict()
+
+		logger = revitron.Log()
+		results = dict()
+		requests = OrderedDict()
+		for category, paramName, paramType, typeBinding in items:
+			category = ParameterUtils._getCategory(category)
+			if paramName not in requests:
+				requests[paramName] = revitron.AttrDict(
+				    paramType=paramType, typeBinding=typeBinding, categories=OrderedDict()
+				)
+			request = requests[paramName]
+			if bool(request.typeBinding) != bool(typeBinding):
+				request.conflict = True
+			request.categories[category.Id.IntegerValue] = category
+
+		for paramName, request in requests.items():
+			results[paramName] = False
+			if request.get('conflict'):
+				logger.warning(
+				    'Parameter "{}" is requested as type and instance parameter'.
+				    format(paramName)
+				)
+				continue
+			definition = SharedParameterCatalogue.create(paramName, request.paramType)
+			if definition is None:
+				continue
+			binding = revitron.DOC.ParameterBindings[definition]
+			categories = []
+			if binding is not None:
+				if isinstance(binding,
+				              revitron.DB.TypeBinding) != bool(request.typeBinding):
+					logger.warning(
+					    'Parameter "{}" is already bound with a different binding type'.
+					    format(paramName)
+					)
+					continue
+				for _cat in binding.Categories:
+					categories.append(_cat)
+			bound = [_cat.Id.IntegerValue for _cat in categories]
+			added = False
+			for categoryId, category in request.categories.items():
+				if categoryId not in bound:
+					categories.append(category)
+					bound.append(categoryId)
+					added = True
+			if not added:
+				continue
+			categorySet = revitron.APP.Create.NewCategorySet()
+			for _cat in categories:
+				categorySet.Insert(_cat)
+			if request.typeBinding:
+				newBinding = revitron.APP.Create.NewTypeBinding(categorySet)
+			else:
+				newBinding = revitron.APP.Create.NewInstanceBinding(categorySet)
+			if binding is None:
+				revitron.DOC.ParameterBindings.Insert(definition, newBinding)
+			else:
+				revitron.DOC.ParameterBindings.ReInsert(definition, newBinding)
+			results[paramName] = True
 
-		# Create a new category set and add all categories, the given and the previously bound ones.
-		categorySet = revitron.APP.Create.NewCategorySet()
-		for _cat in categories:
-			categorySet.Insert(_cat)
+		if True in results.values():
+			ParameterStorageTypeResolver.invalidate()
+			ParameterResolutionCache.clear()
 
-		# Create the binding.
-		if typeBinding:
-			binding = revitron.APP.Create.NewTypeBinding(categorySet)
-		else:
-			binding = revitron.APP.Create.NewInstanceBinding(categorySet)
+		return results
+
+	@staticmethod
+	def _getCategory(category):
+		"""
+		Resolves a category object by a category name, a built-in category or a category ID.
+
+		Args:
+			category (mixed): The category name, the built-in category, the category ID or the category object
 
-		revitron.DOC.ParameterBindings.Insert(definition, binding)
+		Raises:
+			ValueError: In case the category can't be resolved
 
-		return True
+		Returns:
+			object: The category object
+		"""
+		import revitron
+		db = revitron.DB
+		if isinstance(category, db.Category):
+			return category
+		resolved = None
+		if isinstance(category, basestring):
+			bic = getattr(
+			    db.BuiltInCategory, 'OST_{}'.format(category.replace('OST_', '')), None
+			)
+			if bic is not None:
+				resolved = db.Category.GetCategory(revitron.DOC, bic)
+			else:
+				for _cat in revitron.DOC.Settings.Categories:
+					if _cat.Name == category:
+						resolved = _cat
+						break
+		else:
+			try:
+				resolved = db.Category.GetCategory(revitron.DOC, category)
+			except:
+				pass
+		if resolved is None:
+			raise ValueError('Unknown category "{}"'.format(category))
+		return resolved
 
 	@staticmethod
 	def externalDefinitionCreationOptions(paramName, paramType):
@@ -335,27 +402,7 @@ class ParameterUtils:
 			ExternalDefinitionCreationOptions: The ExternalDefinitionCreationOptions object
 		"""
 		import revitron
-		dataType = None
-		try:
-			dataType = getattr(revitron.DB.SpecTypeId, paramType)
-		except:
-			pass
-		try:
-			dataType = getattr(revitron.DB.SpecTypeId.String, paramType)
-		except:
-			pass
-		try:
-			dataType = getattr(revitron.DB.SpecTypeId.Int, paramType)
-		except:
-			pass
-		try:
-			dataType = getattr(revitron.DB.SpecTypeId.Boolean, paramType)
-		except:
-			pass
-		try:
-			dataType = getattr(revitron.DB.SpecTypeId.Reference, paramType)
-		except:
-			pass
+		dataType = ParameterUtils._getSpecTypeId(paramType)
 		if dataType:
 			try:
 				return revitron.DB.ExternalDefinitionCreationOptions(paramName, dataType)
@@ -368,6 +415,98 @@ class ParameterUtils:
 		except:
 			pass
 
+	@staticmethod
+	def _getSpecTypeId(paramType):
+		"""
+		Get the ``SpecTypeId`` for a given parameter type name. 
+		Results are cached, including the names that can't be resolved.
+
+		Args:
+			paramType (string): The name of the type
+
+		Returns:
+			object: The ``ForgeTypeId`` of the spec or None
+		"""
+		import revitron
+		if paramType in ParameterUtils._specTypeIds:
+			return ParameterUtils._specTypeIds[paramType]
+		dataType = None
+		specTypeId = getattr(revitron.DB, 'SpecTypeId', None)
+		if specTypeId is not None:
+			sources = [specTypeId] + [
+			    getattr(specTypeId, name, None)
+			    for name in ['String', 'Int', 'Boolean', 'Reference']
+			]
+			for source in sources:
+				if source is not None:
+					dataType = getattr(source, paramType, dataType)
+		ParameterUtils._specTypeIds[paramType] = dataType
+		return dataType
+
+	@staticmethod
+	def getReference(parameter):
+		"""
+		Returns a reference to a parameter that can be used to get the same parameter from other elements
+		without looking it up by name. The reference is either a built-in parameter, the GUID of a shared parameter 
+		or the parameter definition.
+
+		Args:
+			parameter (object): A Revit parameter
+
+		Returns:
+			object: The built-in parameter, the GUID or the definition
+		"""
+		import revitron
+		try:
+			bip = parameter.Definition.BuiltInParameter
+			if bip != revitron.DB.BuiltInParameter.INVALID:
+				return bip
+		except:
+			pass
+		if parameter.IsShared:
+			return parameter.GUID
+		return parameter.Definition
+
+	@staticmethod
+	def getValueAccessor(storageType, valueString=False):
+		"""
+		Returns a function that reads the value of a parameter with a given storage type.
+		Missing values are returned in the same way as by the :class:`Parameter` class.
+
+		Args:
+			storageType (string): The storage type name
+			valueString (bool, optional): Read the value as value string as displayed in the UI. Defaults to False.
+
+		Returns:
+			function: A function that takes a Revit parameter as argument and returns its value
+		"""
+		if valueString:
+			return lambda p: (p.AsValueString() or p.AsString() or '') if p.HasValue else ''
+		if storageType == 'Integer':
+			return lambda p: p.AsInteger() if p.HasValue else 0
+		if storageType == 'Double':
+			return lambda p: p.AsDouble() if p.HasValue else 0.0
+		if storageType == 'ElementId':
+			return lambda p: p.AsElementId() if p.HasValue else 0
+		return lambda p: p.AsString() if p.HasValue else ''
+
+	@staticmethod
+	def getParameterTypeFromValue(value):
+		"""
+		Get the parameter type that is used by default when creating a parameter for a given value.
+
+		Args:
+			value (mixed): The value
+
+		Returns:
+			string: ``Integer``, ``Number`` or ``Text``
+		"""
+		if isinstance(value, numbers.Integral):
+			return 'Integer'
+		if isinstance(value, float):
+			return 'Number'
+		return 'Text'
+
 	@staticmethod
 	def getParameterTypeFromDefinition(definition):
 		"""
@@ -398,26 +537,17 @@ class ParameterUtils:
 		Args:
 			name (string): The parameter name
 
+		Note:
+
+			The lookup is cached per document by the :class:`ParameterStorageTypeResolver`.
+
 		Returns:
 			string: The storage type
 		"""
-		from revitron import DOC
-		# Try first project and shared parameters.
-		definition = ParameterUtils._findProjectParameterDefinition(name)
-		if not definition:
-			definition = ParameterUtils._findSharedParameterDefinition(name)
-		if definition:
-			storageType = ParameterUtils._convertParameterTypeToStorageType(
-			    ParameterUtils.getParameterTypeFromDefinition(definition)
-			)
-			if storageType:
-				return storageType
-		try:
-			# Try built-in parameters.
-			return str(DOC.TypeOfStorage[ParameterUtils._findBuiltInParameter(name)])
-		except:
-			# Fall back to very slow search in all elements.
-			return ParameterUtils._findStorageTypeInElements(name)
+		entry = ParameterStorageTypeResolver.forDocument().resolve(name)
+		if entry:
+			return entry.storageType
+		return None
 
 	@staticmethod
 	def _findProjectParameterDefinition(name):
@@ -448,14 +578,9 @@ class ParameterUtils:
 		Returns:
 			object: The built-in parameter
 		"""
-		from revitron import DB
-		for item in dir(DB.BuiltInParameter):
-			try:
-				bip = getattr(DB.BuiltInParameter, item)
-				if DB.LabelUtils.GetLabelFor(bip) == name:
-					return bip
-			except:
-				pass
+		bips = BuiltInParameterNameMap().getBuiltInParameters(name)
+		if bips:
+			return bips[0]
 		return None
 
 	@staticmethod
@@ -556,173 +681,1301 @@ class ParameterUtils:
 				return parameter.StorageType.ToString()
 
 
-class ParameterNameList:
+class SharedParameterCatalogue:
 	"""
-	A helper class for listing all parameter names in the active document. 
+	A cached catalogue of all definitions in the shared parameter file of the application.
+
+	The shared parameter file is opened and indexed only once per session. 
+	The catalogue is refreshed automatically as soon as another file is configured 
+	or the file has been modified outside of the catalogue::
+
+		entry = revitron.SharedParameterCatalogue.get('Department')
+		print(entry.guid, entry.group, entry.spec)
 	"""
 
-	def __init__(self):
+	_file = None
+	_signature = None
+	_entries = dict()
+
+	@staticmethod
+	def load():
 		"""
-		Inits a new ParameterNameList instance including all parameter names in the document.
+		Returns the shared parameter file and refreshes the catalogue if required.
+
+		Returns:
+			object: The Revit ``DefinitionFile`` or None in case no file is configured
 		"""
 		import revitron
+		signature = SharedParameterCatalogue._getSignature()
+		if signature is None:
+			return None
+		if signature != SharedParameterCatalogue._signature:
+			SharedParameterCatalogue._file = revitron.APP.OpenSharedParameterFile()
+			SharedParameterCatalogue._entries = dict()
+			if SharedParameterCatalogue._file is not None:
+				for group in SharedParameterCatalogue._file.Groups:
+					for definition in group.Definitions:
+						if definition.Name not in SharedParameterCatalogue._entries:
+							SharedParameterCatalogue._add(definition, group)
+			SharedParameterCatalogue._signature = signature
+		return SharedParameterCatalogue._file
 
-		self.parameters = []
-
-		for name in BuiltInParameterNameMap().map:
-			self.parameters.append(name)
-
-		for param in revitron.Filter().byClass(revitron.DB.SharedParameterElement
-		                                       ).getElements():
-			self.parameters.append(param.GetDefinition().Name)
+	@staticmethod
+	def get(name):
+		"""
+		Returns the catalogue entry for a given parameter name.
 
-		for param in revitron.Filter().byClass(revitron.DB.ParameterElement
-		                                       ).getElements():
-			self.parameters.append(param.GetDefinition().Name)
+		Args:
+			name (string): The parameter name
 
-		self.parameters = sorted(list(set(self.parameters)))
+		Returns:
+			object: An ``AttrDict`` with the ``definition``, ``guid``, ``group`` and ``spec`` properties or None
+		"""
+		SharedParameterCatalogue.load()
+		return SharedParameterCatalogue._entries.get(name)
 
-	def get(self):
+	@staticmethod
+	def getNames():
 		"""
-		Returns the parameter list.
+		Returns the sorted list of all parameter names in the shared parameter file.
 
 		Returns:
-			list: The list with all parameters in the document.
+			list: The list of names
 		"""
-		return self.parameters
+		SharedParameterCatalogue.load()
+		return sorted(SharedParameterCatalogue._entries.keys())
 
+	@staticmethod
+	def create(name, paramType='Text', groupName='REVITRON'):
+		"""
+		Returns the definition for a given name and creates it in case it doesn't exist yet.
 
-class ParameterValueProviders:
-	""" 
-	A wrapper for parameter value providers used for filtering elements.
-	"""
+		Args:
+			name (string): The parameter name
+			paramType (string, optional): The parameter type of new definitions. Defaults to 'Text'.
+			groupName (string, optional): The group of new definitions. Defaults to 'REVITRON'.
 
-	def __init__(self, name):
+		Returns:
+			object: The definition or None in case no shared parameter file is configured
 		"""
-		Inits a new ParameterValueProviders instance by name. Such an instance consists of a list
-		of value providers matching a parameters with a name visible to the user.
-		Note that this list can have more than one value provider, since a parameter name possible matches 
-		multiple built-in parameters.
+		paramFile = SharedParameterCatalogue.load()
+		if paramFile is None:
+			return None
+		entry = SharedParameterCatalogue._entries.get(name)
+		if entry:
+			return entry.definition
+		group = paramFile.Groups.get_Item(groupName)
+		if not group:
+			group = paramFile.Groups.Create(groupName)
+		options = ParameterUtils.externalDefinitionCreationOptions(name, paramType)
+		definition = group.Definitions.Create(options)
+		SharedParameterCatalogue._add(definition, group)
+		SharedParameterCatalogue._signature = SharedParameterCatalogue._getSignature()
+		return definition
+
+	@staticmethod
+	def _add(definition, group):
+		"""
+		Adds a definition to the catalogue.
 
 		Args:
-			name (string): Name
+			definition (object): An external definition
+			group (object): The definition group
 		"""
 		import revitron
-		self.providers = []
-		paramIds = []
-		it = revitron.DOC.ParameterBindings.ForwardIterator()
-		while it.MoveNext():
-			if it.Key.Name == name:
-				paramIds.append(it.Key.Id)
-		if not paramIds:
-			try:
-				paramIds = BuiltInParameterNameMap().get(name)
-			except:
-				pass
-		for paramId in paramIds:
-			self.providers.append(revitron.DB.ParameterValueProvider(paramId))
+		SharedParameterCatalogue._entries[definition.Name] = revitron.AttrDict(
+		    definition=definition,
+		    guid=definition.GUID,
+		    group=group.Name,
+		    spec=ParameterUtils.getParameterTypeFromDefinition(definition)
+		)
 
-	def get(self):
+	@staticmethod
+	def _getSignature():
 		"""
-		Returns the list of value providers.
+		Returns the path and modification time of the shared parameter file.
 
 		Returns:
-			list: The list of value providers
+			tuple: The path and the modification time or None
 		"""
-		return self.providers
+		import revitron
+		path = revitron.APP.SharedParametersFilename
+		if not path or not os.path.isfile(path):
+			return None
+		return (path, os.path.getmtime(path))
 
 
-class BuiltInParameterNameMap:
-	""" 
-	A helper class for mapping lists of built-in parameter names to their representation visible to the user.
+class ParameterStorageTypeResolver:
+	"""
+	A per-document resolver for storage types of parameters by name. 
+	
+	On first use, the resolver collects the definitions of all project and shared parameters of a document.
+	Resolved storage types are memoized, including the names that can't be resolved at all. 
+	The resolver is invalidated automatically as soon as the :class:`revitron.document.DocumentRevision` 
+	or the number of parameter bindings changes or explicitly by calling 
+	``ParameterStorageTypeResolver.invalidate()``::
+
+		entry = revitron.ParameterStorageTypeResolver.forDocument().resolve('Area')
+		print(entry.storageType, entry.spec, entry.source)
 	"""
 
-	def __init__(self):
-		"""
-		Inits a new BuiltInParameterNameMap instance. The map is a dictionary where the key
-		is a parameter name that is visible to the user and the value is a list of built-in parameters 
-		represented by that name.
+	_resolvers = dict()
+
+	def __init__(self, doc):
 		"""
-		import revitron
+		Inits a new ParameterStorageTypeResolver instance for a given document.
 
-		self.map = dict()
-		for item in dir(revitron.DB.BuiltInParameter):
-			try:
-				bip = getattr(revitron.DB.BuiltInParameter, item)
-				name = revitron.DB.LabelUtils.GetLabelFor(bip)
-				if name not in self.map:
-					self.map[name] = []
-				self.map[name].append(revitron.DB.ElementId(int(bip)))
-			except:
-				pass
+		Args:
+			doc (object): A Revit document
+		"""
+		self.doc = doc
+		self.signature = None
+		self.definitions = dict()
+		self.entries = dict()
 
-	def get(self, name):
+	@staticmethod
+	def forDocument(doc=None):
 		"""
-		Return the list of matching built-in parameters for a given name.
+		Returns the shared resolver instance for a given document.
 
 		Args:
-			name (string): The parameter name visible to the user
+			doc (object, optional): A Revit document. Defaults to the active document.
 
 		Returns:
-			list: The list of built-in parameter ids
+			object: The ParameterStorageTypeResolver instance
 		"""
-		return self.map[name]
+		import revitron
+		if doc is None:
+			doc = revitron.DOC
+		resolvers = ParameterStorageTypeResolver._resolvers
+		for key in list(resolvers.keys()):
+			if not key.IsValidObject:
+				del resolvers[key]
+		if doc not in resolvers:
+			resolvers[doc] = ParameterStorageTypeResolver(doc)
+		return resolvers[doc]
 
+	@staticmethod
+	def invalidate(doc=None):
+		"""
+		Invalidates the resolver of a given document.
 
-class ParameterTemplate:
-	"""
-	Create a string based on a parameter template where parameter names are wrapped in :code:`{...}` and get substituted with their value::
-	
-		This sheet has the number {Sheet Number}
+		Args:
+			doc (object, optional): A Revit document. Defaults to the active document.
+		"""
+		import revitron
+		if doc is None:
+			doc = revitron.DOC
+		ParameterStorageTypeResolver._resolvers.pop(doc, None)
 
-	It is also possible to get parameter values from the project information instead by wrapping the parameter names 
-	in :code:`{%...%}` instead::
+	def _getSignature(self):
+		"""
+		Returns the signature of the parameter bindings of the document.
+		Since bindings can be replaced without changing their number, 
+		the revision of the document is part of the signature as well.
 
-		This sheet of the project {%Project Name%} has the number {Sheet Number}
+		Returns:
+			tuple: The document revision and the number of parameter bindings
+		"""
+		import revitron
+		return (
+		    revitron.DocumentRevision.get(self.doc), self.doc.ParameterBindings.Size
+		)
 
-	"""
+	def _build(self):
+		"""
+		Collects all project and shared parameter definitions of the document.
+		Project parameters take precedence over shared parameters with the same name.
+		"""
+		import revitron
+		self.signature = self._getSignature()
+		self.definitions = dict()
+		self.entries = dict()
+		it = self.doc.ParameterBindings.ForwardIterator()
+		while it.MoveNext():
+			self._addDefinition(it.Key, 'project')
+		with revitron.Document(self.doc):
+			sharedParameters = revitron.Filter().byClass(
+			    revitron.DB.SharedParameterElement
+			).getElements()
+		for parameter in sharedParameters:
+			self._addDefinition(parameter.GetDefinition(), 'shared')
 
-	def __init__(self, element, template, sanitize=True):
+	def _addDefinition(self, definition, source):
 		"""
-		Inits a new ParameterTemplate instance.
+		Adds a definition to the map of definitions in case the name is not taken yet.
 
 		Args:
-			element (object): A Revit element
-			template (string): A template string
-			sanitize (bool, optional): Optionally sanitize the returned string. Defaults to True.
+			definition (object): A parameter definition
+			source (string): The source of the definition
 		"""
-		import revitron
-
-		self.projectInfo = revitron.DOC.ProjectInformation
-		self.element = element
-		self.template = template
-		self.sanitize = sanitize
+		if definition.Name not in self.definitions:
+			self.definitions[definition.Name] = (
+			    ParameterUtils.getParameterTypeFromDefinition(definition), source
+			)
 
-	def reCallback(self, match):
+	def resolve(self, name):
 		"""
-		The callback function used by the ``get()`` method.
+		Resolves the storage type of a parameter by name. 
+		
+		Project and shared parameters are resolved first, followed by built-in parameters. 
+		In case there is no matching definition, all elements of the document are searched as a last resort.
 
 		Args:
-			match (object): The regex match object
+			name (string): The parameter name
 
 		Returns:
-			string: The processed string
+			object: An ``AttrDict`` with the ``storageType``, ``spec`` and ``source`` properties or None
 		"""
 		import revitron
+		if self.signature != self._getSignature():
+			self._build()
+		if name in self.entries:
+			return self.entries[name]
+		entry = None
+		if name in self.definitions:
+			spec, source = self.definitions[name]
+			storageType = ParameterUtils._convertParameterTypeToStorageType(spec)
+			if storageType:
+				entry = revitron.AttrDict(storageType=storageType, spec=spec, source=source)
+		if not entry:
+			try:
+				bip = ParameterUtils._findBuiltInParameter(name)
+				entry = revitron.AttrDict(
+				    storageType=str(self.doc.TypeOfStorage[bip]),
+				    spec=None,
+				    source='builtin'
+				)
+			except:
+				pass
+		if not entry:
+			with revitron.Document(self.doc):
+				storageType = ParameterUtils._findStorageTypeInElements(name)
+			if storageType:
+				entry = revitron.AttrDict(
+				    storageType=storageType, spec=None, source='element'
+				)
+		self.entries[name] = entry
+		return entry
+
+
+class ParameterResolutionCache:
+	"""
+	A per-document cache that remembers how parameter names are resolved for elements of a given class and category. 
+
+	Looking up a parameter by name is one of the most frequent and also slowest operations in most scripts.
+	Once a name has been resolved for an element, the cache stores a reference to the parameter, 
+	either a built-in parameter, the GUID of a shared parameter or the parameter definition, together with
+	the storage type and a matching value accessor. 
+	All following lookups of the same name for elements of the same class and category get the parameter 
+	directly by reference. In case the reference doesn't match an element or the name of the referenced 
+	parameter differs from the requested name, the parameter is looked up by name as usual. 
+	
+	The cache is used by the :class:`Parameter` class automatically and is cleared when binding new parameters
+	or explicitly by calling ``ParameterResolutionCache.clear()``.
+	"""
+
+	_caches = dict()
+	_builtInParameters = dict()
+
+	@staticmethod
+	def resolve(element, name):
+		"""
+		Resolves a parameter of an element by name.
+
+		Args:
+			element (object): A Revit element
+			name (string): The parameter name or the name of a built-in parameter
+
+		Returns:
+			tuple: The Revit parameter or None and the cache entry or None
+		"""
+		cache = ParameterResolutionCache._getCache(element.Document)
+		category = None
+		if element.Category is not None:
+			category = element.Category.Id.IntegerValue
+		key = (element.__class__.__name__, category, name)
+		entry = cache.get(key)
+		if entry is not None:
+			try:
+				parameter = element.get_Parameter(entry.reference)
+			except:
+				parameter = None
+			if parameter is not None:
+				if not entry.byName or parameter.Definition.Name == name:
+					return parameter, entry
+		byName = True
+		parameter = element.LookupParameter(name)
+		if parameter is None:
+			byName = False
+			bip = ParameterResolutionCache.getBuiltInParameter(name)
+			if bip is not None:
+				parameter = element.get_Parameter(bip)
+		if parameter is None:
+			return None, None
+		entry = ParameterResolutionCache._createEntry(parameter)
+		entry.byName = byName
+		cache[key] = entry
+		return parameter, entry
+
+	@staticmethod
+	def getBuiltInParameter(name):
+		"""
+		Returns the built-in parameter with a given name of the ``BuiltInParameter`` enumeration.
+		Names that are not part of the enumeration are remembered as well.
+
+		Args:
+			name (string): The name of the built-in parameter, for example ``VIEW_SCALE``
+
+		Returns:
+			object: The built-in parameter or None
+		"""
+		import revitron
+		bips = ParameterResolutionCache._builtInParameters
+		if name not in bips:
+			try:
+				bips[name] = getattr(revitron.DB.BuiltInParameter, name)
+			except:
+				bips[name] = None
+		return bips[name]
+
+	@staticmethod
+	def clear(doc=None):
+		"""
+		Clears the cache of a given document.
+
+		Args:
+			doc (object, optional): A Revit document. Defaults to the active document.
+		"""
+		import revitron
+		if doc is None:
+			doc = revitron.DOC
+		ParameterResolutionCache._caches.pop(doc, None)
+
+	@staticmethod
+	def _getCache(doc):
+		"""
+		Returns the cache dictionary of a given document.
+
+		Args:
+			doc (object): A Revit document
+
+		Returns:
+			dict: The cache dictionary
+		"""
+		caches = ParameterResolutionCache._caches
+		if doc not in caches:
+			for key in list(caches.keys()):
+				if not key.IsValidObject:
+					del caches[key]
+			caches[doc] = dict()
+		return caches[doc]
+
+	@staticmethod
+	def _createEntry(parameter):
+		"""
+		Creates a cache entry for a given parameter.
+
+		Args:
+			parameter (object): A Revit parameter
+
+		Returns:
+			object: An ``AttrDict`` with the ``reference``, ``storageType`` and ``accessor`` properties
+		"""
+		import revitron
+		storageType = str(parameter.StorageType)
+		return revitron.AttrDict(
+		    reference=ParameterUtils.getReference(parameter),
+		    storageType=storageType,
+		    accessor=ParameterUtils.getValueAccessor(storageType)
+		)
+
+
+class ParameterWriter:
+	"""
+	A bulk writer for parameter values of many elements. 
+
+	Values are collected per parameter as dictionaries mapping elements or element IDs to values. 
+	When writing, all missing parameters are bound at once using :meth:`ParameterUtils.bindMany`. 
+	Values are converted to the storage type of the parameter before the first transaction is started 
+	and the writes are split into chunks, where every chunk is committed in its own transaction.
+	Values that can't be set and all values of chunks that are rolled back on commit are 
+	reported as failures::
+
+		writer = revitron.ParameterWriter(chunkSize=1000)
+		writer.add('Comments', {wall1: 'First', wall2: 'Second'})
+		writer.add('Factor', {wall1: 0.5, wall2: 1}, 'Number')
+		report = writer.write()
+		print(report.written, report.time)
+		for failure in report.failed:
+		    print(failure.id, failure.name, failure.message)
+
+	The returned report contains the number of written values, a list of failures 
+	and the timing of every chunk.
+	"""
+
+	def __init__(self, chunkSize=1000, suppressWarnings=False):
+		"""
+		Inits a new ParameterWriter instance.
+
+		Args:
+			chunkSize (integer, optional): The number of values written per transaction. Defaults to 1000.
+			suppressWarnings (bool, optional): Suppress warnings in all transactions. Defaults to False.
+		"""
+		import revitron
+		self.doc = revitron.DOC
+		self.chunkSize = chunkSize
+		self.suppressWarnings = suppressWarnings
+		self.items = []
+
+	def add(self, paramName, values, paramType=False):
+		"""
+		Adds values for a parameter. 
+		
+		In case the parameter doesn't exist for an element, it is created using the given parameter type. 
+		If no type is given, it is determined by the first value in the same way 
+		as by the :meth:`Parameter.set` method.
+
+		Args:
+			paramName (string): The parameter name
+			values (dict): A dictionary mapping elements or element IDs to values
+			paramType (string, optional): The parameter type for missing parameters. Defaults to False.
+
+		Returns:
+			object: The ParameterWriter instance
+		"""
+		import revitron
+		for item, value in values.items():
+			if isinstance(item, revitron.DB.ElementId):
+				item = self.doc.GetElement(item)
+			self.items.append((item, paramName, value, paramType))
+		return self
+
+	def _bind(self, failures):
+		"""
+		Binds all missing parameters once per category, name and binding type 
+		in a single transaction. Missing parameters that are requested as type and instance 
+		parameters at the same time are not bound at all and all their values are reported as failures.
+
+		Args:
+			failures (list): The list of failures to be extended
+
+		Returns:
+			set: The names of the parameters with conflicting binding types
+		"""
+		import revitron
+		from revitron import _
+		bindings = OrderedDict()
+		requested = dict()
+		missing = []
+		for element, name, value, paramType in self.items:
+			parameter, _entry = ParameterResolutionCache.resolve(element, name)
+			if parameter is not None:
+				continue
+			if element.Category is None:
+				failures.append(
+				    revitron.AttrDict(
+				        id=element.Id,
+				        name=name,
+				        value=value,
+				        message='Element has no category'
+				    )
+				)
+				continue
+			typeBinding = _(element).isType()
+			requested.setdefault(name, set()).add(typeBinding)
+			missing.append((element, name, value))
+			key = (element.Category.Id.IntegerValue, name, typeBinding)
+			if key not in bindings:
+				bindings[key] = (
+				    element.Category, paramType or
+				    ParameterUtils.getParameterTypeFromValue(value)
+				)
+		conflicts = set(name for name, types in requested.items() if len(types) > 1)
+		for element, name, value in missing:
+			if name in conflicts:
+				failures.append(
+				    revitron.AttrDict(
+				        id=element.Id,
+				        name=name,
+				        value=value,
+				        message='Parameter is requested as type and instance parameter'
+				    )
+				)
+		items = []
+		for key, binding in bindings.items():
+			categoryId, name, typeBinding = key
+			category, paramType = binding
+			if name not in conflicts:
+				items.append((category, name, paramType, typeBinding))
+		if items:
+			with revitron.Transaction(self.doc):
+				ParameterUtils.bindMany(items)
+		return conflicts
+
+	def _prepare(self, failures, skipNames=None):
+		"""
+		Resolves all parameters and converts the values to the storage type of their parameters.
+
+		Args:
+			failures (list): The list of failures to be extended
+			skipNames (set, optional): Names of parameters that have already failed. Defaults to None.
+
+		Returns:
+			list: A list of tuples with the element, the parameter name, the parameter and the converted value
+		"""
+		import revitron
+		writes = []
+		converters = dict()
+		skipNames = skipNames or set()
+		for element, name, value, paramType in self.items:
+			parameter, entry = ParameterResolutionCache.resolve(element, name)
+			message = None
+			if parameter is None and name in skipNames:
+				continue
+			if parameter is None:
+				if element.Category is not None:
+					message = 'Parameter not found'
+			elif parameter.IsReadOnly:
+				message = 'Parameter is read-only'
+			else:
+				storageType = entry.storageType
+				if storageType not in converters:
+					converters[storageType] = ParameterWriter._getConverter(storageType)
+				try:
+					writes.append((element, name, parameter, converters[storageType](value)))
+				except Exception as e:
+					message = 'Value can not be converted to {}: {}'.format(storageType, e)
+			if message:
+				failures.append(
+				    revitron.AttrDict(id=element.Id, name=name, value=value, message=message)
+				)
+		return writes
+
+	@staticmethod
+	def _getConverter(storageType):
+		"""
+		Returns a function that converts values to a given storage type.
+
+		Args:
+			storageType (string): The storage type name
+
+		Returns:
+			function: The converter function
+		"""
+		import revitron
+		if storageType == 'Integer':
+			return lambda value: int(value)
+		if storageType == 'Double':
+			return lambda value: float(value)
+		if storageType == 'ElementId':
+
+			def toElementId(value):
+				if isinstance(value, revitron.DB.ElementId):
+					return value
+				if isinstance(value, numbers.Integral):
+					return revitron.DB.ElementId(value)
+				return value.Id
+
+			return toElementId
+
+		def toString(value):
+			if value is None:
+				return ''
+			if isinstance(value, basestring):
+				return value
+			return str(value)
+
+		return toString
+
+	def write(self):
+		"""
+		Binds missing parameters and writes all values in chunks.
+
+		Returns:
+			object: An ``AttrDict`` with the number of ``written`` values, a list of ``failed`` writes, a list of ``chunks`` and the total ``time``
+		"""
+		import revitron
+		started = time.time()
+		failures = []
+		chunks = []
+		written = 0
+		conflicts = self._bind(failures)
+		writes = self._prepare(failures, conflicts)
+		for start in range(0, len(writes), self.chunkSize):
+			chunkStarted = time.time()
+			chunk = writes[start:start + self.chunkSize]
+			succeeded = []
+			chunkFailed = 0
+			transaction = revitron.Transaction(
+			    self.doc, suppressWarnings=self.suppressWarnings, rollbackOnError=True
+			)
+			for element, name, parameter, value in chunk:
+				message = None
+				try:
+					if not parameter.Set(value):
+						message = 'Value could not be set'
+				except Exception as e:
+					message = str(e)
+				if message:
+					chunkFailed += 1
+					failures.append(
+					    revitron.AttrDict(
+					        id=element.Id, name=name, value=value, message=message
+					    )
+					)
+				else:
+					succeeded.append((element, name, value))
+			if not transaction.commit():
+				message = revitron.FailureHandler.errorMessage
+				if not message:
+					message = 'Transaction has been rolled back'
+				for element, name, value in succeeded:
+					failures.append(
+					    revitron.AttrDict(
+					        id=element.Id, name=name, value=value, message=message
+					    )
+					)
+				chunkFailed += len(succeeded)
+				succeeded = []
+			chunkWritten = len(succeeded)
+			written += chunkWritten
+			chunks.append(
+			    revitron.AttrDict(
+			        size=chunkWritten + chunkFailed,
+			        written=chunkWritten,
+			        failed=chunkFailed,
+			        time=time.time() - chunkStarted
+			    )
+			)
+		self.items = []
+		return revitron.AttrDict(
+		    written=written,
+		    failed=failures,
+		    chunks=chunks,
+		    time=time.time() - started
+		)
+
+
+class ParameterIndex:
+	"""
+	An in-memory index of the values of a single parameter over a filtered set of elements.
+
+	The parameter values are extracted only once for all elements in the scope. 
+	Afterwards, equality, range and prefix queries are answered by dictionary lookups 
+	or by bisecting sorted lists of values instead of running a new filter for every single value.
+	The results of all queries are collections of element IDs that can be used as scope for a new filter::
+
+		index = revitron.ParameterIndex('Number', revitron.Filter().byCategory('Rooms').noTypes())
+		rooms = revitron.Filter(index.equals('101')).getElements()
+		large = index.range(minimum=10, maximum=20)
+		ground = index.startsWith('0')
+
+	Element ID values such as levels are indexed by their integer value and can be queried 
+	by passing either an ``ElementId`` or an integer.
+	The index is rebuilt automatically on the next query as soon as the :class:`revitron.document.DocumentRevision` 
+	of the document has changed. 
+	Note that changes made outside of Revitron transactions are only tracked in case 
+	the revision tracking is subscribed to the ``DocumentChanged`` event.
+	"""
+
+	def __init__(self, paramName, scope=None):
+		"""
+		Inits a new ParameterIndex instance.
+
+		Args:
+			paramName (string): The parameter name
+			scope (mixed, optional): A filter, a list of elements or a collection of element IDs. Defaults to all elements that are not types.
+		"""
+		import revitron
+		self.paramName = paramName
+		if scope is None:
+			scope = revitron.Filter().noTypes()
+		if not isinstance(scope, revitron.Filter):
+			scope = revitron.Filter(scope)
+		self.scope = scope
+		self.doc = scope.doc
+		self.revision = None
+		self.values = dict()
+		self.numbers = []
+		self.numberIds = []
+		self.strings = []
+
+	def _normalize(self, value):
+		"""
+		Converts element IDs into integers in order to make them hashable and comparable.
+
+		Args:
+			value (mixed): The value
+
+		Returns:
+			mixed: The normalized value
+		"""
+		import revitron
+		if isinstance(value, revitron.DB.ElementId):
+			return value.IntegerValue
+		return value
+
+	def _toIds(self, elementIds):
+		"""
+		Converts a list of element IDs into a ``List[ElementId]`` collection.
+
+		Args:
+			elementIds (list): The list of element IDs
+
+		Returns:
+			object: A ``List[ElementId]`` collection
+		"""
+		import revitron
+		from System.Collections.Generic import List
+		return List[revitron.DB.ElementId](elementIds)
+
+	def _build(self):
+		"""
+		Extracts the parameter values of all elements in the scope and builds the index.
+		"""
+		import revitron
+		self.revision = revitron.DocumentRevision.get(self.doc)
+		data = self.scope.getValues([self.paramName])
+		self.values = dict()
+		pairs = []
+		for elementId, value in zip(data.ids, data.columns[self.paramName]):
+			value = self._normalize(value)
+			self.values.setdefault(value, []).append(elementId)
+			if isinstance(value, numbers.Number) and not isinstance(value, bool):
+				pairs.append((value, elementId.IntegerValue, elementId))
+		pairs.sort()
+		self.numbers = [pair[0] for pair in pairs]
+		self.numberIds = [pair[2] for pair in pairs]
+		self.strings = sorted(
+		    value for value in self.values if isinstance(value, basestring)
+		)
+
+	def _ensure(self):
+		"""
+		Builds the index in case it is not built yet or the document has changed since.
+		"""
+		import revitron
+		if self.revision != revitron.DocumentRevision.get(self.doc):
+			self._build()
+
+	def invalidate(self):
+		"""
+		Forces the index to be rebuilt on the next query.
+		"""
+		self.revision = None
+
+	def equals(self, value, tolerance=None):
+		"""
+		Returns the IDs of all elements where the parameter value equals a given value.
+		
+		Numeric values are compared using a tolerance in case one is given.
+
+		Args:
+			value (mixed): The value
+			tolerance (float, optional): The tolerance for numeric values. Defaults to None.
+
+		Returns:
+			object: A ``List[ElementId]`` collection
+		"""
+		self._ensure()
+		value = self._normalize(value)
+		if tolerance and isinstance(value, numbers.Number):
+			return self.range(value - tolerance, value + tolerance)
+		return self._toIds(self.values.get(value, []))
+
+	def range(self, minimum=None, maximum=None, includeMinimum=True, includeMaximum=True):
+		"""
+		Returns the IDs of all elements with a numeric parameter value within a given range.
+		Omitted boundaries are treated as open ends.
+
+		Args:
+			minimum (number, optional): The lower boundary. Defaults to None.
+			maximum (number, optional): The upper boundary. Defaults to None.
+			includeMinimum (bool, optional): Include values equal to the lower boundary. Defaults to True.
+			includeMaximum (bool, optional): Include values equal to the upper boundary. Defaults to True.
+
+		Returns:
+			object: A ``List[ElementId]`` collection
+		"""
+		self._ensure()
+		start = 0
+		end = len(self.numbers)
+		if minimum is not None:
+			if includeMinimum:
+				start = bisect.bisect_left(self.numbers, minimum)
+			else:
+				start = bisect.bisect_right(self.numbers, minimum)
+		if maximum is not None:
+			if includeMaximum:
+				end = bisect.bisect_right(self.numbers, maximum)
+			else:
+				end = bisect.bisect_left(self.numbers, maximum)
+		return self._toIds(self.numberIds[start:max(start, end)])
+
+	def startsWith(self, prefix):
+		"""
+		Returns the IDs of all elements with a string parameter value starting with a given prefix.
+
+		Args:
+			prefix (string): The prefix
+
+		Returns:
+			object: A ``List[ElementId]`` collection
+		"""
+		self._ensure()
+		elementIds = []
+		start = bisect.bisect_left(self.strings, prefix)
+		for value in self.strings[start:]:
+			if not value.startswith(prefix):
+				break
+			elementIds += self.values[value]
+		return self._toIds(elementIds)
+
+	def getValues(self):
+		"""
+		Returns the list of distinct values of the parameter.
+
+		Returns:
+			list: The list of values
+		"""
+		self._ensure()
+		return list(self.values.keys())
+
+
+class ParameterNameList:
+	"""
+	A helper class for listing all parameter names in the active document. 
+	"""
+
+	def __init__(self):
+		"""
+		Inits a new ParameterNameList instance including all parameter names in the document.
+		"""
+		import revitron
+
+		self.parameters = []
+
+		for name in BuiltInParameterNameMap().map:
+			self.parameters.append(name)
+
+		for param in revitron.Filter().byClass(revitron.DB.SharedParameterElement
+		                                       ).getElements():
+			self.parameters.append(param.GetDefinition().Name)
+
+		for param in revitron.Filter().byClass(revitron.DB.ParameterElement
+		                                       ).getElements():
+			self.parameters.append(param.GetDefinition().Name)
+
+		self.parameters = sorted(list(set(self.parameters)))
+
+	def get(self):
+		"""
+		Returns the parameter list.
+
+		Returns:
+			list: The list with all parameters in the document.
+		"""
+		return self.parameters
+
+
+class ParameterValueProviders:
+	""" 
+	A wrapper for parameter value providers used for filtering elements.
+	"""
+
+	def __init__(self, name):
+		"""
+		Inits a new ParameterValueProviders instance by name. Such an instance consists of a list
+		of value providers matching a parameters with a name visible to the user.
+		Note that this list can have more than one value provider, since a parameter name possible matches 
+		multiple built-in parameters.
+
+		Args:
+			name (string): Name
+		"""
+		import revitron
+		self.providers = []
+		paramIds = []
+		it = revitron.DOC.ParameterBindings.ForwardIterator()
+		while it.MoveNext():
+			if it.Key.Name == name:
+				paramIds.append(it.Key.Id)
+		if not paramIds:
+			try:
+				paramIds = BuiltInParameterNameMap().get(name)
+			except:
+				pass
+		for paramId in paramIds:
+			self.providers.append(revitron.DB.ParameterValueProvider(paramId))
+
+	def get(self):
+		"""
+		Returns the list of value providers.
+
+		Returns:
+			list: The list of value providers
+		"""
+		return self.providers
+
+
+class BuiltInParameterNameMap:
+	""" 
+	A helper class for mapping lists of built-in parameter names to their representation visible to the user.
+
+	Since walking all built-in parameters and getting their labels is quite slow, 
+	the underlying index is only built once per Revit version, build and UI language and shared by all instances.
+	The index is also persisted to a cache file in the ``cache`` directory of the library 
+	in order to be loaded instantly in later sessions.
+	"""
+
+	_index = dict()
+
+	def __init__(self):
+		"""
+		Inits a new BuiltInParameterNameMap instance. The map is a dictionary where the key
+		is a parameter name that is visible to the user and the value is a list of built-in parameters 
+		represented by that name.
+		"""
+		index = BuiltInParameterNameMap._getIndex()
+		self.map = index.map
+		self.names = index.names
+		self.builtInParameters = index.builtInParameters
+
+	@staticmethod
+	def _getIndex():
+		"""
+		Returns the shared index for the running Revit version, build and UI language. 
+		The index is loaded from the cache file or built from scratch in case there is no cache file yet.
+
+		Returns:
+			object: The index as ``AttrDict`` with the ``map``, ``names`` and ``builtInParameters`` properties
+		"""
+		key = BuiltInParameterNameMap._getIndexKey()
+		if key not in BuiltInParameterNameMap._index:
+			file = BuiltInParameterNameMap._getCacheFile(key)
+			parameters = BuiltInParameterNameMap._readCache(file)
+			if not parameters:
+				parameters = BuiltInParameterNameMap._collect()
+				BuiltInParameterNameMap._writeCache(file, parameters)
+			BuiltInParameterNameMap._index[key] = BuiltInParameterNameMap._build(
+			    parameters
+			)
+		return BuiltInParameterNameMap._index[key]
+
+	@staticmethod
+	def _getIndexKey():
+		"""
+		Returns the key of the index consisting of the Revit version, the build and the UI language.
+		Since updates can add or rename built-in parameters, the build is part of the key.
+
+		Returns:
+			string: The index key
+		"""
+		import revitron
+		try:
+			language = str(revitron.APP.Language)
+		except:
+			language = 'Unknown'
+		try:
+			build = str(revitron.APP.VersionBuild)
+		except:
+			build = 'Unknown'
+		return '{}-{}-{}'.format(revitron.REVIT_VERSION, build, language)
+
+	@staticmethod
+	def _getCacheFile(key):
+		"""
+		Returns the path of the cache file for a given index key.
+
+		Args:
+			key (string): The index key
+
+		Returns:
+			string: The path of the cache file
+		"""
+		import revitron
+		return os.path.join(
+		    revitron.LIB_DIR, 'cache', 'builtInParameterNameMap-{}.json'.format(key)
+		)
 
-		parameter = match.group(1)
-
+	@staticmethod
+	def _collect():
+		"""
+		Collects the labels of all built-in parameters.
+
+		Returns:
+			dict: A dictionary where the key is the built-in parameter name and the value is a list 
+			of the integer value and the label
+		"""
+		import revitron
+		parameters = dict()
+		for item in dir(revitron.DB.BuiltInParameter):
+			try:
+				bip = getattr(revitron.DB.BuiltInParameter, item)
+				parameters[item] = [int(bip), revitron.DB.LabelUtils.GetLabelFor(bip)]
+			except:
+				pass
+		return parameters
+
+	@staticmethod
+	def _build(parameters):
+		"""
+		Builds the index based on a dictionary of collected built-in parameters.
+
+		Args:
+			parameters (dict): The dictionary of collected built-in parameters
+
+		Returns:
+			object: The index as ``AttrDict`` with the ``map``, ``names`` and ``builtInParameters`` properties
+		"""
+		import revitron
+		index = revitron.AttrDict()
+		index.map = dict()
+		index.names = dict()
+		index.builtInParameters = dict()
+		for item in sorted(parameters):
+			value, name = parameters[item]
+			if value in index.names:
+				continue
+			if name not in index.map:
+				index.map[name] = []
+				index.builtInParameters[name] = []
+			index.map[name].append(revitron.DB.ElementId(value))
+			index.builtInParameters[name].append(item)
+			index.names[value] = name
+		return index
+
+	@staticmethod
+	def _readCache(file):
+		"""
+		Reads the collected built-in parameters from a cache file.
+
+		Args:
+			file (string): The path of the cache file
+
+		Returns:
+			dict: The dictionary of collected built-in parameters or None
+		"""
 		try:
-			match = re.match('^%(.+?)%$', parameter)
-			parameter = match.group(1)
-			string = str(revitron.Element(self.projectInfo).get(parameter))
+			with open(file) as f:
+				return json.load(f)
 		except:
-			string = str(revitron.Element(self.element).get(parameter))
+			return None
 
-		if self.sanitize:
-			string = revitron.String.sanitize(string)
+	@staticmethod
+	def _writeCache(file, parameters):
+		"""
+		Writes the collected built-in parameters to a cache file.
+
+		Args:
+			file (string): The path of the cache file
+			parameters (dict): The dictionary of collected built-in parameters
+		"""
+		try:
+			if not os.path.exists(os.path.dirname(file)):
+				os.makedirs(os.path.dirname(file))
+			with open(file, 'w') as f:
+				json.dump(parameters, f)
+		except:
+			pass
 
-		return string
+	def get(self, name):
+		"""
+		Return the list of matching built-in parameters for a given name.
+
+		Args:
+			name (string): The parameter name visible to the user
+
+		Returns:
+			list: The list of built-in parameter ids
+		"""
+		return self.map[name]
+
+	def getBuiltInParameters(self, name):
+		"""
+		Return the list of matching built-in parameter enum members for a given name.
+
+		Args:
+			name (string): The parameter name visible to the user
+
+		Returns:
+			list: The list of built-in parameters
+		"""
+		import revitron
+		return [
+		    getattr(revitron.DB.BuiltInParameter, item)
+		    for item in self.builtInParameters.get(name, [])
+		]
+
+	def getName(self, bip):
+		"""
+		Return the name visible to the user for a given built-in parameter.
+
+		Args:
+			bip (mixed): A built-in parameter, its integer value or its element id
+
+		Returns:
+			string: The parameter name visible to the user or None
+		"""
+		try:
+			bip = bip.IntegerValue
+		except:
+			pass
+		return self.names.get(int(bip))
+
+
+class ParameterTemplate:
+	"""
+	Create a string based on a parameter template where parameter names are wrapped in :code:`{...}` and get substituted with their value::
+	
+		This sheet has the number {Sheet Number}
+
+	It is also possible to get parameter values from the project information instead by wrapping the parameter names 
+	in :code:`{%...%}` instead::
+
+		This sheet of the project {%Project Name%} has the number {Sheet Number}
+
+	Templates are parsed only once into a list of tokens that is shared by all instances using the same template string.
+	In order to render a template for many elements, the ``renderMany()`` method can be used. 
+	Values of the project information are then only fetched once for all elements::
+
+		names = revitron.ParameterTemplate(None, '{%Project Number%}-{Sheet Number}').renderMany(sheets)
+	"""
+
+	_pattern = re.compile(r'\{(.+?)\}')
+	_tokens = dict()
+
+	def __init__(self, element, template, sanitize=True):
+		"""
+		Inits a new ParameterTemplate instance.
+
+		Args:
+			element (object): A Revit element, can be None when only using ``renderMany()``
+			template (string): A template string
+			sanitize (bool, optional): Optionally sanitize the returned string. Defaults to True.
+		"""
+		import revitron
+
+		self.projectInfo = revitron.DOC.ProjectInformation
+		self.element = element
+		self.template = template
+		self.sanitize = sanitize
+		self.tokens = ParameterTemplate.compile(template)
+
+	@staticmethod
+	def compile(template):
+		"""
+		Parses a template string into a list of tokens. 
+		Every token is a tuple of a kind, either ``text``, ``element`` or ``project``, and a text or parameter name.
+		Parsed templates are cached.
+
+		Args:
+			template (string): A template string
+
+		Returns:
+			list: The list of tokens
+		"""
+		if template in ParameterTemplate._tokens:
+			return ParameterTemplate._tokens[template]
+		tokens = []
+		position = 0
+		for match in ParameterTemplate._pattern.finditer(template):
+			if match.start() > position:
+				tokens.append(('text', template[position:match.start()]))
+			name = match.group(1)
+			if len(name) > 2 and name.startswith('%') and name.endswith('%'):
+				tokens.append(('project', name[1:-1]))
+			else:
+				tokens.append(('element', name))
+			position = match.end()
+		if position < len(template):
+			tokens.append(('text', template[position:]))
+		ParameterTemplate._tokens[template] = tokens
+		return tokens
+
+	def reCallback(self, match):
+		"""
+		Returns the substitution for a single placeholder match.
+
+		Args:
+			match (object): The regex match object
+
+		Returns:
+			string: The processed string
+		"""
+		import revitron
+
+		parameter = match.group(1)
+		element = self.element
+		if len(parameter) > 2 and parameter.startswith('%') and parameter.endswith('%'):
+			parameter = parameter[1:-1]
+			element = self.projectInfo
+		return self._format(revitron.Parameter(element, parameter).get(), dict())
+
+	def _format(self, value, sanitized):
+		"""
+		Converts a value into a string and optionally sanitizes it. 
+		Sanitized strings are memoized in a given dictionary.
+
+		Args:
+			value (mixed): The parameter value
+			sanitized (dict): A dictionary of already sanitized strings
+
+		Returns:
+			string: The formatted string
+		"""
+		import revitron
+		string = str(value)
+		if not self.sanitize:
+			return string
+		if string not in sanitized:
+			sanitized[string] = revitron.String.sanitize(string)
+		return sanitized[string]
+
+	def _getProjectValues(self, sanitized):
+		"""
+		Fetches the values of all project information placeholders.
+
+		Args:
+			sanitized (dict): A dictionary of already sanitized strings
+
+		Returns:
+			dict: The formatted values by parameter name
+		"""
+		import revitron
+		values = dict()
+		for kind, name in self.tokens:
+			if kind == 'project' and name not in values:
+				values[name] = self._format(
+				    revitron.Parameter(self.projectInfo, name).get(), sanitized
+				)
+		return values
+
+	def _renderElement(self, element, projectValues, sanitized):
+		"""
+		Renders the template for a single element.
+
+		Args:
+			element (object): A Revit element
+			projectValues (dict): The formatted project information values
+			sanitized (dict): A dictionary of already sanitized strings
+
+		Returns:
+			string: The rendered string
+		"""
+		import revitron
+		parts = []
+		for kind, value in self.tokens:
+			if kind == 'text':
+				parts.append(value)
+			elif kind == 'project':
+				parts.append(projectValues[value])
+			else:
+				parts.append(
+				    self._format(revitron.Parameter(element, value).get(), sanitized)
+				)
+		return ''.join(parts)
 
 	def render(self):
 		"""
@@ -731,4 +1984,24 @@ class ParameterTemplate:
 		Returns:
 			string: The rendered string
 		"""
-		return re.sub('\{(.+?)\}', self.reCallback, self.template)
+		sanitized = dict()
+		return self._renderElement(
+		    self.element, self._getProjectValues(sanitized), sanitized
+		)
+
+	def renderMany(self, elements):
+		"""
+		Renders the template for a list of elements.
+
+		Args:
+			elements (list): A list of Revit elements
+
+		Returns:
+			list: The list of rendered strings
+		"""
+		sanitized = dict()
+		projectValues = self._getProjectValues(sanitized)
+		return [
+		    self._renderElement(element, projectValues, sanitized)
+		    for element in elements
+		]
@@ -9,6 +9,8 @@ class Room(Element):
 	A wrapper class for room elements.
 	"""
 
+	__slots__ = ()
+
 	def getBboxCenter(self, inRoomOnly=False):
 		"""
 		Get the center point of a room's bounding box.
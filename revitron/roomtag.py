@@ -29,10 +29,12 @@ class RoomTag:
 		if not viewId:
 			viewId = revitron.ACTIVE_VIEW.Id
 
-		for tagId in _(room).getTags():
-			tag = _(tagId).element
+		tagIds = []
+		for tag in _(room).getTags():
 			if tag.OwnerViewId.IntegerValue == viewId.IntegerValue:
-				_(tagId).delete()
+				tagIds.append(tag.Id)
+		if tagIds:
+			revitron.Delete(tagIds)
 
 		return revitron.Create.roomTag(room, location, tagTypeId, viewId)
 
@@ -15,10 +15,16 @@ A transaction group can be started using::
 
 	with revitron.TransactionGroup():
 	    ...
+
+Large numbers of items can be processed in chunks using the ``BatchRunner``::
+
+	runner = revitron.BatchRunner(elements, lambda element: ..., chunkSize=1000)
+	print(runner.processed, len(runner.failed), runner.throughput)
 	
 """
 import __main__
 import os
+import time
 from pyrevit import script
 
 
@@ -32,7 +38,8 @@ class BaseTransaction:
 		Init a basic transaction wrapper.
 		"""
 		import revitron
-		self.transaction = revitron.DB.Transaction(revitron.DOC, self._getName())
+		self.doc = revitron.DOC
+		self.transaction = revitron.DB.Transaction(self.doc, self._getName())
 
 	def __enter__(self):
 		"""
@@ -65,16 +72,25 @@ class BaseTransaction:
 	def commit(self):
 		"""
 		Commits the open transaction.
+
+		Returns:
+			boolean: True in case the transaction has been committed, False in case it has been rolled back or already ended
 		"""
+		import revitron
 		if not self.transaction.HasEnded():
-			self.transaction.Commit()
+			status = self.transaction.Commit()
+			revitron.DocumentRevision.increment(self.doc)
+			return status == revitron.DB.TransactionStatus.Committed
+		return False
 
 	def rollback(self):
 		"""
 		Rolls back the open transaction.
 		"""
+		import revitron
 		if not self.transaction.HasEnded():
 			self.transaction.RollBack()
+			revitron.DocumentRevision.increment(self.doc)
 
 
 class Transaction(BaseTransaction):
@@ -96,6 +112,7 @@ class Transaction(BaseTransaction):
 		import revitron
 		if not doc:
 			doc = revitron.DOC
+		self.doc = doc
 		if doc.IsModifiable:
 			self.transaction = revitron.DB.SubTransaction(doc)
 		else:
@@ -143,6 +160,7 @@ class TransactionGroup(BaseTransaction):
 		import revitron
 		if not doc:
 			doc = revitron.DOC
+		self.doc = doc
 		self.transaction = revitron.DB.TransactionGroup(doc, self._getName())
 		self.transaction.Start()
 
@@ -158,3 +176,198 @@ class TransactionGroup(BaseTransaction):
 		"""
 		if not self.transaction.HasEnded():
 			self.transaction.Assimilate()
+
+
+class BatchRunner:
+	"""
+	Runs a function for a large number of items in chunked transactions.
+
+	All chunks are committed in their own transaction inside of a single transaction
+	group. In case failures are isolated, every item is processed in its own
+	subtransaction so that an exception only rolls back the changes of the failing item.
+	In case a chunk is rolled back on commit because of an error, all items of that chunk
+	are processed again one by one in separate transactions. Failure messages that are
+	posted on commit are collected and assigned to the items by their failing element
+	IDs. Warnings are suppressed by default.
+
+	In case the runner is used while a transaction is already open, chunks are processed
+	in subtransactions instead. Failures are then handled when the open transaction is
+	committed and can't be collected by the runner.
+
+	The runner provides the following results:
+
+	- ``processed``: The number of successfully processed items
+	- ``failed``: A list of failed items with the ``item`` and the ``error`` message
+	- ``messages``: A list of failure messages with ``item``, ``severity`` and ``description``
+	- ``chunks``: A list of chunk reports with ``size``, ``failed`` and ``time``
+	- ``time``: The total time in seconds
+	- ``throughput``: The number of processed items per second
+	"""
+
+	def __init__(
+	    self, items, fn, chunkSize=1000, isolate=True, suppressWarnings=True, doc=None
+	):
+		"""
+		Inits a new BatchRunner instance and runs the function for all items.
+
+		Args:
+			items (list): A list of items, like for example elements or element IDs
+			fn (function): The function that is called with every item as argument
+			chunkSize (integer, optional): The number of items per transaction. Defaults to 1000.
+			isolate (bool, optional): Process every item in its own subtransaction. Defaults to True.
+			suppressWarnings (bool, optional): Suppress all warnings. Defaults to True.
+			doc (object, optional): A Revit document. Defaults to the active document.
+		"""
+		import revitron
+		if doc is None:
+			doc = revitron.DOC
+		self.doc = doc
+		self.fn = fn
+		self.isolate = isolate
+		self.suppressWarnings = suppressWarnings
+		self.processed = 0
+		self.failed = []
+		self.messages = []
+		self.chunks = []
+		started = time.time()
+		items = list(items)
+		chunkSize = max(chunkSize or len(items), 1)
+		group = None
+		if not self.doc.IsModifiable:
+			group = TransactionGroup(self.doc)
+			self.name = group._getName()
+		try:
+			for start in range(0, len(items), chunkSize):
+				chunk = items[start:start + chunkSize]
+				chunkStarted = time.time()
+				failedCount = len(self.failed)
+				if not self._commit(chunk):
+					for item in chunk:
+						self._commit([item])
+				self.chunks.append(
+				    revitron.AttrDict(
+				        size=len(chunk),
+				        failed=len(self.failed) - failedCount,
+				        time=time.time() - chunkStarted
+				    )
+				)
+		finally:
+			if group is not None:
+				group.assimilate()
+		self.time = time.time() - started
+		self.throughput = 0
+		if self.time:
+			self.throughput = self.processed / self.time
+
+	def _commit(self, chunk):
+		"""
+		Processes a chunk of items in a single transaction or a subtransaction
+		in case the document is already modifiable.
+
+		Args:
+			chunk (list): The list of items
+
+		Returns:
+			bool: False in case an isolated chunk of multiple items has been rolled back on commit
+		"""
+		import revitron
+		messages = []
+		if self.doc.IsModifiable:
+			transaction = revitron.DB.SubTransaction(self.doc)
+		else:
+			collector = revitron.FailureCollector(
+			    suppressWarnings=self.suppressWarnings, rollbackOnError=True
+			)
+			messages = collector.messages
+			transaction = revitron.DB.Transaction(self.doc, self.name)
+			options = transaction.GetFailureHandlingOptions()
+			options.SetFailuresPreprocessor(collector)
+			options.SetClearAfterRollback(True)
+			transaction.SetFailureHandlingOptions(options)
+		transaction.Start()
+		failed = []
+		for item in chunk:
+			try:
+				self._run(item)
+			except Exception as error:
+				failed.append(revitron.AttrDict(item=item, error=str(error)))
+				if not self.isolate:
+					transaction.RollBack()
+					revitron.DocumentRevision.increment(self.doc)
+					self._fail(chunk, str(error))
+					return True
+		status = transaction.Commit()
+		revitron.DocumentRevision.increment(self.doc)
+		if status != revitron.DB.TransactionStatus.Committed:
+			if self.isolate and len(chunk) > 1:
+				return False
+			errors = [
+			    message.description
+			    for message in messages if message.severity == 'Error'
+			]
+			self._fail(chunk, '; '.join(errors) or str(status))
+			return True
+		self.processed += len(chunk) - len(failed)
+		self.failed.extend(failed)
+		self._addMessages(chunk, messages)
+		return True
+
+	def _run(self, item):
+		"""
+		Calls the function for a single item. In case failures are isolated, the item
+		is processed in its own subtransaction.
+
+		Args:
+			item (mixed): The item
+		"""
+		import revitron
+		if not self.isolate:
+			self.fn(item)
+			return
+		sub = revitron.DB.SubTransaction(self.doc)
+		sub.Start()
+		try:
+			self.fn(item)
+			sub.Commit()
+		except:
+			sub.RollBack()
+			raise
+
+	def _fail(self, chunk, error):
+		"""
+		Marks all items of a chunk as failed.
+
+		Args:
+			chunk (list): The list of items
+			error (string): The error message
+		"""
+		import revitron
+		for item in chunk:
+			self.failed.append(revitron.AttrDict(item=item, error=error))
+
+	def _addMessages(self, chunk, messages):
+		"""
+		Assigns collected failure messages to the items of a chunk by their element IDs.
+
+		Args:
+			chunk (list): The list of items
+			messages (list): The list of collected failure messages
+		"""
+		import revitron
+		items = dict()
+		for item in chunk:
+			elementId = item
+			if not isinstance(elementId, revitron.DB.ElementId):
+				elementId = getattr(item, 'Id', None)
+			if isinstance(elementId, revitron.DB.ElementId):
+				items[elementId.IntegerValue] = item
+		for message in messages:
+			matches = [items[i] for i in message.elementIds if i in items] or [None]
+			for item in matches:
+				self.messages.append(
+				    revitron.AttrDict(
+				        item=item,
+				        severity=message.severity,
+				        description=message.description
+				    )
+				)
@@ -0,0 +1,26 @@
+import revitron
+import utils
+
+
+class DeleteTests(utils.RevitronTestCase):
+
+	def testDelete(self):
+		walls = [
+		    self.fixture.createWall([0, 10], [10, 10]),
+		    self.fixture.createWall([0, 20], [10, 20]),
+		    self.fixture.createWall([0, 30], [10, 30])
+		]
+		wallIds = [wall.Id for wall in walls]
+		infoId = revitron.DOC.ProjectInformation.Id
+		result = revitron.Delete(wallIds + [infoId], chunkSize=2)
+		self.assertEquals(len(result.chunks), 2)
+		self.assertEquals(utils.idsToStr(result.failed), utils.idsToStr([infoId]))
+		for wallId in wallIds:
+			self.assertTrue(wallId in list(result.deleted))
+			self.assertEquals(revitron.DOC.GetElement(wallId), None)
+		result = revitron.Delete(wallIds)
+		self.assertEquals(utils.idsToStr(result.missing), utils.idsToStr(wallIds))
+		self.assertEquals(result.deleted.Count + result.failed.Count, 0)
+
+
+utils.run(DeleteTests)
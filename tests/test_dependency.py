@@ -0,0 +1,39 @@
+import revitron
+from revitron import _
+import utils
+
+
+class DependencyTests(utils.RevitronTestCase):
+
+	def testDependencies(self):
+		wall1 = self.fixture.createWall([0, 10], [10, 10])
+		wall2 = self.fixture.createWall([0, 20], [10, 20])
+		dependencies = revitron.Dependencies([wall1, wall2.Id])
+		for wall in [wall1, wall2]:
+			self.assertEquals(
+			    utils.idsToStr(dependencies.getIds(wall)),
+			    utils.idsToStr([e.Id for e in _(wall).getDependent()])
+			)
+		self.assertEquals(
+		    revitron.Dependencies([wall1], revitron.DB.SpatialElementTag).get(wall1), []
+		)
+
+	def testDependencyGraph(self):
+		wall = self.fixture.createWall()
+		wallType = revitron.DOC.GetElement(wall.GetTypeId())
+		with revitron.Transaction():
+			unusedType = wallType.Duplicate('Unused Wall Type')
+		graph = revitron.DependencyGraph()
+		toStr = utils.idsToStr
+		TYPE = revitron.DependencyGraph.TYPE
+		self.assertEquals(toStr(graph.getReferences(wall, [TYPE])), toStr([wallType.Id]))
+		self.assertTrue(wall.Id in list(graph.getReferencing(wallType.Id, [TYPE])))
+		self.assertTrue(unusedType.Id in list(graph.getUnusedTypes()))
+		self.assertFalse(wallType.Id in list(graph.getUnusedTypes()))
+		wallId = wall.Id
+		with revitron.Transaction():
+			revitron.DOC.Delete(wallId)
+		self.assertFalse(wallId in list(graph.getReferencing(wallType.Id, [TYPE])))
+
+
+utils.run(DependencyTests)
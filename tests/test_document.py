@@ -8,6 +8,15 @@ class DocumentTests(utils.RevitronTestCase):
 	def testIsFamily(self):
 		self.assertFalse(revitron.Document().isFamily())
 
+	def testGetLinkedDocuments(self):
+		self.assertEquals(revitron.Document().getLinkedDocuments(), dict())
+		self.assertEquals(
+		    revitron.Document().getLinkedDocuments(revitron.ACTIVE_VIEW.Id), dict()
+		)
+		registry = revitron.LinkRegistry.forDocument()
+		self.assertEquals(registry.getEntries(), [])
+		self.assertEquals(registry.getEntries(revitron.ACTIVE_VIEW.Id), [])
+
 	def testConfigStorage(self):
 		config = revitron.DocumentConfigStorage()
 		config.set('test.1', {'key': 'value'})
@@ -15,6 +24,26 @@ class DocumentTests(utils.RevitronTestCase):
 		raw = revitron._(revitron.DOC.ProjectInformation).get(config.storageName)
 		self.assertEquals(raw, '{"test.1": {"key": "value"}, "test.2": "string"}')
 		self.assertEquals(config.get('test.2'), 'string')
+		revision = revitron.DocumentRevision.get()
+		with config.session():
+			config.set('test.3', [1, 2])
+			config.set('test.2', 'string')
+			self.assertEquals(revitron.DocumentRevision.get(), revision)
+		self.assertEquals(revitron.DocumentConfigStorage().get('test.3'), [1, 2])
+		revision = revitron.DocumentRevision.get()
+		config.set('test.3', [1, 2])
+		self.assertEquals(revitron.DocumentRevision.get(), revision)
+		config.get('test.3').append(3)
+		self.assertEquals(revitron.DocumentConfigStorage().get('test.3'), [1, 2])
+		try:
+			with config.session():
+				config.set('test.4', 'discarded')
+				raise ValueError()
+		except ValueError:
+			pass
+		self.assertEquals(config.get('test.4'), None)
+		config.set('test.2', 'string')
+		self.assertEquals(revitron.DocumentConfigStorage().get('test.4'), None)
 
 	def testGetDuplicateInstances(self):
 		if revitron.REVIT_VERSION > '2018':
@@ -34,6 +63,10 @@ class DocumentTests(utils.RevitronTestCase):
 			    str(instance3.Id.IntegerValue) in toStr(duplicatesOld) +
 			    toStr(duplicatesYoung)
 			)
+			warnings = revitron.WarningsIndex.forDocument()
+			self.assertEquals(len(warnings.getByElement(instance1)), 1)
+			self.assertEquals(len(warnings.getByElement(instance3)), 0)
+			self.assertTrue(warnings.count() >= 1)
 		else:
 			revitron.Log().warning(
 			    'Method revitron.Document().getDuplicateInstances() requires Revit 2018 or newer!'
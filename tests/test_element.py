@@ -29,5 +29,36 @@ class ElementTests(utils.RevitronTestCase):
 		wall = self.fixture.createWall()
 		self.assertFalse(_(wall).isType())
 
+	def testDispatch(self):
+		wall = self.fixture.createWall()
+		room = self.fixture.createRoom()
+		self.assertTrue(_(wall) is _(wall.Id))
+		self.assertTrue(_(wall.Id.IntegerValue) is _(wall))
+		self.assertEquals(type(_(wall)), revitron.Element)
+		self.assertEquals(type(_(room)), revitron.Room)
+		self.assertEquals(_(None).element, None)
+
+	def testGetFromType(self):
+		wall1 = self.fixture.createWall([0, 10], [10, 10])
+		wall2 = self.fixture.createWall([0, 20], [10, 20])
+		wallType = revitron.DOC.GetElement(wall1.GetTypeId())
+		with revitron.Transaction():
+			_(wallType).set('Type Comments', 'first')
+		revitron.TypeValueCache.enable()
+		try:
+			self.assertEquals(_(wall1).getFromType('Type Comments'), 'first')
+			values = revitron.Element.getFromTypeMany([wall1, wall2], ['Type Comments'])
+			self.assertEquals(values.columns['Type Comments'], ['first', 'first'])
+			with revitron.Transaction():
+				_(wallType).set('Type Comments', 'second')
+			self.assertEquals(_(wall2).getFromType('Type Comments'), 'second')
+			t = revitron.Transaction()
+			_(wallType).set('Type Comments', 'third')
+			self.assertEquals(_(wall1).getFromType('Type Comments'), 'third')
+			t.rollback()
+			self.assertEquals(_(wall1).getFromType('Type Comments'), 'second')
+		finally:
+			revitron.TypeValueCache.disable()
+
 
 utils.run(ElementTests)
\ No newline at end of file
@@ -93,6 +93,239 @@ class FilterTests(utils.RevitronTestCase):
 		    )
 		)
 
+	def testDeferredFilters(self):
+
+		w1 = self.fixture.createWall([0, 10], [10, 10])
+		w2 = self.fixture.createWall([0, 20], [10, 20])
+		w3 = self.fixture.createWall([0, 30], [10, 30])
+
+		with revitron.Transaction():
+			_(w1).set('test', 'an awesome test wall').set('num', 1, 'Number')
+			_(w2).set('test', 'another awesome test wall').set('num', 5, 'Number')
+			_(w3).set('test', 'and one more wall').set('num', 5, 'Number')
+
+		f = revitron.Filter
+		toStr = utils.idsToStr
+
+		fltr = f(deferred=True).byStringContains('test', 'awesome')
+		fltr = fltr.byNumberIsGreater('num', 1).byCategory('Walls').noTypes()
+		self.assertEquals(len(fltr.stages), 4)
+		self.assertEquals(toStr([w2.Id]), toStr(fltr.getElementIds()))
+
+		fltr = f(deferred=True).noTypes().byStringContains('test', 'another', True)
+		fltr = fltr.byCategory('Walls')
+		self.assertEquals(toStr([w1.Id, w3.Id]), toStr(fltr.getElementIds()))
+
+		immediate = f().byCategory('Walls').byStringEndsWith('test', 'wall').noTypes()
+		deferred = f(deferred=True).byStringEndsWith('test', 'wall').noTypes()
+		deferred = deferred.byCategory('Walls')
+		self.assertEquals(
+		    toStr(immediate.getElementIds()), toStr(deferred.getElementIds())
+		)
+
+	def testIterationAndCount(self):
+
+		w1 = self.fixture.createWall([0, 10], [10, 10])
+		w2 = self.fixture.createWall([0, 20], [10, 20])
+		w3 = self.fixture.createWall([0, 30], [10, 30])
+
+		f = revitron.Filter
+		toStr = utils.idsToStr
+		ids = toStr([w1.Id, w2.Id, w3.Id])
+
+		self.assertEquals(3, f().byCategory('Walls').noTypes().count())
+		self.assertEquals(
+		    ids, toStr(list(f().byCategory('Walls').noTypes().iterElementIds()))
+		)
+		self.assertEquals(
+		    ids,
+		    toStr([e.Id for e in f().byCategory('Walls').noTypes().iterElements()])
+		)
+		self.assertEquals(
+		    ids,
+		    toStr(
+		        [e.Id for e in f().byCategory('Walls').noTypes().iterElements(chunkSize=2)]
+		    )
+		)
+		self.assertEquals(f().count(), len(f().getElementIds()))
+
+	def testFilterCache(self):
+
+		w1 = self.fixture.createWall([0, 10], [10, 10])
+		w2 = self.fixture.createWall([0, 20], [10, 20])
+
+		f = revitron.Filter
+		toStr = utils.idsToStr
+		cache = revitron.FilterCache
+
+		cache.enable()
+		cache.clear()
+		try:
+			f().byCategory('Walls').noTypes().getElementIds()
+			ids = f().noTypes().byCategory('Walls').getElementIds()
+			self.assertEquals(toStr([w1.Id, w2.Id]), toStr(ids))
+			self.assertEquals(cache.stats().hits, 1)
+			self.assertEquals(cache.stats().misses, 1)
+
+			f().byCategory('Walls').noTypes().getElementIds(useCache=False)
+			self.assertEquals(cache.stats().hits, 1)
+
+			with revitron.Transaction():
+				_(w1).set('Comments', 'changed')
+
+			ids = f().byCategory('Walls').noTypes().getElementIds()
+			self.assertEquals(toStr([w1.Id, w2.Id]), toStr(ids))
+			self.assertEquals(cache.stats().misses, 2)
+
+			t = revitron.Transaction()
+			w3 = self.fixture.createWall([0, 30], [10, 30])
+			ids = f().byCategory('Walls').noTypes().getElementIds()
+			self.assertEquals(toStr([w1.Id, w2.Id, w3.Id]), toStr(ids))
+			t.rollback()
+
+			ids = f().byCategory('Walls').noTypes().getElementIds()
+			self.assertEquals(toStr([w1.Id, w2.Id]), toStr(ids))
+		finally:
+			cache.disable()
+
+		subscribed = revitron.DocumentRevision.subscribe()
+		try:
+			cache.enable()
+			cache.disable()
+			self.assertEquals(revitron.DocumentRevision.isSubscribed(), subscribed)
+		finally:
+			revitron.DocumentRevision.unsubscribe()
+
+	def testSetAlgebra(self):
+
+		w1 = self.fixture.createWall([0, 10], [10, 10])
+		w2 = self.fixture.createWall([0, 20], [10, 20])
+		w3 = self.fixture.createWall([0, 30], [10, 30])
+
+		with revitron.Transaction():
+			_(w1).set('Comments', 'a')
+			_(w2).set('Comments', 'b')
+			_(w3).set('Comments', 'c')
+
+		def walls():
+			return revitron.Filter().byCategory('Walls').noTypes()
+
+		toStr = utils.idsToStr
+		a = walls().byStringEquals('Comments', 'a')
+		self.assertEquals(
+		    toStr([w1.Id, w2.Id]),
+		    toStr(a.union(walls().byStringEquals('Comments', 'b')).getElementIds())
+		)
+		self.assertEquals(
+		    toStr([w2.Id]),
+		    toStr(walls().intersect([w2.Id]).getElementIds())
+		)
+		self.assertEquals(
+		    toStr([w1.Id, w3.Id]),
+		    toStr(walls().subtract([w2]).getElementIds())
+		)
+		self.assertEquals(
+		    toStr([w1.Id, w3.Id]),
+		    toStr(
+		        revitron.Filter([w1, w2]).xor([w2.Id, w3.Id]).getElementIds()
+		    )
+		)
+		scope = revitron.Filter().byCategory('Walls').noTypes().getElementIds()
+		self.assertEquals(3, revitron.Filter(scope).count())
+
+	def testSpatialFilters(self):
+
+		w1 = self.fixture.createWall([0, 10], [10, 10])
+		w2 = self.fixture.createWall([0, 20], [10, 20])
+		w3 = self.fixture.createWall([50, 50], [60, 50])
+
+		f = revitron.Filter
+		toStr = utils.idsToStr
+		p1 = revitron.DB.XYZ(-1, 5, -100)
+		p2 = revitron.DB.XYZ(11, 25, 100)
+
+		self.assertEquals(
+		    toStr([w1.Id, w2.Id]),
+		    toStr(f().byCategory('Walls').byOutline(p1, p2).noTypes().getElementIds())
+		)
+		self.assertEquals(
+		    toStr([w3.Id]),
+		    toStr(
+		        f().byCategory('Walls').byOutline(p1, p2, invert=True).noTypes().getElementIds()
+		    )
+		)
+		self.assertEquals(
+		    toStr([w1.Id]),
+		    toStr(
+		        f().byCategory('Walls').byBoundingBoxInside(_(w1).getBbox(),
+		                                                    0.1).noTypes().getElementIds()
+		    )
+		)
+		self.assertEquals(
+		    toStr([w1.Id, w2.Id, w3.Id]),
+		    toStr(
+		        f().byCategories(['Walls', 'OST_Doors']).byLevel(self.fixture.level
+		                                                         ).noTypes().getElementIds()
+		    )
+		)
+		self.assertEquals(
+		    toStr([w1.Id, w2.Id, w3.Id]),
+		    toStr(
+		        f().byCategory('Walls').byLevel(self.fixture.level.Name
+		                                        ).noTypes().getElementIds()
+		    )
+		)
+
+	def testGetValues(self):
+
+		w1 = self.fixture.createWall([0, 10], [10, 10])
+		w2 = self.fixture.createWall([0, 20], [10, 20])
+
+		with revitron.Transaction():
+			_(w1).set('Comments', 'first').set('num', 1.5, 'Number')
+			_(w2).set('Comments', 'second').set('num', 2.5, 'Number')
+
+		fltr = revitron.Filter().byCategory('Walls').noTypes()
+		values = fltr.getValues(['Comments', 'num', 'Base Constraint', 'missing'])
+		self.assertEquals(len(values.ids), 2)
+		for i, elementId in enumerate(values.ids):
+			element = revitron.DOC.GetElement(elementId)
+			self.assertEquals(values.columns['Comments'][i], _(element).get('Comments'))
+			self.assertEquals(values.columns['num'][i], _(element).get('num'))
+			self.assertEquals(
+			    values.columns['Base Constraint'][i].IntegerValue,
+			    self.fixture.level.Id.IntegerValue
+			)
+			self.assertEquals(values.columns['missing'][i], '')
+
+		values = fltr.getValues(['Base Constraint'], asType='string')
+		self.assertEquals(values.columns['Base Constraint'][0], self.fixture.level.Name)
+
+	def testExplain(self):
+
+		w1 = self.fixture.createWall([0, 10], [10, 10])
+		w2 = self.fixture.createWall([0, 20], [10, 20])
+
+		with revitron.Transaction():
+			_(w1).set('Comments', 'first')
+			_(w2).set('Comments', 'second')
+
+		fltr = revitron.Filter(deferred=True)
+		fltr = fltr.byStringEquals('Comments', 'first').byCategory('Walls').noTypes()
+		plan = fltr.explain()
+		self.assertEquals([stage.name for stage in plan.stages][-1], 'FilterStringEquals')
+		self.assertEquals(plan.stages[-1].countOut, 1)
+		self.assertEquals(plan.count, 1)
+		self.assertTrue(plan.providers >= 1)
+		self.assertEquals(
+		    utils.idsToStr(fltr.getElementIds()), utils.idsToStr([w1.Id])
+		)
+		self.assertEquals(len(fltr.explain().stages), 3)
+		self.assertTrue('FilterStringEquals' in revitron.FilterProfiler.format(plan))
+
+		empty = revitron.Filter().byCategory('Walls').byStringEquals('Comments', 'none')
+		self.assertEquals(revitron.Filter(empty).noTypes().explain().count, 0)
+
 	def testRegexFilter(self):
 		family = self.fixture.createGenericModelFamily()
 		genModel = self.fixture.createGenericModelInstance(
@@ -108,6 +341,48 @@ class FilterTests(utils.RevitronTestCase):
 		    )
 		)
 
+	def testRegexPushdown(self):
+
+		w1 = self.fixture.createWall([0, 10], [10, 10])
+		w2 = self.fixture.createWall([0, 20], [10, 20])
+		w3 = self.fixture.createWall([0, 30], [10, 30])
+
+		with revitron.Transaction():
+			_(w1).set('Comments', 'A-101')
+			_(w2).set('Comments', 'b-202')
+			_(w3).set('Comments', 'C-303')
+
+		plan = revitron.RegexPlanner.plan
+		self.assertEquals(
+		    plan('^A-|^B-'), [('FilterStringBeginsWith', 'A-'),
+		                      ('FilterStringBeginsWith', 'B-')]
+		)
+		self.assertEquals(plan('^(?:101|303)$'), [('FilterStringEquals', '101'),
+		                                           ('FilterStringEquals', '303')])
+		self.assertEquals(plan('\\-303$'), [('FilterStringEndsWith', '-303')])
+		self.assertEquals(plan('\\d+'), None)
+
+		f = revitron.Filter
+		toStr = utils.idsToStr
+		self.assertEquals(
+		    toStr([w1.Id, w2.Id]),
+		    toStr(f().byCategory('Walls').byRegex('Comments', '^A-|^B-').getElementIds())
+		)
+		self.assertEquals(
+		    toStr([w2.Id, w3.Id]),
+		    toStr(f().byCategory('Walls').byRegex('Comments', '[bc]-\\d+').getElementIds())
+		)
+		self.assertEquals(
+		    toStr([w1.Id]),
+		    toStr(
+		        f().byCategory('Walls').byRegex('Comments', '[bc]-\\d+',
+		                                        True).getElementIds()
+		    )
+		)
+		self.assertEquals(
+		    0, len(f().byCategory('Walls').byRegex('Comments', '^X\\d').getElementIds())
+		)
+
 	def testNumericFilters(self):
 		w1 = self.fixture.createWall([0, 10], [10, 10])
 		w2 = self.fixture.createWall([0, 20], [10, 20])
@@ -108,6 +108,14 @@ class ParameterTests(utils.RevitronTestCase):
 		ids = '-1010106,-1015083'
 		toStr = utils.idsToStr
 		self.assertEquals(toStr(revitron.BuiltInParameterNameMap().get('Comments')), ids)
+		self.assertTrue(
+		    revitron.BuiltInParameterNameMap().map is revitron.BuiltInParameterNameMap().map
+		)
+		self.assertEquals(
+		    revitron.BuiltInParameterNameMap().getName(
+		        revitron.DB.BuiltInParameter.ALL_MODEL_INSTANCE_COMMENTS
+		    ), 'Comments'
+		)
 
 	def testParameterTemplate(self):
 
@@ -131,6 +139,17 @@ class ParameterTests(utils.RevitronTestCase):
 		    ).render()
 		)
 
+		wall2 = _(self.fixture.createWall())
+
+		with revitron.Transaction():
+			wall2.set('param1', 'Other').set('param2', 20, 'Integer')
+
+		self.assertEquals(
+		    ['Project_Name-Test_Text-10', 'Project_Name-Other-20'],
+		    revitron.ParameterTemplate(None, '{%projectParam%}-{param1}-{param2}'
+		                               ).renderMany([wall.element, wall2.element])
+		)
+
 	def testParameterStorageTypes(self):
 
 		wall = _(self.fixture.createWall())
@@ -150,5 +169,146 @@ class ParameterTests(utils.RevitronTestCase):
 		    str(revitron.ParameterUtils.getStorageType('Number')), 'Integer'
 		)
 
+		resolver = revitron.ParameterStorageTypeResolver.forDocument()
+		self.assertEquals(resolver.resolve('param2').source, 'project')
+		self.assertEquals(resolver.resolve('Area').source, 'builtin')
+		self.assertEquals(resolver.resolve('missingParam'), None)
+
+		with revitron.Transaction():
+			wall.set('param3', 1.5, 'Number')
+
+		self.assertEquals(
+		    str(revitron.ParameterUtils.getStorageType('param3')), 'Double'
+		)
+
+	def testParameterResolutionCache(self):
+
+		wall1 = _(self.fixture.createWall())
+		wall2 = _(self.fixture.createWall())
+
+		with revitron.Transaction():
+			wall1.set('resolved', 'first').set('resolvedNumber', 1.5, 'Number')
+			wall2.set('resolved', 'second').set('resolvedNumber', 2.5, 'Number')
+
+		revitron.ParameterResolutionCache.clear()
+		self.assertEquals(wall1.get('resolved'), 'first')
+		parameter, entry = revitron.ParameterResolutionCache.resolve(
+		    wall2.element, 'resolved'
+		)
+		self.assertEquals(entry.storageType, 'String')
+		self.assertEquals(parameter.AsString(), 'second')
+		self.assertEquals(wall2.get('resolvedNumber'), 2.5)
+		self.assertEquals(wall2.get('missingParameter'), '')
+		self.assertEquals(
+		    wall2.get('WALL_ATTR_ROOM_BOUNDING'), wall1.get('WALL_ATTR_ROOM_BOUNDING')
+		)
+		self.assertEquals(
+		    revitron.ParameterResolutionCache.getBuiltInParameter('missingParameter'), None
+		)
+
+	def testParameterWriter(self):
+
+		wall1 = _(self.fixture.createWall())
+		wall2 = _(self.fixture.createWall())
+
+		writer = revitron.ParameterWriter(chunkSize=1)
+		writer.add('writerText', {wall1.element: 'first', wall2.element.Id: 2}, 'Text')
+		writer.add('writerNumber', {wall1.element: 1, wall2.element: '2.5'}, 'Number')
+		writer.add('Area', {wall1.element: 10})
+		report = writer.write()
+
+		self.assertEquals(report.written, 4)
+		self.assertEquals(len(report.chunks), 4)
+		self.assertEquals(len(report.failed), 1)
+		self.assertEquals(report.failed[0].name, 'Area')
+		self.assertEquals(wall1.get('writerText'), 'first')
+		self.assertEquals(wall2.get('writerText'), '2')
+		self.assertEquals(wall1.get('writerNumber'), 1.0)
+		self.assertEquals(wall2.get('writerNumber'), 2.5)
+
+		wallType = revitron.DOC.GetElement(wall1.element.GetTypeId())
+		writer.add('writerConflict', {wall1.element: 'instance', wallType: 'type'}, 'Text')
+		report = writer.write()
+		self.assertEquals(report.written, 0)
+		self.assertEquals(len(report.failed), 2)
+		self.assertEquals(wall1.get('writerConflict'), '')
+
+	def testBindMany(self):
+
+		items = [('Walls', 'boundText', 'Text', False),
+		         ('Doors', 'boundText', 'Text', False),
+		         ('Walls', 'boundInteger', 'Integer', False)]
+
+		with revitron.Transaction():
+			results = revitron.ParameterUtils.bindMany(items)
+
+		self.assertEquals(results, {'boundText': True, 'boundInteger': True})
+		entry = revitron.SharedParameterCatalogue.get('boundText')
+		binding = revitron.DOC.ParameterBindings[entry.definition]
+		self.assertEquals(
+		    sorted([category.Name for category in binding.Categories]), ['Doors', 'Walls']
+		)
+		self.assertTrue('boundInteger' in revitron.SharedParameterCatalogue.getNames())
+
+		with revitron.Transaction():
+			results = revitron.ParameterUtils.bindMany(items)
+
+		self.assertEquals(results, {'boundText': False, 'boundInteger': False})
+
+		with revitron.Transaction():
+			results = revitron.ParameterUtils.bindMany([
+			    ('OST_Walls', 'boundConflict', 'Text', False),
+			    ('Doors', 'boundConflict', 'Text', True),
+			    ('Walls', 'boundInteger', 'Integer', True)
+			])
+			self.assertRaises(
+			    ValueError,
+			    revitron.ParameterUtils.bindMany, [('Unknown', 'boundText', 'Text', False)]
+			)
+
+		self.assertEquals(results, {'boundConflict': False, 'boundInteger': False})
+
+	def testParameterIndex(self):
+
+		wall1 = _(self.fixture.createWall())
+		wall2 = _(self.fixture.createWall())
+		wall3 = _(self.fixture.createWall())
+
+		with revitron.Transaction():
+			wall1.set('indexText', 'A-101').set('indexNumber', 1.5, 'Number')
+			wall2.set('indexText', 'A-102').set('indexNumber', 2.5, 'Number')
+			wall3.set('indexText', 'B-101').set('indexNumber', 3.5, 'Number')
+
+		toStr = utils.idsToStr
+		scope = revitron.Filter().byCategory('Walls').noTypes()
+		textIndex = revitron.ParameterIndex('indexText', scope)
+		numberIndex = revitron.ParameterIndex('indexNumber', scope)
+
+		self.assertEquals(toStr(textIndex.equals('A-102')), toStr([wall2.element.Id]))
+		self.assertEquals(
+		    toStr(textIndex.startsWith('A-')), toStr([wall1.element.Id, wall2.element.Id])
+		)
+		self.assertEquals(
+		    toStr(numberIndex.range(2, 4)), toStr([wall2.element.Id, wall3.element.Id])
+		)
+		self.assertEquals(
+		    toStr(numberIndex.range(maximum=2.5, includeMaximum=False)),
+		    toStr([wall1.element.Id])
+		)
+		self.assertEquals(len(textIndex.equals('C-101')), 0)
+		self.assertEquals(revitron.Filter(textIndex.equals('C-101')).count(), 0)
+		self.assertEquals(
+		    toStr(revitron.Filter(textIndex.equals('B-101')).getElementIds()),
+		    toStr([wall3.element.Id])
+		)
+
+		with revitron.Transaction():
+			wall3.set('indexText', 'A-103')
+
+		self.assertEquals(
+		    toStr(textIndex.startsWith('A-')),
+		    toStr([wall1.element.Id, wall2.element.Id, wall3.element.Id])
+		)
+
 
 utils.run(ParameterTests)
\ No newline at end of file
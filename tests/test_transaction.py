@@ -0,0 +1,37 @@
+import revitron
+from revitron import _
+import utils
+
+
+class TransactionTests(utils.RevitronTestCase):
+
+	def testBatchRunner(self):
+		walls = [
+		    self.fixture.createWall([0, 10], [10, 10]),
+		    self.fixture.createWall([0, 20], [10, 20]),
+		    self.fixture.createWall([0, 30], [10, 30])
+		]
+		runner = revitron.BatchRunner(
+		    walls + ['invalid'],
+		    lambda item: _(item).set('batchText', 'batch', 'Text'),
+		    chunkSize=2
+		)
+		self.assertEquals(runner.processed, 3)
+		self.assertEquals(len(runner.chunks), 2)
+		self.assertEquals(len(runner.failed), 1)
+		self.assertEquals(runner.failed[0].item, 'invalid')
+		for wall in walls:
+			self.assertEquals(_(wall).get('batchText'), 'batch')
+
+		with revitron.Transaction():
+			runner = revitron.BatchRunner(
+			    walls + ['invalid'],
+			    lambda item: _(item).set('batchText', 'nested', 'Text'),
+			    chunkSize=2
+			)
+		self.assertEquals(runner.processed, 3)
+		self.assertEquals(len(runner.failed), 1)
+		self.assertEquals(_(walls[0]).get('batchText'), 'nested')
+
+
+utils.run(TransactionTests)